@@ -11,8 +11,7 @@ logging mechanisms, enabling comprehensive management and operations within
 the modeling environment.
 """
 
-import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 import numpy as np
@@ -98,12 +97,15 @@ class Core:
             logger=self.logger,
             database_path=self.paths['sqlite_database'],
             database_name=self.settings['sqlite_database_file'],
+            pragma_profile=self.settings['sqlite_pragma_profile'],
+            persistent_connection=self.settings['sqlite_persistent_connection'],
         )
 
         self.index = Index(
             logger=self.logger,
             files=self.files,
             paths=self.paths,
+            settings=self.settings,
         )
 
         self.database = Database(
@@ -282,6 +284,8 @@ class Core:
             force_overwrite: bool,
             maximum_iterations: Optional[int] = None,
             numerical_tolerance: Optional[float] = None,
+            max_workers: Optional[int] = None,
+            persist_each_iteration: bool = False,
             **kwargs: Any,
     ) -> None:
         """
@@ -304,6 +308,11 @@ class Core:
                 iterations for the solver. Defaults to None.
             numerical_tolerance (Optional[float], optional): The numerical 
                 tolerance for the solver. Defaults to None.
+            max_workers (Optional[int], optional): Maximum number of threads 
+                used to solve problems concurrently. Defaults to None (serial).
+            persist_each_iteration (bool, optional): If True, in case of 
+                integrated problems, endogenous data are exported to the 
+                database at each iteration. Defaults to False.
             **kwargs: Additional keyword arguments to pass to the solver.
 
         Returns:
@@ -342,20 +351,29 @@ class Core:
             self.problem.solve_problems(
                 solver=solver,
                 verbose=verbose,
+                max_workers=max_workers,
                 **kwargs
             )
         else:
-            self.solve_integrated_problems(
-                solver=solver,
-                verbose=verbose,
-                numerical_tolerance=numerical_tolerance,
-                maximum_iterations=maximum_iterations,
-                **kwargs,
-            )
+            # one database connection shared by all iterations
+            with db_handler(self.sqltools):
+                self.solve_integrated_problems(
+                    solver=solver,
+                    verbose=verbose,
+                    numerical_tolerance=numerical_tolerance,
+                    maximum_iterations=maximum_iterations,
+                    max_workers=max_workers,
+                    persist_each_iteration=persist_each_iteration,
+                    **kwargs,
+                )
 
         self.problem.fetch_problem_status()
 
-    def data_to_cvxpy_exogenous_vars(self) -> None:
+    def data_to_cvxpy_exogenous_vars(
+            self,
+            tables_names: Optional[List[str]] = None,
+            tables_data: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> None:
         """
         Fetches data from the SQLite database and assigns it to cvxpy exogenous 
         variables.
@@ -364,6 +382,16 @@ class Core:
         data from the SQLite database and assigns it to the cvxpy variable. 
         The method handles variables whose type is defined by the problem separately.
 
+        Args:
+            tables_names (Optional[List[str]], optional): If provided, only 
+                variables whose related table is in the list are updated. 
+                Defaults to None (all exogenous variables are updated).
+            tables_data (Optional[Dict[str, pd.DataFrame]], optional): Tables 
+                data already available in memory (table names as keys, 
+                dataframes with coordinates and values columns as values), 
+                used instead of fetching related tables from the database. 
+                Defaults to None.
+
         Returns:
             None
 
@@ -375,8 +403,12 @@ class Core:
         Notes:
             The method logs information about the data fetching process.
             The method uses a context manager to handle the database connection.
-            The data is fetched using the 'filtered_table_to_dataframe' method 
-                of the SQLTools instance.
+            The related table of each variable is fetched only once as typed
+                columnar arrays using the 'table_to_arrays' method of the 
+                SQLTools instance (categorical coordinates, float values). Data 
+                are then filtered in memory based on variable coordinates and 
+                grouped by inter/intra-problem sets, so that each group 
+                corresponds to one cvxpy parameter.
             The data is assigned to the cvxpy variable using the 'data_to_cvxpy_variable' 
                 method of the Problem instance.
         """
@@ -384,6 +416,12 @@ class Core:
             f"Fetching data from '{self.settings['sqlite_database_file']}' "
             "to cvxpy exogenous variables.")
 
+        filter_header = Constants.get('_FILTER_DICT_HEADER')
+        cvxpy_var_header = Constants.get('_CVXPY_VAR_HEADER')
+        values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
+        id_header = Constants.get('_STD_ID_FIELD')['id'][0]
+        allowed_values_types = Constants.get('_ALLOWED_VALUES_TYPES')
+
         with db_handler(self.sqltools):
             for var_key, variable in self.index.variables.items():
 
@@ -395,16 +433,14 @@ class Core:
                 if variable.type in ['endogenous', 'constant']:
                     continue
 
+                if tables_names is not None and \
+                        variable.related_table not in tables_names:
+                    continue
+
                 self.logger.debug(
                     f"Fetching data from table '{var_key}' "
                     "to cvxpy exogenous variable.")
 
-                filter_header = Constants.get('_FILTER_DICT_HEADER')
-                cvxpy_var_header = Constants.get('_CVXPY_VAR_HEADER')
-                values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
-                id_header = Constants.get('_STD_ID_FIELD')['id'][0]
-                allowed_values_types = Constants.get('_ALLOWED_VALUES_TYPES')
-
                 err_msg = []
 
                 if variable.data is None:
@@ -419,6 +455,65 @@ class Core:
                     self.logger.error("\n".join(err_msg))
                     raise exc.MissingDataError("\n".join(err_msg))
 
+                # get raw data from database (one query for each variable),
+                # filtered based on all variable coordinates
+                variable_coords_filter = {
+                    coord_header: variable.coordinates[category][set_key]
+                    for category, coord_info in variable.coordinates_info.items()
+                    for set_key, coord_header in coord_info.items()
+                }
+
+                if tables_data and variable.related_table in tables_data:
+                    table_data = tables_data[variable.related_table]
+                    columnar_data = False
+                else:
+                    table_data = pd.DataFrame(self.sqltools.table_to_arrays(
+                        table_name=variable.related_table))
+                    columnar_data = True
+
+                raw_data = util.filter_dataframe(
+                    df_to_filter=table_data,
+                    filter_dict=variable_coords_filter,
+                )
+
+                # check if variable data are int or float (in columnar data
+                # fetched from database, NULL and non-numeric values are NaN)
+                if columnar_data:
+                    non_numeric_ids = raw_data.loc[
+                        raw_data[values_header].isna(), id_header].tolist()
+                else:
+                    non_numeric_ids = util.find_non_allowed_types(
+                        dataframe=raw_data,
+                        allowed_types=allowed_values_types,
+                        target_col_header=values_header,
+                        return_col_header=id_header
+                        if id_header in raw_data.columns else None,
+                    )
+
+                if non_numeric_ids:
+                    msg = f"Data for variable '{var_key}' in table " \
+                        f"'{variable.related_table}' contains " \
+                        f"non-allowed values types in rows: " \
+                        f"{non_numeric_ids}."
+                    self.logger.error(msg)
+                    raise exc.MissingDataError(msg)
+
+                raw_data[values_header] = raw_data[values_header].astype(float)
+
+                # group raw data by inter/intra-problem sets: each group
+                # includes data of one cvxpy parameter
+                sets_parsing_headers = list(
+                    variable.sets_parsing_hierarchy.values())
+
+                if sets_parsing_headers:
+                    raw_data_groups = {
+                        key if isinstance(key, tuple) else (key,): group
+                        for key, group in raw_data.groupby(
+                            sets_parsing_headers, sort=False, observed=True)
+                    }
+                else:
+                    raw_data_groups = {(): raw_data}
+
                 # for variables whose type is end/exo depending on the problem,
                 # fetch exogenous variable data.
                 if isinstance(variable.type, dict):
@@ -435,34 +530,27 @@ class Core:
                         variable_data = variable.data
 
                     for row in variable_data.index:
-                        # get raw data from database
-                        raw_data = self.database.sqltools.filtered_table_to_dataframe(
-                            table_name=variable.related_table,
-                            filters_dict=variable_data[filter_header][row])
-
-                        # check if variable data are int or float
-                        non_numeric_ids = util.find_non_allowed_types(
-                            dataframe=raw_data,
-                            allowed_types=allowed_values_types,
-                            target_col_header=values_header,
-                            return_col_header=id_header,
+                        var_filter = variable_data.at[row, filter_header]
+                        group_key = tuple(
+                            var_filter[header][0]
+                            for header in sets_parsing_headers
                         )
 
-                        if non_numeric_ids:
-                            msg = f"Data for variable '{var_key}' in table " \
-                                f"'{variable.related_table}' contains " \
-                                f"non-allowed values types in rows: " \
-                                f"{non_numeric_ids}."
-                            self.logger.error(msg)
-                            raise exc.MissingDataError(msg)
+                        if group_key in raw_data_groups:
+                            group_data = raw_data_groups[group_key]
+                        else:
+                            self.logger.warning(
+                                f"Filtered table from '{variable.related_table}' "
+                                "is empty.")
+                            group_data = raw_data.iloc[0:0]
 
                         # pivoting and reshaping data to fit variables
                         pivoted_data = variable.reshaping_sqlite_table_data(
-                            data=raw_data
+                            data=group_data
                         )
 
                         self.problem.data_to_cvxpy_variable(
-                            cvxpy_var=variable_data[cvxpy_var_header][row],
+                            cvxpy_var=variable_data.at[row, cvxpy_var_header],
                             data=pivoted_data
                         )
 
@@ -495,14 +583,18 @@ class Core:
             The method uses a context manager to handle the database connection.
             The data is exported using the 'dataframe_to_table' method of the 
                 SQLTools instance.
+            Entries of the exported tables in the input data manifest (if 
+                any) are invalidated, since their data in the SQLite database
+                no longer match their input files (see 
+                'invalidate_input_data_manifest' method of Database).
         """
         self.logger.debug(
             "Exporting data from cvxpy endogenous variable (in data table) "
             f"to SQLite database '{self.settings['sqlite_database_file']}' ")
 
-        values_headers = Constants.get('_STD_VALUES_FIELD')['values'][0]
+        exported_tables = []
 
-        with db_handler(self.sqltools):
+        with db_handler(self.sqltools), self.sqltools.transaction():
             for data_table_key, data_table in self.index.data.items():
 
                 if not isinstance(data_table, DataTable):
@@ -517,25 +609,6 @@ class Core:
                     "Exporting data from cvxpy variable to the related "
                     f"data table '{data_table_key}'. ")
 
-                if isinstance(data_table.coordinates_dataframe, pd.DataFrame):
-                    data_table_dataframe = data_table.coordinates_dataframe
-
-                elif isinstance(data_table.coordinates_dataframe, dict):
-                    data_table_dataframe = pd.concat(
-                        data_table.coordinates_dataframe.values(),
-                        ignore_index=True
-                    )
-
-                if not util.add_column_to_dataframe(
-                    dataframe=data_table_dataframe,
-                    column_header=values_headers,
-                ):
-                    if self.settings['log_level'] == 'debug' or \
-                            not suppress_warnings:
-                        self.logger.warning(
-                            f"Column '{values_headers}' already exists in data "
-                            f"table '{data_table_key}'")
-
                 if data_table.cvxpy_var is None:
                     if self.settings['log_level'] == 'debug' or \
                             not suppress_warnings:
@@ -543,19 +616,8 @@ class Core:
                             f"No data available in cvxpy variable '{data_table_key}'")
                     continue
 
-                if isinstance(data_table.cvxpy_var, dict):
-
-                    cvxpy_var_values_list = []
-                    for cvxpy_var in data_table.cvxpy_var.values():
-                        cvxpy_var: cp.Variable
-                        cvxpy_var_values_list.append(cvxpy_var.value)
-
-                    cvxpy_var_data = np.vstack(cvxpy_var_values_list)
-
-                else:
-                    cvxpy_var_data = data_table.cvxpy_var.value
-
-                data_table_dataframe[values_headers] = cvxpy_var_data
+                data_table_dataframe = self.endogenous_data_table_to_dataframe(
+                    data_table_key=data_table_key)
 
                 self.sqltools.dataframe_to_table(
                     table_name=data_table_key,
@@ -563,6 +625,65 @@ class Core:
                     operation=operation,
                     suppress_warnings=suppress_warnings,
                 )
+                exported_tables.append(data_table_key)
+
+        # tables also loaded from input files (i.e. coupling tables) to be
+        # loaded again at next loading of exogenous data
+        self.database.invalidate_input_data_manifest(exported_tables)
+
+    def endogenous_data_table_to_dataframe(
+            self,
+            data_table_key: str,
+    ) -> pd.DataFrame:
+        """
+        Generates a DataFrame with coordinates of an endogenous data table and 
+        the related values of the cvxpy variable (or variables, in case of 
+        problems with sets split), without modifying the data table 
+        coordinates dataframe.
+
+        Args:
+            data_table_key (str): The key of the data table in the index.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the data table coordinates and the 
+                values column. Values are None if the cvxpy variable has not 
+                been solved yet.
+
+        Raises:
+            OperationalError: If the coordinates dataframe or the cvxpy 
+                variable are not defined for the data table.
+        """
+        values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
+        data_table: DataTable = self.index.data[data_table_key]
+
+        if data_table.coordinates_dataframe is None or \
+                data_table.cvxpy_var is None:
+            msg = "Coordinates dataframe or cvxpy variable not defined for " \
+                f"data table '{data_table_key}'."
+            self.logger.error(msg)
+            raise exc.OperationalError(msg)
+
+        if isinstance(data_table.coordinates_dataframe, dict):
+            data_table_dataframe = pd.concat(
+                data_table.coordinates_dataframe.values(),
+                ignore_index=True
+            )
+            cvxpy_vars = list(data_table.cvxpy_var.values())
+        else:
+            data_table_dataframe = data_table.coordinates_dataframe.copy()
+            cvxpy_vars = [data_table.cvxpy_var]
+
+        # columns possibly added to coordinates dataframe by previous versions
+        if values_header in data_table_dataframe.columns:
+            data_table_dataframe.drop(columns=values_header, inplace=True)
+
+        if any(cvxpy_var.value is None for cvxpy_var in cvxpy_vars):
+            data_table_dataframe[values_header] = None
+        else:
+            data_table_dataframe[values_header] = np.vstack(
+                [cvxpy_var.value for cvxpy_var in cvxpy_vars])
+
+        return data_table_dataframe
 
     def check_results_as_expected(
             self,
@@ -600,6 +721,8 @@ class Core:
             verbose: bool,
             numerical_tolerance: Optional[float] = None,
             maximum_iterations: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            persist_each_iteration: bool = False,
             **kwargs: Any,
     ) -> None:
         """
@@ -619,6 +742,16 @@ class Core:
                 for the solver. Defaults to None.
             maximum_iterations (Optional[int], optional): The maximum number of 
                 iterations for the solver. Defaults to None.
+            max_workers (Optional[int], optional): Maximum number of threads 
+                used to solve problems concurrently within each iteration. 
+                Defaults to None (serial).
+            persist_each_iteration (bool, optional): If True, endogenous data 
+                are exported to the database at the end of each iteration, 
+                i.e. to inspect intermediate iterations (database is then 
+                updated with results of the last iteration performed, also if 
+                convergence is not reached). Defaults to False, in which case 
+                endogenous data are exported only once at the end of 
+                iterations.
             **kwargs: Additional keyword arguments to pass to the solver.
 
         Returns:
@@ -630,11 +763,22 @@ class Core:
                 Problem instance.
             The data for exogenous variables is updated using the 
                 'data_to_cvxpy_exogenous_vars' method.
-            The data for endogenous variables is exported using the 
-                'cvxpy_endogenous_data_to_database' method.
             The method calculates the relative difference between the solutions 
-                in consecutive iterations using the 'get_tables_values_relative_difference' 
-                method of the SQLTools instance.
+                in consecutive iterations in memory, based on the values of 
+                endogenous cvxpy variables (the first iteration is compared 
+                with values stored in the database).
+            From the second iteration, only exogenous variables related to 
+                coupling tables (tables whose type is defined by problem) 
+                whose values changed in the previous iteration are updated, 
+                directly from values of the related endogenous variables.
+            The data for endogenous variables is exported to the database
+                only once at the end of iterations (or at each iteration if 
+                'persist_each_iteration' is True), using the 
+                'cvxpy_endogenous_data_to_database' method.
+            From the second iteration, problems are solved with 'warm_start' 
+                enabled, so that supporting solvers can reuse the previous 
+                iteration solution. Warm start can be disabled by passing 
+                'warm_start=False' as solver keyword argument.
         """
         if maximum_iterations is None:
             maximum_iterations = Constants.get(
@@ -644,11 +788,7 @@ class Core:
             numerical_tolerance = Constants.get(
                 '_TOLERANCE_MODEL_COUPLING_CONVERGENCE')
 
-        sqlite_db_path = self.paths['model_dir']
-        sqlite_db_file_name = self.settings['sqlite_database_file']
-
-        base_name, extension = os.path.splitext(sqlite_db_file_name)
-        sqlite_db_file_name_previous = f"{base_name}_previous_iter{extension}"
+        values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
 
         iter_count = 0
 
@@ -657,71 +797,120 @@ class Core:
             if self.index.data[table_key].type not in ['exogenous', 'constant']
         ]
 
+        coupling_tables = [
+            table_key for table_key in tables_to_check
+            if isinstance(self.index.data[table_key].type, dict)
+        ]
+        tables_to_update = coupling_tables
+
+        warm_start = kwargs.pop('warm_start', True)
+
+        # values of the previous iteration, initialized with values stored in
+        # the database (aligned to data tables coordinates)
+        previous_values = {}
+
+        with db_handler(self.sqltools):
+            for table_key in tables_to_check:
+                coordinates_df = self.endogenous_data_table_to_dataframe(
+                    data_table_key=table_key).drop(columns=values_header)
+                database_df = self.sqltools.table_to_dataframe(table_key)
+
+                previous_values[table_key] = coordinates_df.merge(
+                    database_df[[*coordinates_df.columns, values_header]],
+                    on=list(coordinates_df.columns),
+                    how='left',
+                )[values_header].to_numpy(dtype=float)
+
         while True:
 
-            try:
-                iter_count += 1
-                if iter_count > maximum_iterations:
-                    self.logger.warning(
-                        f"Maximum number of iterations reached before reaching "
-                        "convergence to numerical_tolerance.")
-                    break
-
-                self.logger.info(f"=====================")
-                self.logger.info(f"Iteration number '{iter_count}'")
-
-                if iter_count > 1:
-                    self.data_to_cvxpy_exogenous_vars()
-
-                self.files.copy_file_to_destination(
-                    path_destination=sqlite_db_path,
-                    path_source=sqlite_db_path,
-                    file_name=sqlite_db_file_name,
-                    file_new_name=sqlite_db_file_name_previous,
-                    force_overwrite=True,
+            iter_count += 1
+            if iter_count > maximum_iterations:
+                self.logger.warning(
+                    f"Maximum number of iterations reached before reaching "
+                    "convergence to numerical_tolerance.")
+                break
+
+            self.logger.info(f"=====================")
+            self.logger.info(f"Iteration number '{iter_count}'")
+
+            if iter_count > 1 and tables_to_update:
+                self.data_to_cvxpy_exogenous_vars(
+                    tables_names=tables_to_update,
+                    tables_data={
+                        table_key: current_data[table_key]
+                        for table_key in tables_to_update
+                    },
                 )
 
-                self.problem.solve_problems(
-                    solver=solver,
-                    verbose=verbose,
-                    **kwargs
-                )
+            self.problem.solve_problems(
+                solver=solver,
+                verbose=verbose,
+                max_workers=max_workers,
+                warm_start=warm_start and iter_count > 1,
+                **kwargs
+            )
+
+            current_data = {
+                table_key: self.endogenous_data_table_to_dataframe(
+                    data_table_key=table_key)
+                for table_key in tables_to_check
+            }
 
+            if persist_each_iteration:
                 self.cvxpy_endogenous_data_to_database(
                     operation='update',
                     suppress_warnings=True,
                 )
 
-                with db_handler(self.sqltools):
-                    relative_difference = \
-                        self.sqltools.get_tables_values_relative_difference(
-                            other_db_dir_path=sqlite_db_path,
-                            other_db_name=sqlite_db_file_name_previous,
-                            tables_names=tables_to_check,
-                        )
+            relative_difference = {}
 
-                relative_difference_above = {
-                    table: value
-                    for table, value in relative_difference.items()
-                    if value > numerical_tolerance
-                }
+            for table_key, table_data in current_data.items():
+                current_values = table_data[values_header].to_numpy(
+                    dtype=float)
 
-                if relative_difference_above:
-                    self.logger.info(
-                        "Data tables with highest relative difference above "
-                        f"treshold ({numerical_tolerance}):"
-                    )
-                    for table, value in relative_difference_above.items():
-                        self.logger.info(
-                            f"Data table '{table}': {round(value, 5)}")
+                differences = util.calculate_arrays_difference(
+                    array_1=current_values,
+                    array_2=previous_values[table_key],
+                    modules_difference=True,
+                    ignore_nan=True,
+                )
+
+                # tables with no comparable values are considered as changed
+                if np.isnan(differences).all():
+                    relative_difference[table_key] = float('inf')
                 else:
-                    self.logger.info("Numerical convergence reached.")
-                    break
-
-            finally:
-                self.files.erase_file(
-                    dir_path=sqlite_db_path,
-                    file_name=sqlite_db_file_name_previous,
-                    force_erase=True,
-                    confirm=False,
+                    relative_difference[table_key] = float(
+                        np.nanmax(differences))
+
+                previous_values[table_key] = current_values
+
+            relative_difference_above = {
+                table: value
+                for table, value in relative_difference.items()
+                if value > numerical_tolerance
+            }
+
+            tables_to_update = [
+                table for table in coupling_tables
+                if relative_difference.get(table) != 0
+            ]
+
+            if relative_difference_above:
+                self.logger.info(
+                    "Data tables with highest relative difference above "
+                    f"treshold ({numerical_tolerance}):"
                 )
+                for table, value in relative_difference_above.items():
+                    self.logger.info(
+                        f"Data table '{table}': {round(value, 5)}")
+            else:
+                self.logger.info("Numerical convergence reached.")
+                break
+
+        # results are stored in the database only once at the end of iterations
+        # (unless already stored at each iteration)
+        if not persist_each_iteration:
+            self.cvxpy_endogenous_data_to_database(
+                operation='update',
+                suppress_warnings=True,
+            )
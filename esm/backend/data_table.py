@@ -15,12 +15,15 @@ mathematical models and data analysis within the application.
 """
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import itertools as it
 import cvxpy as cp
+import numpy as np
 import pandas as pd
 
 from esm.log_exc import exceptions as exc
 from esm.log_exc.logger import Logger
 from esm.support import util
+from esm.support.coordinates_grid import CoordinatesGrid
 
 
 class DataTable:
@@ -46,12 +49,20 @@ class DataTable:
         cvxpy_var (Optional[cp.Variable | cp.Parameter | cp.Constant]): CVXPY 
             variable associated with the data table for optimization modeling.
         variables_list (List[str]): List of variables derived from variables_info.
+        coordinates_index (Dict[Any, Dict[Tuple[str], int]]): Hash index mapping
+            coordinates tuples to row positions of each coordinates dataframe
+            (key None if coordinates dataframe is not split in sub-problems).
+        coordinates_dtypes (Dict[str, pd.CategoricalDtype]): Dictionary mapping
+            coordinates headers to the categorical dtypes of related sets 
+            (shared among data tables), used for coordinates dataframes.
 
     Methods:
         table_length: Property that returns the number of rows in the 
             coordinates dataframe.
         generate_coordinates_dataframe: Generates a dataframe from coordinates 
             values.
+        get_coordinates_positions: Returns row positions of coordinates 
+            matching a filter dictionary.
     """
 
     def __init__(
@@ -80,6 +91,8 @@ class DataTable:
         self.foreign_keys: Dict[str, Any] = {}
         self.cvxpy_var: Optional[
             pd.DataFrame[Any, cp.Variable] | cp.Variable] = None
+        self.coordinates_index: Dict[Any, Dict[Tuple[str], int]] = {}
+        self.coordinates_dtypes: Dict[str, pd.CategoricalDtype] = {}
 
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -87,7 +100,9 @@ class DataTable:
         self.variables_list: List[str] = list(self.variables_info.keys())
 
     def __repr__(self) -> str:
-        avoid_representation = ('logger', 'data', 'coordinates_dataframe')
+        avoid_representation = (
+            'logger', 'data', 'coordinates_dataframe', 'coordinates_index',
+            'coordinates_dtypes')
         output = ''
         for key, value in self.__dict__.items():
             if key in avoid_representation:
@@ -96,7 +111,9 @@ class DataTable:
         return output
 
     def __iter__(self) -> Iterator[Tuple[Any, Any]]:
-        avoid_iteration = ('logger', 'data', 'coordinates_dataframe')
+        avoid_iteration = (
+            'logger', 'data', 'coordinates_dataframe', 'coordinates_index',
+            'coordinates_dtypes')
         for key, value in self.__dict__.items():
             if key in avoid_iteration:
                 continue
@@ -128,12 +145,17 @@ class DataTable:
         Generates data structure for data tables. 
         This method requires both 'self.coordinates' and 'self.coordinates_values' 
         be predefined. If 'sets_split_problems' is provided, it filters the 
-        coordinates values based on the keys in 'sets_split_problems', unpivots 
-        the filtered dictionary to a DataFrame, and then merges each row of the 
-        filtered DataFrame with the original coordinates DataFrame.
-        The result is a dictionary of DataFrames, each corresponding to a key 
-        in 'sets_split_problems'. If `sets_split_problems` is not provided, it 
-        simply assigns the unpivoted coordinates DataFrame to `self.coordinates_dataframe`.
+        coordinates values based on the keys in 'sets_split_problems', and 
+        partitions the coordinates DataFrame in one pass based on the position 
+        of each row among the combinations of split coordinates (positions are 
+        computed from the coordinates grid codes, with no merges).
+        The result is a dictionary of DataFrames, each corresponding to a 
+        combination of split coordinates (split coordinates columns first). 
+        If `sets_split_problems` is not provided, it simply assigns the 
+        unpivoted coordinates DataFrame to `self.coordinates_dataframe`.
+        Coordinates columns are categorical, based on the sets dtypes defined
+        in 'coordinates_dtypes' (if any), so that filters and joins among 
+        coordinates dataframes operate on integer codes.
 
         Parameters:
             sets_split_problems (dict, optional): A dictionary of keys to filter 
@@ -155,9 +177,11 @@ class DataTable:
             self.logger.error(msg)
             raise TypeError(msg)
 
-        coordinates_df = util.unpivot_dict_to_dataframe(
-            self.coordinates_values
-        )
+        self.coordinates_index = {}
+
+        coordinates_grid = CoordinatesGrid(self.coordinates_values)
+        coordinates_df = coordinates_grid.to_dataframe(
+            dtypes=self.coordinates_dtypes)
 
         if not sets_split_problems:
             self.coordinates_dataframe = coordinates_df
@@ -168,21 +192,92 @@ class DataTable:
                 for key, value in self.coordinates_values.items()
                 if key in sets_split_problems.values()
             }
-            coords_split_problems_df = util.unpivot_dict_to_dataframe(
-                coords_split_problems
+            split_grid = CoordinatesGrid(coords_split_problems)
+
+            # position of each coordinates row among split combinations
+            grid_codes = coordinates_grid.codes()
+            split_positions = split_grid.positions({
+                key: grid_codes[key] for key in coords_split_problems
+            })
+
+            rows_order = np.argsort(split_positions, kind='stable')
+            bounds = np.searchsorted(
+                split_positions[rows_order],
+                np.arange(split_grid.size + 1),
             )
 
-            coordinates_dataframe_dict = {}
+            columns_order = [
+                *coords_split_problems,
+                *[
+                    col for col in coordinates_df.columns
+                    if col not in coords_split_problems
+                ]
+            ]
+            coordinates_df = coordinates_df[columns_order]
+
+            self.coordinates_dataframe = {
+                split_key: coordinates_df.take(
+                    rows_order[bounds[split_key]:bounds[split_key + 1]]
+                ).reset_index(drop=True)
+                for split_key in range(split_grid.size)
+            }
+
+    def get_coordinates_positions(
+            self,
+            filter_dict: Dict[str, List[str]],
+            sub_problem_key: Optional[int] = None,
+    ) -> Optional[List[int]]:
+        """
+        Returns the row positions of the coordinates dataframe matching the 
+        filter dictionary, ordered as the cartesian product of the filter 
+        values (same ordering of 'util.filter_dataframe' with rows reordered 
+        based on filter). Positions are fetched from a hash index of 
+        coordinates tuples, built once for each coordinates dataframe.
+
+        Args:
+            filter_dict (Dict[str, List[str]]): Dictionary with coordinates 
+                headers as keys and lists of coordinates items as values.
+            sub_problem_key (Optional[int]): Key of the coordinates dataframe 
+                in case of coordinates split in sub-problems. Defaults to None.
+
+        Returns:
+            Optional[List[int]]: List of row positions matching the filter. 
+                None if filter keys do not correspond to all coordinates 
+                dataframe headers (positions cannot be fetched by index).
+
+        Raises:
+            MissingDataError: If the coordinates dataframe is not defined.
+        """
+        if self.coordinates_dataframe is None:
+            msg = f"Coordinates not defined for data table '{self.name}'."
+            self.logger.error(msg)
+            raise exc.MissingDataError(msg)
+
+        if isinstance(self.coordinates_dataframe, dict):
+            coordinates_df = self.coordinates_dataframe[sub_problem_key]
+        else:
+            coordinates_df = self.coordinates_dataframe
+            sub_problem_key = None
+
+        columns = list(coordinates_df.columns)
+        filter_keys = list(filter_dict.keys())
+
+        if len(filter_keys) != len(columns) or set(filter_keys) != set(columns):
+            return None
+
+        if sub_problem_key not in self.coordinates_index:
+            self.coordinates_index[sub_problem_key] = dict(zip(
+                coordinates_df.itertuples(index=False, name=None),
+                coordinates_df.index
+            ))
 
-            for set_split_problem in coords_split_problems_df.index:
-                coords_filter: pd.Series = \
-                    coords_split_problems_df.loc[set_split_problem]
-                coords_filter_df = coords_filter.to_frame().T
+        index = self.coordinates_index[sub_problem_key]
+        keys_order = [filter_keys.index(column) for column in columns]
 
-                coordinates_dataframe_dict[set_split_problem] = pd.merge(
-                    left=coords_filter_df,
-                    right=coordinates_df,
-                    on=coords_filter_df.columns.tolist(),
-                )
+        positions = []
+        for items in it.product(*filter_dict.values()):
+            position = index.get(tuple(items[i] for i in keys_order))
+            if position is not None:
+                positions.append(position)
 
-            self.coordinates_dataframe = coordinates_dataframe_dict
+        return positions
@@ -13,8 +13,13 @@ loading data from Excel files, generating data input files, and managing the
 SQLite database interactions via the SQLManager.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple)
+
+import pandas as pd
 
 from esm.backend.data_table import DataTable
 from esm.backend.index import Index
@@ -23,6 +28,7 @@ from esm.log_exc import exceptions as exc
 from esm.log_exc.logger import Logger
 from esm.constants import Constants
 from esm.support import util
+from esm.support.coordinates_grid import CoordinatesGrid
 from esm.support.file_manager import FileManager
 from esm.support.sql_manager import SQLManager, db_handler
 
@@ -80,6 +86,11 @@ class Database:
         Returns:
             None
 
+        Raises:
+            SettingsError: If the input data format is not allowed, or if the 
+                maximum number of workers reading input files is not a 
+                positive integer.
+
         Notes:
             The logger is initialized with a child logger using the name of the 
                 current module.
@@ -95,6 +106,22 @@ class Database:
         self.settings = settings
         self.paths = paths
 
+        input_data_formats = Constants.get('_INPUT_DATA_FORMATS')
+        if self.settings['input_data_format'] not in input_data_formats:
+            msg = "Input data format " \
+                f"'{self.settings['input_data_format']}' not allowed. " \
+                f"Allowed formats: {list(input_data_formats.keys())}."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg)
+
+        max_workers = self.settings['input_files_max_workers']
+        if max_workers is not None and \
+                (not isinstance(max_workers, int) or max_workers < 1):
+            msg = "Maximum number of workers reading input files must be a " \
+                f"positive integer or None. Passed: '{max_workers}'."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg)
+
         if not self.settings['use_existing_data']:
             self.create_blank_sets_xlsx_file()
 
@@ -192,6 +219,8 @@ class Database:
         self.logger.debug(
             f"Generating database '{self.settings['sqlite_database_file']}'.")
 
+        self.erase_input_data_manifest()
+
         with db_handler(self.sqltools):
             for set_instance in self.index.sets.values():
                 assert isinstance(set_instance, SetTable), \
@@ -239,7 +268,7 @@ class Database:
         self.logger.debug(
             f"Loading Sets to '{self.settings['sqlite_database_file']}'.")
 
-        with db_handler(self.sqltools):
+        with db_handler(self.sqltools), self.sqltools.transaction():
             for set_instance in self.index.sets.values():
                 assert isinstance(set_instance, SetTable), \
                     f"Expected SetTable type, got {type(set_instance)} instead."
@@ -273,6 +302,10 @@ class Database:
         type is not 'constant', it creates a new table in the SQLite database 
         for the data table. The table's headers and foreign keys are determined 
         based on the 'table_headers' and 'foreign_keys' attributes of the data table.
+        A composite index is created on the coordinates columns of each table, 
+        based on the 'sqlite_coordinates_index' setting: if True, all 
+        coordinates are indexed; if a list of coordinates (sets keys), only 
+        the listed coordinates are indexed; if False, no index is created.
 
         Returns:
             None
@@ -286,6 +319,9 @@ class Database:
             "Generation of empty data tables in "
             f"'{self.settings['sqlite_database_file']}'.")
 
+        indexed_coordinates = self.settings.get(
+            'sqlite_coordinates_index', True)
+
         with db_handler(self.sqltools):
             for table_key, table in self.index.data.items():
                 table: DataTable
@@ -299,15 +335,32 @@ class Database:
                     foreign_keys=table.foreign_keys,
                 )
 
+                if not indexed_coordinates:
+                    continue
+
+                index_columns = [
+                    table.coordinates_headers[coordinate]
+                    for coordinate in table.coordinates
+                    if indexed_coordinates is True
+                    or coordinate in indexed_coordinates
+                ]
+
+                if index_columns:
+                    self.sqltools.create_index(
+                        table_name=table_key,
+                        columns=index_columns,
+                        index_name=f"{table_key}_coordinates_index",
+                    )
+
     def sets_data_to_sql_data_tables(self) -> None:
         """
         Transforms and loads sets data into SQLite tables, preparing them for 
         variable storage.
         This method iterates over each data table in the index. If the table's 
-        type is not 'constant', it unpivots the table's coordinates values into 
-        a DataFrame, adds an ID column to the DataFrame, and loads the DataFrame 
-        into the corresponding table in the SQLite database. It then adds a 
-        standard values field to the table.
+        type is not 'constant', the cartesian product of the table's 
+        coordinates values (CoordinatesGrid) is streamed in chunks into the 
+        corresponding table in the SQLite database, without materializing it
+        in one DataFrame. It then adds a standard values field to the table.
         Excludes constant types to separate configuration from variable data.
 
         Returns:
@@ -315,15 +368,20 @@ class Database:
 
         Notes:
             The method logs information about the loading process for each table.
-            The unpivoting process transforms the coordinates values from a 
-                dictionary format into a DataFrame format.
+            Rows of the coordinates grid are generated by chunks (see 
+                'iter_chunks' method of CoordinatesGrid) and inserted with 
+                'execute_many_in_chunks' method of SQLManager, so that peak 
+                memory is bounded by the chunk size.
             The standard values field is added to store the values of the variables.
+            Once all tables are filled, database statistics are updated 
+                (SQLite 'ANALYZE') so that coordinates indexes are used by 
+                the query planner.
         """
         self.logger.debug(
             "Adding sets information to sqlite data tables in "
             f"'{self.settings['sqlite_database_file']}'.")
 
-        with db_handler(self.sqltools):
+        with db_handler(self.sqltools), self.sqltools.transaction():
             for table_key, table in self.index.data.items():
 
                 if table.type == 'constant':
@@ -333,23 +391,25 @@ class Database:
                     value for value in table.coordinates_headers.values()
                 ]
 
-                unpivoted_coords_df = util.unpivot_dict_to_dataframe(
-                    data_dict=table.coordinates_values,
-                    key_order=table_headers_list
-                )
+                coordinates_grid = CoordinatesGrid({
+                    header: table.coordinates_values[header]
+                    for header in table_headers_list
+                })
 
-                util.add_column_to_dataframe(
-                    dataframe=unpivoted_coords_df,
-                    column_header=table.table_headers['id'][0],
-                    column_position=0,
-                    column_values=None
-                )
+                # rows ids are assigned by SQLite (id as integer primary key)
+                columns = ', '.join(f'"{col}"' for col in table_headers_list)
+                placeholders = ', '.join(['?'] * len(table_headers_list))
 
-                self.sqltools.dataframe_to_table(
-                    table_name=table_key,
-                    dataframe=unpivoted_coords_df,
+                entries_added = self.sqltools.execute_many_in_chunks(
+                    query=f"INSERT INTO {table_key} ({columns}) "
+                    f"VALUES ({placeholders})",
+                    params=iter(coordinates_grid),
                 )
 
+                self.logger.debug(
+                    f"SQLite table '{table_key}' - {entries_added} "
+                    "coordinates entries added.")
+
                 self.sqltools.add_table_column(
                     table_name=table_key,
                     column_name=Constants.get('_STD_VALUES_FIELD')[
@@ -358,6 +418,9 @@ class Database:
                         'values'][1],
                 )
 
+            # update statistics used by the query planner for indexes
+            self.sqltools.analyze()
+
     def clear_database_tables(
         self,
         table_names: Optional[List[str] | str] = None,
@@ -405,6 +468,7 @@ class Database:
     def generate_blank_data_input_files(
         self,
         file_extension: str = data_file_extension,
+        force_overwrite: bool = False,
     ) -> None:
         """
         Generates blank data input files for exogenous data tables.
@@ -414,10 +478,16 @@ class Database:
         'multiple_input_files' setting and the table's key. If 'multiple_input_files' 
         is True, a separate file is created for each table. Otherwise, all tables 
         are exported to a single file as separate tabs.
+        If the 'input_data_format' setting is 'parquet', each table is exported
+        to a separate Parquet file named as the table (regardless of the 
+        'multiple_input_files' setting and of the passed file extension).
 
         Parameters:
             file_extension (str, optional): The file extension to use for the 
                 generated files. Defaults to the 'data_file_extension' class attribute.
+            force_overwrite (bool, optional): If True, existing Parquet files 
+                are overwritten without prompt (Excel sheets of exported 
+                tables are always replaced). Defaults to False.
 
         Returns:
             None
@@ -427,27 +497,54 @@ class Database:
             If the input data directory does not exist, the method creates it.
             Endogenous and constant tables are skipped as they do not require 
                 input files.
+            All tables exported to the same Excel file are written in a 
+                single writing session (see 'tables_to_excel' method of 
+                SQLManager).
         """
         self.logger.debug("Generation of data input file/s.")
 
         if not Path(self.paths['input_data_dir']).exists():
             self.files.create_dir(self.paths['input_data_dir'])
 
-        with db_handler(self.sqltools):
-            for table_key, table in self.index.data.items():
+        if self.settings['input_data_format'] == 'parquet':
+            self.files.check_parquet_engine()
+            parquet_extension = Constants.get('_INPUT_DATA_FORMATS')['parquet']
 
-                if table.type in ['endogenous', 'constant']:
-                    continue
+            with db_handler(self.sqltools):
+                for table_key, table in self.index.data.items():
 
-                if self.settings['multiple_input_files']:
-                    output_file_name = table_key + file_extension
-                else:
-                    output_file_name = self.settings['input_data_file']
+                    if table.type in ['endogenous', 'constant']:
+                        continue
+
+                    self.files.dataframe_to_parquet(
+                        dataframe=self.sqltools.table_to_dataframe(table_key),
+                        parquet_file_name=table_key + parquet_extension,
+                        parquet_file_dir_path=self.paths['input_data_dir'],
+                        force_overwrite=force_overwrite,
+                    )
+            return
+
+        # tables grouped by output file, so that each file is written once
+        output_files: Dict[str, List[str]] = {}
 
-                self.sqltools.table_to_excel(
+        for table_key, table in self.index.data.items():
+
+            if table.type in ['endogenous', 'constant']:
+                continue
+
+            if self.settings['multiple_input_files']:
+                output_file_name = table_key + file_extension
+            else:
+                output_file_name = self.settings['input_data_file']
+
+            output_files.setdefault(output_file_name, []).append(table_key)
+
+        with db_handler(self.sqltools):
+            for output_file_name, tables_keys in output_files.items():
+                self.sqltools.tables_to_excel(
                     excel_filename=output_file_name,
                     excel_dir_path=self.paths['input_data_dir'],
-                    table_name=table_key,
+                    tables_names=tables_keys,
                 )
 
     def load_data_input_files_to_database(
@@ -455,7 +552,7 @@ class Database:
         operation: str,
         file_extension: str = data_file_extension,
         force_overwrite: bool = False,
-    ) -> None:
+    ) -> List[str]:
         """
         Loads data from user-filled input files into the SQLite database.
         This method checks the 'multiple_input_files' setting to determine whether 
@@ -465,6 +562,18 @@ class Database:
         updates the data in the SQLite database. If 'multiple_input_files' is False, 
         the method loads data from a single Excel file and inserts or updates the 
         data for each table in the SQLite database.
+        If the 'input_data_format' setting is 'parquet', data of each exogenous 
+        table are read from a separate Parquet file named as the table: columns 
+        are read with their stored types and passed directly to the SQLite 
+        bulk insert (no Excel parsing and empty cells conversion).
+        In case of one input file for each table, files are read through 
+        'read_data_input_files' (concurrently if 'input_files_max_workers' 
+        setting is defined), while data are written to the SQLite database 
+        by the calling thread only, within a single transaction.
+        If the 'input_data_manifest' setting is True, input files whose content
+        is unchanged with respect to the previous loading are not read, and 
+        tables whose data are unchanged are not written to the database (see
+        'load_input_data_manifest').
 
         Parameters:
             operation (str): The SQL operation to be performed with the data 
@@ -475,51 +584,320 @@ class Database:
                 existing data. Defaults to False.
 
         Returns:
-            None
+            List[str]: Keys of the tables whose data have been written to the 
+                SQLite database.
 
         Notes:
             The method logs information about the loading process.
             The method uses a context manager to handle the database connection.
+            The manifest is updated only after data are successfully committed
+                to the database. Tables not written (i.e. if erasing existing
+                table entries is not confirmed) and their input files are not 
+                recorded in the manifest, so that they are loaded again at the 
+                next call.
         """
         self.logger.debug(
             "Loading data from input file/s filled by the user "
             "to SQLite database.")
 
-        if self.settings['multiple_input_files']:
-            data = {}
+        use_manifest = self.settings['input_data_manifest']
+        manifest = self.load_input_data_manifest() if use_manifest else {}
+        files_manifest = manifest.get('files', {})
+        tables_manifest = manifest.get('tables', {})
+        new_files_manifest = {}
 
-            with db_handler(self.sqltools):
-                for table_key, table in self.index.data.items():
+        def source_changed(file_name: str) -> bool:
+            if not use_manifest:
+                return True
 
-                    if table.type not in ['endogenous', 'constant']:
-                        file_name = table_key + file_extension
+            fingerprint = self.files.file_fingerprint(
+                file_name=file_name,
+                file_dir_path=self.paths['input_data_dir'],
+                previous=files_manifest.get(file_name),
+            )
+            new_files_manifest[file_name] = fingerprint
+            previous = files_manifest.get(file_name, {})
 
-                        data.update(
-                            self.files.excel_to_dataframes_dict(
-                                excel_file_dir_path=self.paths['input_data_dir'],
-                                excel_file_name=file_name,
-                            )
-                        )
-                        self.sqltools.dataframe_to_table(
-                            table_name=table_key,
-                            dataframe=data[table_key],
-                            operation=operation,
-                        )
+            return previous.get('sha256') != fingerprint['sha256']
+
+        exogenous_tables_keys = [
+            table_key for table_key, table in self.index.data.items()
+            if table.type not in ['endogenous', 'constant']
+        ]
+
+        if self.settings['input_data_format'] == 'parquet' or \
+                self.settings['multiple_input_files']:
+
+            if self.settings['input_data_format'] == 'parquet':
+                self.files.check_parquet_engine()
+                file_extension = Constants.get('_INPUT_DATA_FORMATS')['parquet']
+                force_operation = force_overwrite
+
+                def read_file(table_key: str) -> pd.DataFrame:
+                    return self.files.parquet_to_dataframe(
+                        parquet_file_name=table_key + file_extension,
+                        parquet_file_dir_path=self.paths['input_data_dir'],
+                        force_overwrite=force_overwrite,
+                    )
+
+            else:
+                force_operation = False
+
+                def read_file(table_key: str) -> pd.DataFrame:
+                    return self.files.excel_to_dataframes_dict(
+                        excel_file_dir_path=self.paths['input_data_dir'],
+                        excel_file_name=table_key + file_extension,
+                    )[table_key]
+
+            tables_files = {
+                table_key: table_key + file_extension
+                for table_key in exogenous_tables_keys
+            }
+
+            dataframes = self.read_data_input_files(
+                tables_keys=[
+                    table_key for table_key in exogenous_tables_keys
+                    if source_changed(table_key + file_extension)
+                ],
+                read_file=read_file,
+            )
 
         else:
-            data = self.files.excel_to_dataframes_dict(
-                excel_file_dir_path=self.paths['input_data_dir'],
-                excel_file_name=self.settings['input_data_file'],
+            force_operation = force_overwrite
+            tables_files = dict.fromkeys(
+                exogenous_tables_keys, self.settings['input_data_file'])
+
+            if source_changed(self.settings['input_data_file']):
+                dataframes = self.files.excel_to_dataframes_dict(
+                    excel_file_dir_path=self.paths['input_data_dir'],
+                    excel_file_name=self.settings['input_data_file'],
+                ).items()
+            else:
+                dataframes = []
+
+        updated_tables = []
+        not_written_tables = []
+        new_tables_manifest = dict(tables_manifest)
+
+        with db_handler(self.sqltools), self.sqltools.transaction():
+            for table_key, dataframe in dataframes:
+
+                if use_manifest:
+                    data_hash = util.dataframe_hash(dataframe)
+                    if tables_manifest.get(table_key) == data_hash:
+                        continue
+
+                written_entries = self.sqltools.dataframe_to_table(
+                    table_name=table_key,
+                    dataframe=dataframe,
+                    operation=operation,
+                    force_operation=force_operation,
+                )
+
+                # table not written (erasing existing entries not confirmed)
+                if written_entries is None:
+                    not_written_tables.append(table_key)
+                    continue
+
+                if use_manifest:
+                    new_tables_manifest[table_key] = data_hash
+                updated_tables.append(table_key)
+
+        if use_manifest:
+            self.logger.debug(
+                f"Input data tables updated: {updated_tables or 'none'}.")
+
+            # input files of tables not written are read again at next call
+            files_fingerprints = {**files_manifest, **new_files_manifest}
+            for table_key in not_written_tables:
+                files_fingerprints.pop(tables_files[table_key], None)
+
+            self.save_input_data_manifest({
+                'files': files_fingerprints,
+                'tables': new_tables_manifest,
+            })
+
+        return updated_tables
+
+    def load_input_data_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads the manifest of input data, stored alongside the SQLite database,
+        and recording the state of input data at the last loading: 
+        fingerprints (size, modification time, content hash) of input files 
+        under 'files' key, and hashes of data of each table under 'tables' 
+        key.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The manifest. Empty if the manifest file
+                does not exist or cannot be decoded (all input data are then 
+                considered as changed).
+        """
+        manifest_path = Path(self.paths['input_data_manifest'])
+
+        if not manifest_path.exists():
+            return {}
+
+        try:
+            manifest = self.files.load_file(
+                file_name=manifest_path.name,
+                dir_path=manifest_path.parent,
+                file_type='json',
             )
+        except ValueError:
+            self.logger.warning(
+                f"Input data manifest '{manifest_path.name}' cannot be "
+                "decoded. All input data will be loaded.")
+            return {}
 
-            with db_handler(self.sqltools):
-                for table_key, table in data.items():
-                    self.sqltools.dataframe_to_table(
-                        table_name=table_key,
-                        dataframe=table,
-                        operation=operation,
-                        force_operation=force_overwrite,
-                    )
+        return manifest if isinstance(manifest, dict) else {}
+
+    def save_input_data_manifest(
+            self,
+            manifest: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Saves the manifest of input data alongside the SQLite database.
+
+        Args:
+            manifest (Dict[str, Dict[str, Any]]): The manifest to be saved.
+        """
+        manifest_path = Path(self.paths['input_data_manifest'])
+
+        self.files.dict_to_json_file(
+            data=manifest,
+            file_name=manifest_path.name,
+            dir_path=manifest_path.parent,
+        )
+
+    def erase_input_data_manifest(self) -> None:
+        """
+        Erases the manifest of input data (if any), so that all input data 
+        are loaded at next loading. To be called when the SQLite database is 
+        generated again.
+        """
+        manifest_path = Path(self.paths['input_data_manifest'])
+
+        if manifest_path.exists():
+            self.files.erase_file(
+                dir_path=manifest_path.parent,
+                file_name=manifest_path.name,
+                force_erase=True,
+            )
+
+    def invalidate_input_data_manifest(
+            self,
+            tables_keys: Iterable[str],
+    ) -> None:
+        """
+        Removes from the manifest of input data (if any) the entries of the
+        passed tables and the fingerprints of their input files, so that data
+        of such tables are loaded again at next loading. To be called when
+        data of tables recorded in the manifest are overwritten by other
+        sources (i.e. when exporting model results to the SQLite database).
+
+        Parameters:
+            tables_keys (Iterable[str]): Keys of the tables to be invalidated.
+
+        Notes:
+            Input files are identified by their name (without extension)
+                matching the table key, or as the single input data file.
+                Tables sharing the same input file and not invalidated are
+                not written again, since their data hashes are unchanged.
+        """
+        if not self.settings['input_data_manifest']:
+            return
+
+        manifest = self.load_input_data_manifest()
+        tables_manifest = manifest.get('tables', {})
+        tables_keys = [
+            table_key for table_key in tables_keys
+            if table_key in tables_manifest
+        ]
+
+        if not tables_keys:
+            return
+
+        for table_key in tables_keys:
+            tables_manifest.pop(table_key)
+
+        files_manifest = {
+            file_name: fingerprint
+            for file_name, fingerprint in manifest.get('files', {}).items()
+            if Path(file_name).stem not in tables_keys
+            and file_name != self.settings['input_data_file']
+        }
+
+        self.logger.debug(
+            f"Input data manifest entries invalidated: {tables_keys}.")
+
+        self.save_input_data_manifest({
+            'files': files_manifest,
+            'tables': tables_manifest,
+        })
+
+    def read_data_input_files(
+        self,
+        tables_keys: Iterable[str],
+        read_file: Callable[[str], pd.DataFrame],
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Reads the input data files of a list of tables, yielding data in the 
+        same order of tables keys. If the 'input_files_max_workers' setting is 
+        None, files are read serially while data are consumed. Otherwise, files
+        are parsed concurrently by a pool of threads, so that parsing of next 
+        files overlaps with the consumption of data of previous ones (i.e. 
+        writing to the SQLite database).
+
+        Parameters:
+            tables_keys (Iterable[str]): Keys of the tables whose input data 
+                files have to be read.
+            read_file (Callable[[str], pd.DataFrame]): Function reading the 
+                input data file of a table, given the table key.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: The table key and related data.
+
+        Notes:
+            The number of files parsed ahead of consumption is limited to twice
+                the number of workers, to bound memory usage.
+            Exceptions raised while reading a file are propagated when data of
+                the related table are consumed, and the pending readings are
+                cancelled.
+            The SQLite connection is never accessed by worker threads.
+        """
+        max_workers = self.settings['input_files_max_workers']
+
+        if max_workers is None:
+            for table_key in tables_keys:
+                yield table_key, read_file(table_key)
+            return
+
+        self.logger.debug(
+            "Reading input data files concurrently "
+            f"(maximum workers: {max_workers}).")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            tables_keys_iter = iter(tables_keys)
+
+            try:
+                for table_key in tables_keys_iter:
+                    pending.append(
+                        (table_key, executor.submit(read_file, table_key)))
+
+                    if len(pending) < 2 * max_workers:
+                        continue
+
+                    table_key, future = pending.popleft()
+                    yield table_key, future.result()
+
+                while pending:
+                    table_key, future = pending.popleft()
+                    yield table_key, future.result()
+
+            finally:
+                for _, future in pending:
+                    future.cancel()
 
     def empty_data_completion(
         self,
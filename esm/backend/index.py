@@ -13,7 +13,7 @@ objects from configured sources and provides properties to access metadata and
 operational characteristics related to these entities.
 """
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
 import pandas as pd
 
@@ -37,7 +37,13 @@ class Index:
         logger (Logger): Logger instance for logging activity within the class.
         files (FileManager): FileManager instance for file operations.
         paths (Dict[str, Path]): Dictionary mapping of paths used in file operations.
+        settings (Dict[str, Any]): Dictionary of model settings.
+        restored_from_snapshot (bool): True if the Index state (sets data and 
+            variables coordinates included) has been restored from the Index 
+            snapshot at initialization.
         sets (Dict[str, SetTable]): Dictionary of set tables loaded upon initialization.
+        sets_dtypes (Dict[str, pd.CategoricalDtype]): Categorical dtypes of 
+            sets items (one for each set), shared by coordinates dataframes.
         data (Dict[str, DataTable]): Dictionary of data tables loaded upon initialization.
         variables (Dict[str, Variable]): Dictionary of variables fetched upon initialization.
 
@@ -45,6 +51,7 @@ class Index:
         logger (Logger): Logger instance from the parent or main handler.
         files (FileManager): FileManager instance for handling file operations.
         paths (Dict[str, Path]): Dictionary containing necessary path configurations.
+        settings (Dict[str, Any]): Dictionary of model settings.
     """
 
     def __init__(
@@ -52,21 +59,37 @@ class Index:
             logger: Logger,
             files: FileManager,
             paths: Dict[str, Path],
+            settings: Dict[str, Any],
     ) -> None:
         """
         Initializes the Index object, loads sets, data tables, and variables.
+        If the 'index_snapshot' and 'use_existing_data' settings are True and
+        a valid Index snapshot exists, the whole Index state is restored from 
+        the snapshot instead (see 'load_snapshot').
         """
         self.logger = logger.get_child(__name__)
         self.logger.debug("Object initialization...")
 
         self.files = files
         self.paths = paths
+        self.settings = settings
 
-        self.sets: Dict[str, SetTable] = self.load_sets_tables()
-        self.data: Dict[str, DataTable] = self.load_data_tables()
-        self.variables: Dict[str, Variable] = self.fetch_variables()
+        self.sets: Dict[str, SetTable]
+        self.sets_dtypes: Dict[str, pd.CategoricalDtype] = {}
+        self.data: Dict[str, DataTable]
+        self.variables: Dict[str, Variable]
 
-        self.fetch_vars_coordinates_info()
+        self.restored_from_snapshot = False
+        if self.settings['index_snapshot'] and \
+                self.settings['use_existing_data']:
+            self.restored_from_snapshot = self.load_snapshot()
+
+        if not self.restored_from_snapshot:
+            self.sets = self.load_sets_tables()
+            self.data = self.load_data_tables()
+            self.variables = self.fetch_variables()
+
+            self.fetch_vars_coordinates_info()
 
         self.logger.debug("Object initialized.")
 
@@ -479,6 +502,22 @@ class Index:
                 self.logger.error(msg)
                 raise exc.SettingsError(msg)
 
+    def load_sets_dtypes_to_index(self) -> None:
+        """
+        Defines a categorical dtype for each set with data, whose categories
+        are the set items. Dtypes are stored in 'sets_dtypes' and shared by 
+        all coordinates dataframes, so that coordinates are stored as integer 
+        codes and filtered/joined without comparing strings.
+        """
+        self.logger.debug("Loading sets categorical dtypes to Index.")
+
+        self.sets_dtypes = {
+            set_key: pd.CategoricalDtype(
+                categories=pd.Index(set_instance.set_items).unique())
+            for set_key, set_instance in self.sets.items()
+            if set_instance.data is not None
+        }
+
     def load_coordinates_to_data_index(self) -> None:
         """
         Populates the 'coordinates_values' dictionary of each data table in the 
@@ -489,6 +528,8 @@ class Index:
         context-specific data, such as data processing or analysis tasks.
         Ensures that each data table's coordinates are updated with actual items 
         from the sets as specified in the table's coordinate headers.
+        Sets categorical dtypes (if defined) are mapped to the related 
+        coordinates headers in 'coordinates_dtypes' of each data table.
         """
         self.logger.debug("Loading variable coordinates to Index.data.")
 
@@ -496,6 +537,10 @@ class Index:
             for set_key, set_header in table.coordinates_headers.items():
                 if set_key in self.sets:
                     table.coordinates_values[set_header] = self.sets[set_key].set_items
+
+                    if set_key in self.sets_dtypes:
+                        table.coordinates_dtypes[set_header] = \
+                            self.sets_dtypes[set_key]
                 else:
                     msg = f"Set key '{set_key}' not found in sets while " \
                         "loading coordinates"
@@ -698,3 +743,136 @@ class Index:
 
                         variable.related_dims_map = set_items_agg_map_filtered
                         break
+
+    def snapshot_sources_fingerprints(
+            self,
+            previous: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the fingerprints of the source files of the Index state, i.e.
+        model setup files and sets Excel file.
+
+        Args:
+            previous (Optional[Dict[str, Dict[str, Any]]], optional): Previous
+                fingerprints of source files, used to avoid hashing again files
+                with unchanged size and modification time. Defaults to None.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Fingerprints of source files (see 
+                'file_fingerprint' method of FileManager), with files names 
+                as keys.
+
+        Raises:
+            FileNotFoundError: If any of the source files does not exist.
+        """
+        if previous is None:
+            previous = {}
+
+        sets_file_path = Path(self.paths['sets_excel_file'])
+        sources = {
+            file_name: self.paths['model_dir']
+            for file_name in Constants.get('_SETUP_FILES').values()
+        }
+        sources[sets_file_path.name] = sets_file_path.parent
+
+        return {
+            file_name: self.files.file_fingerprint(
+                file_name=file_name,
+                file_dir_path=dir_path,
+                previous=previous.get(file_name),
+            )
+            for file_name, dir_path in sources.items()
+        }
+
+    def save_snapshot(self) -> None:
+        """
+        Saves a binary snapshot of the Index state (sets with their data, sets
+        dtypes, data tables and variables with their coordinates) to the model
+        directory, together with the fingerprints of its source files and the
+        settings affecting it. To be called once sets data and coordinates are 
+        loaded to the Index (and before problems are initialized).
+        """
+        snapshot_path = Path(self.paths['index_snapshot'])
+
+        self.logger.debug(f"Saving Index snapshot '{snapshot_path.name}'.")
+
+        snapshot = {
+            'version': Constants.get('_INDEX_SNAPSHOT_VERSION'),
+            'foreign_keys': self.settings['sqlite_database_foreign_keys'],
+            'sources': self.snapshot_sources_fingerprints(),
+            'state': {
+                'sets': self.sets,
+                'sets_dtypes': self.sets_dtypes,
+                'data': self.data,
+                'variables': self.variables,
+            },
+        }
+
+        self.files.object_to_pickle_file(
+            obj=snapshot,
+            file_name=snapshot_path.name,
+            dir_path=snapshot_path.parent,
+        )
+
+    def load_snapshot(self) -> bool:
+        """
+        Restores the Index state from the Index snapshot, if it exists and it
+        is still valid, i.e. if it has been generated with the same snapshot 
+        format and settings, and if the content of source files (setup files 
+        and sets Excel file) is unchanged.
+
+        Returns:
+            bool: True if the Index state has been restored, False otherwise 
+                (the Index must then be generated from source files).
+
+        Notes:
+            A snapshot that cannot be read (i.e. generated by a different 
+                version of the package) is discarded as an outdated one.
+        """
+        snapshot_path = Path(self.paths['index_snapshot'])
+
+        if not snapshot_path.exists():
+            self.logger.debug("Index snapshot not found.")
+            return False
+
+        try:
+            snapshot = self.files.pickle_file_to_object(
+                file_name=snapshot_path.name,
+                dir_path=snapshot_path.parent,
+            )
+        except Exception:
+            self.logger.warning(
+                f"Index snapshot '{snapshot_path.name}' cannot be read. "
+                "Index generated from setup files.")
+            return False
+
+        if not isinstance(snapshot, dict) or \
+                snapshot.get('version') != \
+                Constants.get('_INDEX_SNAPSHOT_VERSION') or \
+                snapshot.get('foreign_keys') != \
+                self.settings['sqlite_database_foreign_keys']:
+            self.logger.debug("Index snapshot outdated.")
+            return False
+
+        try:
+            sources = self.snapshot_sources_fingerprints(
+                previous=snapshot['sources'])
+        except FileNotFoundError:
+            return False
+
+        if any(
+            fingerprint['sha256'] !=
+            snapshot['sources'].get(file_name, {}).get('sha256')
+            for file_name, fingerprint in sources.items()
+        ):
+            self.logger.debug("Index snapshot outdated.")
+            return False
+
+        state = snapshot['state']
+        self.sets = state['sets']
+        self.sets_dtypes = state['sets_dtypes']
+        self.data = state['data']
+        self.variables = state['variables']
+
+        self.logger.debug(f"Index restored from snapshot '{snapshot_path.name}'.")
+        return True
@@ -25,7 +25,7 @@ based on user-defined settings.
 """
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from esm.constants import Constants
 from esm.log_exc import exceptions as exc
@@ -33,6 +33,7 @@ from esm.log_exc.logger import Logger
 from esm.support.dotdict import DotDict
 from esm.support.file_manager import FileManager
 from esm.support.pbi_manager import PBIManager
+from esm.support.sql_manager import db_handler
 from esm.backend.core import Core
 
 
@@ -78,12 +79,51 @@ class Model:
             Defaults to 'input_data'.
         input_data_file (str, optional): Name of the Excel file used for 
             input data. Defaults to 'input_data.xlsx'.
+        input_data_format (str, optional): Format of input data files, either
+            'excel' or 'parquet' (one Parquet file for each exogenous data 
+            table, requires the optional 'pyarrow' package). Defaults to 
+            'excel'.
+        input_files_max_workers (int, optional): Maximum number of threads 
+            reading input data files concurrently, in case of one input file 
+            for each data table (multiple input files or Parquet format), 
+            while data are written to the SQLite database by a single writer.
+            Defaults to None (files read serially).
+        input_data_manifest (bool, optional): If True, a manifest of input 
+            files fingerprints and of tables data hashes is stored alongside
+            the SQLite database, so that unchanged input files are not read 
+            again, unchanged tables are not written again, and only variables 
+            related to changed tables are refreshed when updating database and
+            problems. Defaults to False.
         sqlite_database_file (str, optional): Name of the SQLite database file. 
             Defaults to 'database.db'.
         sqlite_database_foreign_keys (bool, optional): Whether to enforce 
             foreign key constraints in SQLite. Defaults to True.
+        sqlite_coordinates_index (bool | List[str], optional): Whether to 
+            create composite indexes on coordinates columns of SQLite data 
+            tables. If a list of coordinates (sets keys) is passed, only the
+            listed coordinates are indexed. Defaults to True.
+        sqlite_pragma_profile (str, optional): Profile of SQLite pragmas 
+            applied to database connections. 'performance' profile enables 
+            WAL journal mode (persistent in the database file), reduced 
+            synchronization, larger page cache, memory mapped I/O and 
+            in-memory temporary storage. Defaults to 'default' (SQLite 
+            default pragmas).
+        sqlite_persistent_connection (bool, optional): If True, the SQLite 
+            database connection is opened once and reused by all database 
+            operations, instead of being closed at the end of each of them. 
+            Defaults to False.
         powerbi_report_file (str, optional): Name of the Power BI report file. 
             Defaults to 'dataset.pbix'.
+        index_snapshot (bool, optional): If True, a binary snapshot of the 
+            Index state is saved in the model directory once sets data and 
+            variables coordinates are loaded. With 'use_existing_data', the 
+            Index is then restored from the snapshot, unless setup files or 
+            sets Excel file have changed. Defaults to False.
+        stacked_expressions (bool, optional): If True, element-wise 
+            expressions defined over an intra-problem set are generated once 
+            over variables stacked for all set values, instead of once for 
+            each set value (fewer cvxpy atoms and constraints). Other 
+            expressions are generated for each set value. Defaults to False.
 
     Raises:
         ValueError: If any critical configurations are invalid or not found.
@@ -101,10 +141,18 @@ class Model:
             sets_xlsx_file: str = 'sets.xlsx',
             input_data_dir: str = 'input_data',
             input_data_file: str = 'input_data.xlsx',
+            input_data_format: str = 'excel',
+            input_files_max_workers: Optional[int] = None,
+            input_data_manifest: bool = False,
             sqlite_database_file: str = 'database.db',
             sqlite_database_file_test: str = 'database_expected.db',
             sqlite_database_foreign_keys: bool = True,
             powerbi_report_file: str = 'dataset.pbix',
+            stacked_expressions: bool = False,
+            sqlite_coordinates_index: bool | List[str] = True,
+            sqlite_pragma_profile: str = 'default',
+            sqlite_persistent_connection: bool = False,
+            index_snapshot: bool = False,
     ) -> None:
 
         self.logger = Logger(
@@ -127,10 +175,18 @@ class Model:
             'sets_xlsx_file': sets_xlsx_file,
             'input_data_dir': input_data_dir,
             'input_data_file': input_data_file,
+            'input_data_format': input_data_format,
+            'input_files_max_workers': input_files_max_workers,
+            'input_data_manifest': input_data_manifest,
             'sqlite_database_file': sqlite_database_file,
             'sqlite_database_file_test': sqlite_database_file_test,
             'sqlite_database_foreign_keys': sqlite_database_foreign_keys,
             'powerbi_report_file': powerbi_report_file,
+            'stacked_expressions': stacked_expressions,
+            'sqlite_coordinates_index': sqlite_coordinates_index,
+            'sqlite_pragma_profile': sqlite_pragma_profile,
+            'sqlite_persistent_connection': sqlite_persistent_connection,
+            'index_snapshot': index_snapshot,
         })
 
         model_dir_path = Path(main_dir_path) / model_dir_name
@@ -139,6 +195,10 @@ class Model:
             'input_data_dir': model_dir_path / input_data_dir,
             'sets_excel_file': model_dir_path / sets_xlsx_file,
             'sqlite_database': model_dir_path / sqlite_database_file,
+            'input_data_manifest': model_dir_path / Constants.get(
+                '_INPUT_DATA_MANIFEST_FILE'),
+            'index_snapshot': model_dir_path / Constants.get(
+                '_INDEX_SNAPSHOT_FILE'),
             'pbi_report': model_dir_path / powerbi_report_file,
         })
 
@@ -152,7 +212,12 @@ class Model:
         )
 
         if self.settings['use_existing_data']:
-            self.load_model_coordinates()
+            if self.core.index.restored_from_snapshot:
+                self.logger.info(
+                    "Sets data and variable coordinates restored from Index "
+                    "snapshot.")
+            else:
+                self.load_model_coordinates()
             self.initialize_problems()
 
         self.pbi_tools = PBIManager(
@@ -194,6 +259,8 @@ class Model:
         Otherwise, it loads new sets data and variable coordinates to 
         Model.Index.
         Based on Model settings, SQLite tables foreign keys can be enabled.
+        If the 'index_snapshot' setting is True, the resulting Index state is 
+        saved to the Index snapshot.
 
         Raises:
             FileNotFoundError: If the sets_xlsx_file specified in the 
@@ -220,6 +287,7 @@ class Model:
             self.logger.error(msg)
             raise exc.SettingsError(msg) from e
 
+        self.core.index.load_sets_dtypes_to_index()
         self.core.index.load_coordinates_to_data_index()
         self.core.index.load_all_coordinates_to_variables_index()
         self.core.index.filter_coordinates_in_variables_index()
@@ -228,6 +296,9 @@ class Model:
         if self.settings['sqlite_database_foreign_keys']:
             self.core.index.fetch_foreign_keys_to_data_tables()
 
+        if self.settings['index_snapshot']:
+            self.core.index.save_snapshot()
+
     def initialize_blank_data_structure(self) -> None:
         """
         Initializes the blank data structure for the model: create blank 
@@ -250,6 +321,9 @@ class Model:
         if Path(self.paths['sqlite_database']).exists():
             self.logger.info(f"Database '{sqlite_db_name}' already exists.")
 
+            if self.core.sqltools.connection is not None:
+                self.core.sqltools.close_connection()
+
             erased = self.files.erase_file(
                 dir_path=self.paths['model_dir'],
                 file_name=sqlite_db_name,
@@ -281,7 +355,7 @@ class Model:
             self,
             operation: str = 'update',
             force_overwrite: bool = False,
-    ) -> None:
+    ) -> List[str]:
         """
         Loads input (exogenous) data to the SQLite database. 
 
@@ -290,10 +364,15 @@ class Model:
                 database. Defaults to 'update'.
             force_overwrite (bool, optional): Whether to force overwrite 
                 existing data. Defaults to False.
+
+        Returns:
+            List[str]: Keys of the data tables updated in the SQLite database
+                (only tables with changed data if 'input_data_manifest' 
+                setting is True).
         """
         self.logger.info('Loading input data to SQLite database.')
 
-        self.core.database.load_data_input_files_to_database(
+        updated_tables = self.core.database.load_data_input_files_to_database(
             operation=operation,
             force_overwrite=force_overwrite,
         )
@@ -301,6 +380,8 @@ class Model:
         # TO BE COMPLETED (automatically filling blank data)
         # self.core.database.empty_data_completion(operation)
 
+        return updated_tables
+
     def initialize_problems(
             self,
             force_overwrite: bool = False,
@@ -333,6 +414,8 @@ class Model:
         solver: Optional[str] = None,
         numerical_tolerance: Optional[float] = None,
         maximum_iterations: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        persist_each_iteration: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -353,6 +436,14 @@ class Model:
                 the solver. Defaults to None.
             maximum_iterations (int, optional): The maximum number of iterations 
                 for solving integrated problems. Defaults to None.
+            max_workers (int, optional): The maximum number of threads used to 
+                solve independent problems and sub-problems concurrently. 
+                Defaults to None, in which case problems are solved serially.
+            persist_each_iteration (bool, optional): If True, in case of 
+                integrated problems, endogenous data are exported to the SQLite 
+                database at the end of each iteration (i.e. for debugging). 
+                Defaults to False, in which case data are exported once 
+                iterations are completed.
             **kwargs: Additional keyword arguments to be passed to the solver.
 
         Raises:
@@ -387,6 +478,12 @@ class Model:
             self.logger.error(msg)
             raise exc.SettingsError(msg)
 
+        if max_workers is not None and \
+                (not isinstance(max_workers, int) or max_workers < 1):
+            msg = "Maximum number of workers must be a positive integer."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg)
+
         if not integrated_problems:
             if n_problems == 1:
                 self.logger.info(
@@ -408,6 +505,8 @@ class Model:
             integrated_problems=integrated_problems,
             numerical_tolerance=numerical_tolerance,
             maximum_iterations=maximum_iterations,
+            max_workers=max_workers,
+            persist_each_iteration=persist_each_iteration,
             **kwargs,
         )
 
@@ -439,18 +538,28 @@ class Model:
             self,
             operation: str = 'update',
             force_overwrite: bool = False,
+            rebuild_problems: bool = False,
     ) -> None:
         """
         Updates the SQLite database and initializes problems. To be used in 
         case some changes in exogenous data have made, so that the SQLite 
         database and the problems can be updated without re-generating the
         Model instance.
+        If numerical problems are already defined and they can be updated by 
+        only reloading exogenous data (see 'numerical_problems_refreshable' 
+        property of Problem), new data are loaded into the existing cvxpy 
+        parameters. In this way, numerical problems are not generated again
+        and cvxpy can reuse the cached problems canonicalization. Only 
+        variables related to updated data tables are refreshed (all exogenous
+        tables, unless 'input_data_manifest' setting is True).
 
         Args:
             operation (str, optional): The operation to perform on the 
                 database. Defaults to 'update'.
             force_overwrite (bool, optional): Whether to force overwrite 
                 existing data. Used for testing purpose. Defaults to False.
+            rebuild_problems (bool, optional): If True, numerical problems are
+                always generated again from scratch. Defaults to False.
 
         Returns:
             None
@@ -459,8 +568,26 @@ class Model:
             f"Updating SQLite database '{self.settings['sqlite_database_file']}' "
             "and initialize problems.")
 
-        self.load_exogenous_data_to_sqlite_database(operation, force_overwrite)
-        self.initialize_problems(force_overwrite)
+        # one database connection shared by loading and reading operations
+        with db_handler(self.core.sqltools):
+            updated_tables = self.load_exogenous_data_to_sqlite_database(
+                operation, force_overwrite)
+
+            if not rebuild_problems and \
+                    self.core.problem.numerical_problems_refreshable:
+
+                if not updated_tables:
+                    self.logger.info(
+                        "Exogenous data unchanged: numerical problems not "
+                        "updated.")
+                    return
+
+                self.logger.info(
+                    "Reloading exogenous data to existing numerical problems.")
+                self.core.data_to_cvxpy_exogenous_vars(
+                    tables_names=updated_tables)
+            else:
+                self.initialize_problems(force_overwrite)
 
     def generate_pbi_report(self) -> None:
         """
@@ -520,4 +647,7 @@ class Model:
         """
         self.logger.warning(f"Erasing model {self.settings['model_name']}.")
 
+        if self.core.sqltools.connection is not None:
+            self.core.sqltools.close_connection()
+
         self.files.erase_dir(self.paths['model_dir'])
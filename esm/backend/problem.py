@@ -20,7 +20,10 @@ Key functionalities include:
 
 """
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType
 from typing import Any, Dict, List, Optional, Tuple
+import functools
 import re
 import warnings
 
@@ -99,6 +102,8 @@ class Problem:
             expressions.
         solve_single_problem: Solves a single optimization problem and updates
             the problem status.
+        solve_problems_concurrently: Solves problems and sub-problems 
+            concurrently using a pool of threads.
         fetch_problem_status: Retrieves the status of a specific problem.
         solve_problems: Executes the solution processes for all configured 
             problems and updates their statuses.
@@ -165,6 +170,45 @@ class Problem:
         if isinstance(self.numerical_problems, dict):
             return len(self.numerical_problems)
 
+    @property
+    def numerical_problems_refreshable(self) -> bool:
+        """
+        Checks if existing numerical problems can be updated by only reloading 
+        values of exogenous variables (cvxpy parameters), without generating 
+        numerical problems again. This is not possible if numerical problems 
+        are not defined, or if symbolic expressions include operators that 
+        generate new parameters when problems are defined (see 
+        '_PARAMETERS_GENERATING_OPERATORS' constant).
+
+        Returns:
+            bool: True if numerical problems can be updated by reloading 
+                parameters values, False otherwise.
+        """
+        if self.numerical_problems is None or not self.symbolic_problem:
+            return False
+
+        if util.find_dict_depth(self.symbolic_problem) == 1:
+            symbolic_problems = [self.symbolic_problem]
+        else:
+            symbolic_problems = list(self.symbolic_problem.values())
+
+        generating_operators = Constants.get('_PARAMETERS_GENERATING_OPERATORS')
+
+        for symbolic_problem in symbolic_problems:
+            for expressions in symbolic_problem.values():
+                if isinstance(expressions, str):
+                    expressions = [expressions]
+
+                for expression in expressions or []:
+                    tokens = self.parse_allowed_symbolic_vars(
+                        expression=expression,
+                        non_allowed_tokens=[],
+                    )
+                    if any(token in generating_operators for token in tokens):
+                        return False
+
+        return True
+
     def create_cvxpy_variable(
         self,
         var_type: str,
@@ -279,22 +323,30 @@ class Problem:
         else:
             df_to_filter = related_table.coordinates_dataframe
             cvxpy_var = related_table.cvxpy_var
+            sub_problem_key = None
 
-        filtered_var_dataframe = util.filter_dataframe(
-            df_to_filter=df_to_filter,
+        # fetch positions from data table coordinates index, falling back to
+        # dataframe filtering if filter does not cover all coordinates
+        filtered_index = related_table.get_coordinates_positions(
             filter_dict=var_filter,
-            reset_index=False,
-            reorder_cols_based_on_filter=True,
-            reorder_rows_based_on_filter=True,
+            sub_problem_key=sub_problem_key,
         )
 
-        if filtered_var_dataframe.empty:
+        if filtered_index is None:
+            filtered_index = util.filter_dataframe(
+                df_to_filter=df_to_filter,
+                filter_dict=var_filter,
+                reset_index=False,
+                reorder_cols_based_on_filter=True,
+                reorder_rows_based_on_filter=True,
+            ).index.tolist()
+
+        if not filtered_index:
             msg = f"Variable sliced from '{related_table_key}' is empty. " \
                 "Check related variables filters."
             self.logger.error(msg)
             raise exc.MissingDataError(msg)
 
-        filtered_index = filtered_var_dataframe.index
         sliced_cvxpy_var = cvxpy_var[filtered_index]
         sliced_cvxpy_var_reshaped = cp.reshape(
             sliced_cvxpy_var,
@@ -471,65 +523,62 @@ class Problem:
                 column_values=None,
             )
 
-        # create variable filter
-        for row in var_data.index:
-            var_filter = {}
-            var_data_item: pd.Series = var_data.loc[row]
-
-            for header in var_data_item.index:
+        # create variable filters (hierarchy sets items and dimensions items)
+        hierarchy_headers = sets_parsing_hierarchy or []
 
-                if sets_parsing_hierarchy is not None and \
-                        header in sets_parsing_hierarchy:
-                    var_filter[header] = [var_data_item[header]]
+        if any(
+            header not in [*hierarchy_headers, *headers.values()]
+            for header in var_data.columns
+        ):
+            msg = "Variable 'data' dataframe headers mismatch."
+            self.logger.error(msg)
+            raise ValueError(msg)
 
-                elif header == headers['cvxpy']:
-                    for dim in [0, 1]:
-                        if isinstance(variable.shape[dim], int):
-                            pass
-                        elif isinstance(variable.shape[dim], str):
-                            dim_header = variable.dims_labels[dim]
-                            var_filter[dim_header] = variable.dims_items[dim]
+        dims_filter = {
+            variable.dims_labels[dim]: variable.dims_items[dim]
+            for dim in [0, 1]
+            if isinstance(variable.shape[dim], str)
+        }
 
-                elif header in [headers['filter'], headers['sub_problem_key']]:
-                    pass
+        hierarchy_values = var_data[hierarchy_headers].to_numpy().tolist()
 
-                else:
-                    msg = "Variable 'data' dataframe headers mismatch."
-                    self.logger.error(msg)
-                    raise ValueError(msg)
-
-            var_data.at[row, headers['filter']] = var_filter
+        var_data[headers['filter']] = [
+            {
+                **{
+                    header: [value]
+                    for header, value in zip(hierarchy_headers, row_values)
+                },
+                **dims_filter,
+            }
+            for row_values in hierarchy_values
+        ]
 
-        # identify sub_problem_key
+        # identify sub_problem_key through a lookup table of inter-problem
+        # coordinates (coordinates tuple: sub-problem key)
         inter_coord_label = Constants.get('inter')
         if variable_type not in ['exogenous', 'constant'] and \
                 variable.coordinates[inter_coord_label]:
-            for row in var_data.index:
 
-                inter_problem_coords = {
-                    set_label: variable.coordinates[inter_coord_label][set_key]
-                    for set_key, set_label
-                    in variable.coordinates_info[inter_coord_label].items()
-                }
-                inter_df = util.unpivot_dict_to_dataframe(inter_problem_coords)
-
-                var_filter: dict = var_data.at[row, headers['filter']]
-                var_inter_problem_coords = {
-                    key: value
-                    for key, value in var_filter.items()
-                    if key in inter_problem_coords.keys()
-                }
-                var_inter_df = util.unpivot_dict_to_dataframe(
-                    var_inter_problem_coords)
-
-                merged_df = inter_df.reset_index().merge(
-                    var_inter_df,
-                    on=list(inter_df.columns),
-                    how='inner'
-                ).set_index('index')
-
-                var_data.at[row, headers['sub_problem_key']] = \
-                    merged_df.index[0]
+            inter_problem_coords = {
+                set_label: variable.coordinates[inter_coord_label][set_key]
+                for set_key, set_label
+                in variable.coordinates_info[inter_coord_label].items()
+            }
+            inter_df = util.unpivot_dict_to_dataframe(inter_problem_coords)
+
+            inter_coords_lookup = {
+                coords: key
+                for key, coords in zip(
+                    inter_df.index,
+                    inter_df.itertuples(index=False, name=None))
+            }
+
+            var_data[headers['sub_problem_key']] = [
+                inter_coords_lookup[
+                    tuple(var_filter[label][0] for label in inter_df.columns)
+                ]
+                for var_filter in var_data[headers['filter']]
+            ]
 
         # create new cvxpy variables (exogenous vars and constants)
         if variable_type != 'endogenous':
@@ -1187,6 +1236,10 @@ class Problem:
                 can be used in the expression.
             Python's built-in `exec` is used with a controlled local namespace 
                 to securely evaluate the expression.
+            Expressions are compiled once and the related code objects are 
+                cached (see 'compile_cvxpy_expression'), so that the same 
+                expression can be evaluated for different allowed variables 
+                without being parsed again.
 
         Examples:
             >>> allowed_vars = {'x': cp.Variable()}
@@ -1202,7 +1255,7 @@ class Problem:
         try:
             # pylint: disable-next=exec-used
             exec(
-                'output = ' + expression,
+                self.compile_cvxpy_expression(expression),
                 {**allowed_operators, **allowed_variables},
                 local_vars,
             )
@@ -1219,6 +1272,26 @@ class Problem:
 
         return local_vars['output']
 
+    @staticmethod
+    @functools.lru_cache(maxsize=Constants.get('_CVXPY_EXPRESSIONS_CACHE_SIZE'))
+    def compile_cvxpy_expression(expression: str) -> CodeType:
+        """
+        Compiles a symbolic expression into a code object assigning the 
+        expression result to the 'output' local variable. Compiled expressions 
+        are cached (bounded cache shared by all Problem instances) and keyed 
+        by the expression text.
+
+        Parameters:
+            expression (str): The CVXPY expression as a string.
+
+        Returns:
+            CodeType: The compiled code object, to be executed with 'exec'.
+
+        Raises:
+            SyntaxError: If the expression is not syntactically valid.
+        """
+        return compile('output = ' + expression, '<cvxpy_expression>', 'exec')
+
     def define_expressions(
             self,
             symbolic_expressions: List[str],
@@ -1254,6 +1327,9 @@ class Problem:
                 constructing expressions based on available data.
             Expressions are skipped if they do not meet the required conditions 
                 specified in the 'problem_filter' and the intra-problem sets.
+            If 'stacked_expressions' setting is True, element-wise expressions
+                defined over an intra-problem set are generated once for all 
+                set values (see 'define_stacked_expression').
         """
         numerical_expressions = []
 
@@ -1302,6 +1378,8 @@ class Problem:
                     allow_empty_coord=True,
                 )
 
+                intra_problem_variables = []
+
                 # parse values in intra-problem-set
                 for value in set_data[set_header]:
 
@@ -1318,13 +1396,23 @@ class Problem:
                         set_intra_problem_header=set_header,
                         set_intra_problem_value=value,
                     )
+                    intra_problem_variables.append(allowed_variables)
 
-                    # define constraint
+                if self.settings.get('stacked_expressions', False):
+                    cvxpy_expression = self.define_stacked_expression(
+                        expression=expression,
+                        intra_problem_variables=intra_problem_variables,
+                    )
+                    if cvxpy_expression is not None:
+                        numerical_expressions.append(cvxpy_expression)
+                        continue
+
+                # define one constraint for each intra-problem set value
+                for allowed_variables in intra_problem_variables:
                     cvxpy_expression = self.execute_cvxpy_code(
                         expression=expression,
                         allowed_variables=allowed_variables,
                     )
-
                     numerical_expressions.append(cvxpy_expression)
 
             else:
@@ -1349,6 +1437,142 @@ class Problem:
 
         return numerical_expressions
 
+    def define_stacked_expression(
+            self,
+            expression: str,
+            intra_problem_variables: List[Dict[str, Any]],
+    ) -> Optional[cp.Expression]:
+        """
+        Defines one CVXPY expression for all values of an intra-problem set, 
+        instead of one expression for each value. Variables changing with the 
+        intra-problem set values are stacked vertically (one block of rows for 
+        each value), while variables shared by all values are kept as they are 
+        (if scalars) or repeated for each value. The symbolic expression is 
+        then evaluated once over the stacked variables.
+
+        Parameters:
+            expression (str): The symbolic expression.
+            intra_problem_variables (List[Dict[str, Any]]): The allowed 
+                variables for each value of the intra-problem set (see 
+                'fetch_allowed_cvxpy_variables').
+
+        Returns:
+            Optional[cp.Expression]: The stacked CVXPY expression, or None if 
+                the expression cannot be stacked, in which case one expression 
+                for each intra-problem set value must be defined.
+
+        Notes:
+            Only element-wise expressions can be stacked, i.e. expressions
+                including only operators in '_ELEMENTWISE_OPERATORS', numbers 
+                and variables changing with the intra-problem set values all 
+                with the same shape.
+            Variables shared by all intra-problem set values must be scalars
+                or have the same shape of the other variables.
+        """
+        if len(intra_problem_variables) < 2:
+            return None
+
+        elementwise_operators = Constants.get('_ELEMENTWISE_OPERATORS')
+        vars_keys = intra_problem_variables[0].keys()
+
+        tokens = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', expression)
+        if any(
+            token not in vars_keys and token not in elementwise_operators
+            for token in tokens
+        ):
+            return None
+
+        symbols = re.sub(
+            r'\b[a-zA-Z_][a-zA-Z0-9_]*\b|\d+\.?\d*(e[-+]?\d+)?|[\s(),]',
+            '', expression)
+        if not set(symbols) <= set(''.join(elementwise_operators)):
+            return None
+
+        varying_vars = {
+            var_key: [variables[var_key] for variables in intra_problem_variables]
+            for var_key in vars_keys
+            if any(
+                variables[var_key] is not intra_problem_variables[0][var_key]
+                for variables in intra_problem_variables
+            )
+        }
+
+        varying_shapes = {
+            np.shape(item) for items in varying_vars.values() for item in items
+        }
+        if len(varying_shapes) != 1:
+            return None
+
+        shape = varying_shapes.pop()
+        stacked_variables = {}
+
+        for var_key in vars_keys:
+            if var_key in varying_vars:
+                stacked_variables[var_key] = self.stack_cvxpy_variables(
+                    varying_vars[var_key])
+                continue
+
+            variable = intra_problem_variables[0][var_key]
+
+            if np.size(variable) == 1:
+                stacked_variables[var_key] = variable
+            elif np.shape(variable) == shape:
+                stacked_variables[var_key] = cp.vstack(
+                    [variable] * len(intra_problem_variables))
+            else:
+                return None
+
+        try:
+            return self.execute_cvxpy_code(
+                expression=expression,
+                allowed_variables=stacked_variables,
+            )
+        except ValueError:
+            return None
+
+    def stack_cvxpy_variables(
+            self,
+            cvxpy_variables: List[Any],
+    ) -> cp.Expression:
+        """
+        Stacks vertically a list of CVXPY variables with the same shape. If 
+        all variables are slices of the same endogenous variable (see 
+        'slice_cvxpy_variable'), they are merged in one slice over the 
+        concatenated positions, so that no atoms are added for each variable. 
+        Otherwise, variables are stacked with 'vstack'.
+
+        Parameters:
+            cvxpy_variables (List[Any]): The CVXPY variables to be stacked.
+
+        Returns:
+            cp.Expression: The stacked CVXPY expression.
+        """
+        def sliced_variable(item: Any) -> Optional[cp.Expression]:
+            if isinstance(item, cp.atoms.affine.reshape.reshape) and \
+                    item.get_data()[1] == 'C' and len(item.shape) == 2 and \
+                    isinstance(item.args[0], cp.atoms.affine.index.special_index) \
+                    and not isinstance(item.args[0].get_data()[0], tuple) and \
+                    item.args[0].args[0].shape[1:] in [(), (1,)]:
+                return item.args[0].args[0]
+            return None
+
+        parents = [sliced_variable(item) for item in cvxpy_variables]
+
+        if parents[0] is None or \
+                any(parent is not parents[0] for parent in parents[1:]):
+            return cp.vstack(cvxpy_variables)
+
+        positions = np.concatenate([
+            np.ravel(item.args[0].get_data()[0]) for item in cvxpy_variables
+        ])
+        rows, cols = cvxpy_variables[0].shape
+
+        return cp.reshape(
+            parents[0][positions.tolist()],
+            shape=(rows * len(cvxpy_variables), cols),
+            order='C',
+        )
+
     def solve_single_problem(
             self,
             problem_dataframe: pd.DataFrame,
@@ -1422,6 +1646,115 @@ class Problem:
 
             self.logger.debug(f"Problem status: '{numerical_problem.status}'")
 
+    def solve_problems_concurrently(
+            self,
+            problems_dataframes: Dict[Any, pd.DataFrame],
+            max_workers: int,
+            verbose: Optional[bool] = True,
+            solver: Optional[str] = None,
+            **kwargs: Any,
+    ) -> None:
+        """
+        Solves all problems and sub-problems defined in a dictionary of 
+        problem DataFrames concurrently, using a pool of threads.
+        Problems are first compiled serially (cvxpy canonicalization), then 
+        numerical solvers are invoked concurrently, and finally results are 
+        unpacked serially in the order of problems and sub-problems, so that 
+        solution is deterministic and equal to the serial solution.
+
+        Parameters:
+            problems_dataframes (Dict[Any, pd.DataFrame]): A dictionary with 
+                problem names as keys (None for a single unnamed problem) and 
+                problem DataFrames as values (same structure as in 
+                'solve_single_problem').
+            max_workers (int): Maximum number of threads used to run solvers.
+            verbose (Optional[bool], optional): If set to True, the solver will 
+                print progress information. Defaults to True.
+            solver (Optional[str], optional): The solver to use. If None, CVXPY 
+                will choose a solver automatically. Defaults to None.
+            **kwargs (Any): Additional arguments to pass to the solver.
+
+        Returns:
+            None
+
+        Notes:
+            The selected solver must support concurrent solution of different
+                problems in the same process.
+            The method updates the 'status' field of the input DataFrames 
+                in-place to reflect the solution status of each problem.
+        """
+        if verbose == False:
+            warnings.filterwarnings(
+                'ignore',
+                category=UserWarning,
+                module='cvxpy.reductions.solvers.solving_chain'
+            )
+
+        problem_header = Constants.get('_PROBLEM_HEADER')
+        status_header = Constants.get('_PROBLEM_STATUS_HEADER')
+        info_header = Constants.get('_PROBLEM_INFO_HEADER')
+
+        solver_options = dict(kwargs)
+        warm_start = solver_options.pop('warm_start', False)
+
+        compiled_problems = []
+
+        for problem_name, problem_dataframe in problems_dataframes.items():
+            for problem_num in problem_dataframe.index:
+
+                problem_info: List[str] = problem_dataframe.at[
+                    problem_num, info_header]
+
+                msg = "Compiling numerical problem"
+                if problem_name is not None:
+                    msg += f" [{problem_name}]"
+                if problem_info:
+                    msg += f" - Sub-problem {problem_info}."
+                self.logger.info(msg)
+
+                numerical_problem: cp.Problem = problem_dataframe.at[
+                    problem_num, problem_header]
+
+                data, solving_chain, inverse_data = \
+                    numerical_problem.get_problem_data(
+                        solver=solver,
+                        verbose=verbose,
+                        solver_opts=dict(solver_options),
+                    )
+
+                compiled_problems.append((
+                    problem_dataframe, problem_num, numerical_problem,
+                    data, solving_chain, inverse_data,
+                ))
+
+        self.logger.info(
+            f"Solving {len(compiled_problems)} numerical problems "
+            f"concurrently (maximum workers: {max_workers}).")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            solutions = list(executor.map(
+                lambda item: item[4].solve_via_data(
+                    problem=item[2],
+                    data=item[3],
+                    warm_start=warm_start,
+                    verbose=verbose,
+                    solver_opts=dict(solver_options),
+                ),
+                compiled_problems,
+            ))
+
+        for compiled_problem, solution in zip(compiled_problems, solutions):
+            problem_dataframe, problem_num, numerical_problem, \
+                _, solving_chain, inverse_data = compiled_problem
+
+            numerical_problem.unpack_results(
+                solution, solving_chain, inverse_data)
+
+            problem_dataframe.at[problem_num, status_header] = \
+                numerical_problem.status
+
+            self.logger.debug(f"Problem status: '{numerical_problem.status}'")
+
     def fetch_problem_status(self) -> None:
         """
         Fetches the status of all problems and sub-problems defined in the
@@ -1461,6 +1794,7 @@ class Problem:
             self,
             solver: str,
             verbose: bool,
+            max_workers: Optional[int] = None,
             **kwargs: Any,
     ) -> None:
         """
@@ -1474,6 +1808,9 @@ class Problem:
             solver (str): The solver to use. If None, CVXPY will choose a solver 
                 automatically.
             verbose (bool): If set to True, the solver will print progress information.
+            max_workers (Optional[int], optional): Maximum number of threads 
+                used to solve problems and sub-problems concurrently. If None 
+                or 1, problems are solved serially. Defaults to None.
             **kwargs (Any): Additional arguments to pass to the solver.
 
         Returns:
@@ -1488,6 +1825,24 @@ class Problem:
             If 'numerical_problems' is a dictionary, the keys are used as problem 
                 names.
         """
+        if max_workers is not None and max_workers > 1:
+            if isinstance(self.numerical_problems, pd.DataFrame):
+                problems_dataframes = {None: self.numerical_problems}
+            elif isinstance(self.numerical_problems, dict):
+                problems_dataframes = self.numerical_problems
+            else:
+                problems_dataframes = None
+
+            if problems_dataframes is not None:
+                self.solve_problems_concurrently(
+                    problems_dataframes=problems_dataframes,
+                    max_workers=max_workers,
+                    verbose=verbose,
+                    solver=solver,
+                    **kwargs
+                )
+                return
+
         if isinstance(self.numerical_problems, pd.DataFrame):
             self.solve_single_problem(
                 problem_dataframe=self.numerical_problems,
@@ -17,6 +17,7 @@ convert SQL data to formats usable by optimization tools like CVXPY.
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import cvxpy as cp
+import numpy as np
 import pandas as pd
 
 from esm.constants import Constants
@@ -376,32 +377,61 @@ class Variable:
 
         Returns:
             pd.DataFrame: data reshaped and pivoted to be used as cvxpy values.
+
+        Notes:
+            For variables with rows/cols labels, the matrix is filled directly
+                based on the positions of data coordinates among dimensions 
+                items (coordinates columns can be either plain or categorical).
+                In case of duplicated coordinates, the first non-null value 
+                is considered, while missing coordinates result in NaN values.
         """
         values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
 
         # case of a scalar with no rows/cols labels (scalars)
         if all(item is None for item in self.dims_labels):
-            index = ''
-            columns = None
+            pivoted_data = data.pivot_table(
+                index='',
+                columns=None,
+                values=values_header,
+                aggfunc='first'
+            )
+
+            return pivoted_data.reindex(
+                index=self.dims_items[0],
+                columns=self.dims_items[1]
+            )
 
         # all other variables with rows/cols labels (scalars, vectors/matrices)
-        else:
-            index = self.dims_labels[0]
-            columns = self.dims_labels[1]
-
-        pivoted_data = data.pivot_table(
-            index=index,
-            columns=columns,
-            values=values_header,
-            aggfunc='first'
-        )
+        values = data[values_header].to_numpy(dtype=float)
+        dims_indexes = []
+        dims_positions = []
+
+        for label, items in zip(self.dims_labels, self.dims_items):
+            if label is None:
+                dims_indexes.append(pd.Index([values_header]))
+                dims_positions.append(np.zeros(len(data), dtype=int))
+            else:
+                dim_index = pd.Index(items, name=label)
+                dims_indexes.append(dim_index)
+                dims_positions.append(dim_index.get_indexer(data[label]))
 
-        pivoted_data = pivoted_data.reindex(
-            index=self.dims_items[0],
-            columns=self.dims_items[1]
-        )
+        rows_index, cols_index = dims_indexes
+        rows_pos, cols_pos = dims_positions
 
-        return pivoted_data
+        valid = (rows_pos >= 0) & (cols_pos >= 0) & ~np.isnan(values)
+        flat_pos = rows_pos[valid] * len(cols_index) + cols_pos[valid]
+
+        # first value for each coordinates (np.unique returns first occurrence)
+        flat_pos, first_pos = np.unique(flat_pos, return_index=True)
+
+        matrix = np.full(len(rows_index) * len(cols_index), np.nan)
+        matrix[flat_pos] = values[valid][first_pos]
+
+        return pd.DataFrame(
+            data=matrix.reshape(len(rows_index), len(cols_index)),
+            index=rows_index,
+            columns=cols_index,
+        )
 
     def define_constant(
             self,
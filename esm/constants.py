@@ -37,6 +37,15 @@ class Constants:
         _TUTORIAL_FILE_NAME (str): Default tutorial file name.
         _DEFAULT_MODELS_DIR_PATH (str): directory path for default models.
         _DEFAULT_MODELS_LIST (list): List of default models.
+        _INPUT_DATA_FORMATS (dict): Allowed formats of input data files, with 
+            related file extensions.
+        _INPUT_DATA_MANIFEST_FILE (str): Name of the file storing the manifest 
+            of loaded input data, alongside the SQLite database.
+        _INDEX_SNAPSHOT_FILE (str): Name of the file storing the binary 
+            snapshot of the Index state, in the model directory.
+        _INDEX_SNAPSHOT_VERSION (int): Version of the Index snapshot format, to
+            be increased when the structure of Index objects changes (older 
+            snapshots are then discarded).
         _STD_NAME_HEADER (str): Standard header for the 'name' field in data tables.
         _STD_FILTERS_HEADERS (str): Standard header for the 'filters' field in data tables.
         _STD_AGGREGATION_HEADER (str): Standard header for the 'aggregation' field in data tables.
@@ -55,6 +64,22 @@ class Constants:
         _VARIABLE_DEFAULT_STRUCTURE (dict): Default structure for variables.
         _ALLOWED_CONSTANTS (dict): Allowed constants for use in symbolic problem definitions.
         _ALLOWED_OPERATORS (dict): Allowed operators for defining symbolic CVXPY problems.
+        _CVXPY_EXPRESSIONS_CACHE_SIZE (int): Maximum number of compiled symbolic 
+            expressions kept in cache.
+        _ELEMENTWISE_OPERATORS (list): Allowed operators applied element-wise
+            (expressions including only these operators can be stacked over 
+            intra-problem sets values).
+        _PARAMETERS_GENERATING_OPERATORS (list): Allowed operators generating new 
+            parameters when numerical problems are defined (their values are 
+            not updated by reloading exogenous data).
+        _MAX_LOGGED_ROWS_IDS (int): Maximum number of rows ids listed in logs
+            when comparing databases values.
+        _SQLITE_PRAGMA_PROFILES (dict): SQLite pragmas applied when opening 
+            database connections, for each available profile.
+        _SQLITE_CACHED_STATEMENTS (int): Number of prepared statements cached 
+            by each SQLite connection.
+        _SQLITE_INSERT_CHUNK_SIZE (int): Default number of rows inserted in 
+            SQLite tables with each executemany call.
 
     Methods:
         get(constant_name: str): Retrieves the value of a constant by name, 
@@ -86,6 +111,14 @@ class Constants:
         '4_sut_multi_year_rcot_cap_dis',
     ]
 
+    _INPUT_DATA_FORMATS = {
+        'excel': '.xlsx',
+        'parquet': '.parquet',
+    }
+    _INPUT_DATA_MANIFEST_FILE = 'input_data_manifest.json'
+    _INDEX_SNAPSHOT_FILE = 'index_snapshot.pkl'
+    _INDEX_SNAPSHOT_VERSION = 1
+
     # STANDARD HEADERS, TABLE FIELDS AND VALUE TYPES
     _STD_NAME_HEADER = 'name'
     _STD_FILTERS_HEADERS = 'filters'
@@ -169,6 +202,9 @@ class Constants:
         'Minimize': cp.Minimize,
         'Maximize': cp.Maximize,
     }
+    _CVXPY_EXPRESSIONS_CACHE_SIZE = 1024
+    _ELEMENTWISE_OPERATORS = ['+', '-', '/', '==', '>=', '<=', 'mult']
+    _PARAMETERS_GENERATING_OPERATORS = ['pow', 'minv', 'weib']
 
     # NUMERICAL SETTINGS
     _ALLOWED_SOLVERS = cp.installed_solvers()
@@ -177,6 +213,21 @@ class Constants:
     _TOLERANCE_MODEL_COUPLING_CONVERGENCE = 0.01
     _MAXIMUM_ITERATIONS_MODEL_COUPLING = 20
     _ROUNDING_DIGITS_RELATIVE_DIFFERENCE_DB = 5
+    _MAX_LOGGED_ROWS_IDS = 10
+
+    # SQLITE SETTINGS
+    _SQLITE_PRAGMA_PROFILES = {
+        'default': {},
+        'performance': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -262144,  # negative: size in KiB (256 MB)
+            'mmap_size': 268435456,  # bytes (256 MB)
+            'temp_store': 'MEMORY',
+        },
+    }
+    _SQLITE_CACHED_STATEMENTS = 512
+    _SQLITE_INSERT_CHUNK_SIZE = 50000
 
     @classmethod
     def get(cls, constant_name):
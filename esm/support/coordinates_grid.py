@@ -0,0 +1,264 @@
+"""
+coordinates_grid.py
+
+@author: Matteo V. Rocco
+@institution: Politecnico di Milano
+
+This module defines the CoordinatesGrid class, a compact representation of
+the cartesian product of coordinates (sets items). The grid only stores the
+items of each dimension: each combination of coordinates is identified by its
+position in the cartesian product, and mapped to/from the per-dimension
+integer codes (positions of items in each dimension) with NumPy mixed-radix
+arithmetic. The cartesian product is materialized to a DataFrame only on
+request.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class CoordinatesGrid:
+    """
+    Compact representation of the cartesian product of coordinates,
+    where positions in the grid follow the same order of itertools.product
+    (last dimension varying fastest).
+
+    Attributes:
+        headers (List[str]): Names of the grid dimensions.
+        items (Dict[str, pd.Index]): Items of each dimension.
+
+    Methods:
+        shape: Number of items for each dimension.
+        size: Total number of coordinates combinations.
+        codes: Per-dimension codes of the combinations at given positions.
+        positions: Positions of the combinations identified by per-dimension
+            codes.
+        locate: Positions of the combinations identified by coordinates
+            values.
+        to_dataframe: Materializes (part of) the grid to a DataFrame.
+    """
+
+    def __init__(self, coordinates: Dict[str, Sequence[Any]]) -> None:
+        """
+        Initializes the grid based on the items of each dimension.
+
+        Args:
+            coordinates (Dict[str, Sequence[Any]]): Dictionary with dimensions
+                names as keys and related items as values. The order of keys
+                defines the order of grid dimensions.
+        """
+        self.headers: List[str] = list(coordinates.keys())
+        self.items: Dict[str, pd.Index] = {
+            header: pd.Index(list(items), tupleize_cols=False)
+            for header, items in coordinates.items()
+        }
+
+    def __repr__(self) -> str:
+        class_name = type(self).__name__
+        return f'{class_name}({dict(zip(self.headers, self.shape))})'
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        for chunk in self.iter_chunks():
+            yield from chunk.itertuples(index=False, name=None)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Returns:
+            Tuple[int, ...]: Number of items for each dimension of the grid.
+        """
+        return tuple(len(self.items[header]) for header in self.headers)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: Total number of coordinates combinations in the grid (one
+                combination for a grid with no dimensions).
+        """
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def codes(
+            self,
+            positions: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Computes the codes (positions of items in each dimension) of the
+        coordinates combinations at given positions of the grid.
+
+        Args:
+            positions (Optional[np.ndarray]): Positions in the grid. Defaults
+                to None, in which case all positions are considered.
+
+        Returns:
+            Dict[str, np.ndarray]: Codes arrays for each dimension.
+        """
+        if positions is None:
+            positions = np.arange(self.size, dtype=np.int64)
+
+        if not self.headers:
+            return {}
+
+        codes = np.unravel_index(np.asarray(positions, dtype=np.int64),
+                                 self.shape)
+
+        return dict(zip(self.headers, codes))
+
+    def positions(self, codes: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Computes the positions in the grid of the coordinates combinations
+        identified by the codes of each dimension.
+
+        Args:
+            codes (Dict[str, np.ndarray]): Codes arrays for each dimension.
+
+        Returns:
+            np.ndarray: Positions in the grid. Combinations including codes
+                out of dimensions bounds (i.e. -1) are returned as -1.
+
+        Raises:
+            ValueError: If codes of dimensions are missing or mismatching.
+        """
+        if set(codes.keys()) != set(self.headers):
+            raise ValueError(
+                f"Codes passed for {list(codes.keys())}, expected for grid "
+                f"dimensions {self.headers}.")
+
+        if not self.headers:
+            return np.zeros(0, dtype=np.int64)
+
+        codes_arrays = [
+            np.asarray(codes[header], dtype=np.int64)
+            for header in self.headers
+        ]
+
+        valid = np.ones(len(codes_arrays[0]), dtype=bool)
+        for codes_array, dim_size in zip(codes_arrays, self.shape):
+            valid &= (codes_array >= 0) & (codes_array < dim_size)
+
+        positions = np.full(len(valid), -1, dtype=np.int64)
+        positions[valid] = np.ravel_multi_index(
+            [codes_array[valid] for codes_array in codes_arrays],
+            self.shape,
+        )
+
+        return positions
+
+    def locate(self, coordinates: Dict[str, Sequence[Any]]) -> np.ndarray:
+        """
+        Computes the positions in the grid of coordinates combinations
+        identified by their values.
+
+        Args:
+            coordinates (Dict[str, Sequence[Any]]): Coordinates values for each
+                dimension (sequences of the same length, i.e. DataFrame columns).
+
+        Returns:
+            np.ndarray: Positions in the grid. Combinations including values
+                not in the grid are returned as -1. In case of duplicated
+                items in a dimension, the first one is considered.
+        """
+        codes = {}
+
+        for header in self.headers:
+            dim_items = self.items[header]
+            first_items = ~dim_items.duplicated()
+            first_codes = np.flatnonzero(first_items)
+
+            found = dim_items[first_items].get_indexer(
+                coordinates.get(header, []))
+            codes[header] = np.where(found >= 0, first_codes[found], -1)
+
+        return self.positions(codes)
+
+    def to_dataframe(
+            self,
+            positions: Optional[np.ndarray] = None,
+            categorical: bool = False,
+            dtypes: Optional[Dict[str, pd.CategoricalDtype]] = None,
+    ) -> pd.DataFrame:
+        """
+        Materializes the coordinates combinations of the grid to a DataFrame,
+        with one column for each dimension.
+
+        Args:
+            positions (Optional[np.ndarray]): Positions in the grid to be
+                materialized. Defaults to None, in which case all the grid is
+                materialized.
+            categorical (bool): If True, columns are returned as categorical
+                (items of each dimension as categories). Defaults to False, in
+                which case columns dtypes are inferred from items.
+            dtypes (Optional[Dict[str, pd.CategoricalDtype]]): Categorical 
+                dtypes for (some of) the dimensions, i.e. shared among 
+                different grids. Columns codes are mapped from dimension items 
+                to dtype categories (items not included in categories are 
+                returned as NaN). Defaults to None.
+
+        Returns:
+            pd.DataFrame: The coordinates combinations, with a RangeIndex.
+        """
+        codes = self.codes(positions)
+
+        if positions is None:
+            n_rows = self.size
+        else:
+            n_rows = len(positions)
+
+        if dtypes is None:
+            dtypes = {}
+
+        columns = {}
+        for header in self.headers:
+            dim_items = self.items[header]
+
+            if header in dtypes:
+                items_codes = dtypes[header].categories.get_indexer(dim_items)
+                columns[header] = pd.Categorical.from_codes(
+                    codes=items_codes[codes[header]],
+                    dtype=dtypes[header],
+                )
+            elif categorical and dim_items.is_unique:
+                columns[header] = pd.Categorical.from_codes(
+                    codes=codes[header],
+                    dtype=pd.CategoricalDtype(dim_items),
+                )
+            elif categorical:
+                columns[header] = pd.Categorical(
+                    dim_items.take(codes[header]))
+            else:
+                columns[header] = dim_items.take(codes[header]).to_numpy()
+
+        return pd.DataFrame(
+            data=columns,
+            columns=self.headers,
+            index=pd.RangeIndex(n_rows),
+        )
+
+    def iter_chunks(
+            self,
+            chunk_size: int = 100000,
+            categorical: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Materializes the grid to DataFrames of limited size.
+
+        Args:
+            chunk_size (int): Maximum number of rows of each DataFrame.
+                Defaults to 100000.
+            categorical (bool): If True, columns are returned as categorical.
+                Defaults to False.
+
+        Yields:
+            pd.DataFrame: Consecutive chunks of the grid.
+        """
+        for start in range(0, self.size, chunk_size):
+            stop = min(start + chunk_size, self.size)
+            yield self.to_dataframe(
+                positions=np.arange(start, stop, dtype=np.int64),
+                categorical=categorical,
+            )
@@ -17,7 +17,9 @@ from pathlib import Path
 
 import os
 import shutil
+import hashlib
 import json
+import pickle
 import yaml
 
 import pandas as pd
@@ -44,6 +46,11 @@ class FileManager:
         create_dir: Creates a directory with an option to overwrite.
         erase_dir: Removes a directory and its contents.
         load_file: Loads a file from a specified directory.
+        dict_to_json_file: Saves a dictionary to a JSON file.
+        file_fingerprint: Computes size, modification time and content hash 
+            of a file.
+        object_to_pickle_file: Saves a Python object to a pickle file.
+        pickle_file_to_object: Loads a Python object from a pickle file.
         erase_file: Deletes a specific file.
         copy_file_to_destination: Copies a file from one directory to another.
         copy_all_files_to_destination: Copies all files from one directory to 
@@ -51,6 +58,8 @@ class FileManager:
         dataframe_to_excel: Exports a DataFrame to an Excel file.
         excel_to_dataframes_dict: Converts an Excel file with multiple sheets 
             to a dictionary of DataFrames.
+        dataframe_to_parquet: Exports a DataFrame to a Parquet file.
+        parquet_to_dataframe: Reads a Parquet file to a DataFrame.
     """
 
     def __init__(
@@ -203,6 +212,147 @@ class FileManager:
                 f"Could not load file '{file_name}': {str(error)}")
             return {}
 
+    def dict_to_json_file(
+            self,
+            data: Dict[str, Any],
+            file_name: str,
+            dir_path: Path | str,
+    ) -> None:
+        """
+        Saves a dictionary to a JSON file in the specified directory. The file 
+        is first written to a temporary file, then moved to its final path, 
+        so that an existing file is never left partially written.
+
+        Args:
+            data (Dict[str, Any]): The dictionary to save (JSON serializable).
+            file_name (str): The name of the JSON file.
+            dir_path (Path | str): The path to the directory of the file.
+
+        Returns:
+            None
+        """
+        file_path = Path(dir_path, file_name)
+        temp_file_path = file_path.with_name(file_path.name + '.tmp')
+
+        with open(temp_file_path, 'w', encoding='utf-8') as file_obj:
+            json.dump(data, file_obj, indent=2)
+
+        os.replace(temp_file_path, file_path)
+        self.logger.debug(f"File '{file_name}' saved.")
+
+    def file_fingerprint(
+            self,
+            file_name: str,
+            file_dir_path: Path | str,
+            previous: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Computes the fingerprint of a file, made of its size, last 
+        modification time (nanoseconds) and SHA-256 hash of its content.
+        If a previous fingerprint of the file with the same size and 
+        modification time is passed, the file content is assumed as unchanged
+        and it is not read again.
+
+        Args:
+            file_name (str): The name of the file.
+            file_dir_path (Path | str): The directory path where the file is 
+                located.
+            previous (Optional[Dict[str, Any]], optional): Previous fingerprint
+                of the file. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Fingerprint of the file, with 'size', 'mtime_ns' 
+                and 'sha256' keys.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+        """
+        file_path = Path(file_dir_path, file_name)
+
+        if not file_path.exists():
+            self.logger.error(f'{file_name} does not exist.')
+            raise FileNotFoundError(f"{file_name} does not exist.")
+
+        file_stat = file_path.stat()
+        fingerprint = {
+            'size': file_stat.st_size,
+            'mtime_ns': file_stat.st_mtime_ns,
+        }
+
+        if previous and 'sha256' in previous and \
+                all(previous.get(key) == value
+                    for key, value in fingerprint.items()):
+            fingerprint['sha256'] = previous['sha256']
+            return fingerprint
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file_obj:
+            for chunk in iter(lambda: file_obj.read(1 << 20), b''):
+                digest.update(chunk)
+
+        fingerprint['sha256'] = digest.hexdigest()
+        return fingerprint
+
+    def object_to_pickle_file(
+            self,
+            obj: Any,
+            file_name: str,
+            dir_path: Path | str,
+    ) -> None:
+        """
+        Saves a Python object to a binary pickle file in the specified 
+        directory (highest pickle protocol). As for JSON files, the file is 
+        first written to a temporary file, then moved to its final path.
+
+        Args:
+            obj (Any): The object to save (picklable).
+            file_name (str): The name of the pickle file.
+            dir_path (Path | str): The path to the directory of the file.
+
+        Returns:
+            None
+        """
+        file_path = Path(dir_path, file_name)
+        temp_file_path = file_path.with_name(file_path.name + '.tmp')
+
+        with open(temp_file_path, 'wb') as file_obj:
+            pickle.dump(obj, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_file_path, file_path)
+        self.logger.debug(f"File '{file_name}' saved.")
+
+    def pickle_file_to_object(
+            self,
+            file_name: str,
+            dir_path: Path | str,
+    ) -> Any:
+        """
+        Loads a Python object from a binary pickle file. Only files generated 
+        by the application itself must be loaded, since unpickling data from
+        untrusted sources may execute arbitrary code.
+
+        Args:
+            file_name (str): The name of the pickle file.
+            dir_path (Path | str): The path to the directory of the file.
+
+        Returns:
+            Any: The loaded object.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+        """
+        file_path = Path(dir_path, file_name)
+
+        if not file_path.exists():
+            self.logger.error(f'{file_name} does not exist.')
+            raise FileNotFoundError(f"{file_name} does not exist.")
+
+        with open(file_path, 'rb') as file_obj:
+            obj = pickle.load(file_obj)
+
+        self.logger.debug(f"File '{file_name}' loaded.")
+        return obj
+
     def erase_file(
             self,
             dir_path: Path | str,
@@ -571,3 +721,95 @@ class FileManager:
 
         self.logger.debug(f"Excel file '{excel_file_name}' loaded.")
         return df_dict
+
+    def check_parquet_engine(self) -> None:
+        """
+        Checks that the engine for reading/writing Parquet files (pyarrow, 
+        optional dependency) is installed.
+
+        Raises:
+            SettingsError: If pyarrow is not installed.
+        """
+        try:
+            # pylint: disable-next=import-outside-toplevel, unused-import
+            import pyarrow
+        except ImportError as error:
+            msg = "Package 'pyarrow' is required to handle Parquet input " \
+                "data files. Install it or use 'excel' input data format."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg) from error
+
+    def dataframe_to_parquet(
+            self,
+            dataframe: pd.DataFrame,
+            parquet_file_name: str,
+            parquet_file_dir_path: Path | str,
+            force_overwrite: bool = False,
+    ) -> None:
+        """
+        Exports a DataFrame to a Parquet file (one table for each file), 
+        optionally allowing for overwriting an existing file.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to export.
+            parquet_file_name (str): The name of the Parquet file to create.
+            parquet_file_dir_path (Path | str): The directory path where the 
+                Parquet file will be saved.
+            force_overwrite (bool, optional): If True, an existing Parquet file
+                is overwritten without prompt. Defaults to False.
+
+        Raises:
+            SettingsError: If pyarrow is not installed.
+        """
+        self.check_parquet_engine()
+
+        file_path = Path(parquet_file_dir_path, parquet_file_name)
+
+        if file_path.exists() and not force_overwrite:
+            confirm = input(
+                f"File {parquet_file_name} already exists. \
+                    Do you want to overwrite it? (y/[n])"
+            )
+            if confirm.lower() != 'y':
+                self.logger.warning(
+                    f"File '{parquet_file_name}' not overwritten.")
+                return
+
+        dataframe.to_parquet(file_path, engine='pyarrow', index=False)
+
+        self.logger.debug(f"Parquet file '{parquet_file_name}' generated.")
+
+    def parquet_to_dataframe(
+            self,
+            parquet_file_name: str,
+            parquet_file_dir_path: Path | str,
+    ) -> pd.DataFrame:
+        """
+        Reads a Parquet file and returns its content as a Pandas DataFrame.
+        Columns are read with their stored types (no conversion of empty 
+        values, as for Excel files).
+
+        Args:
+            parquet_file_name (str): The name of the Parquet file to read.
+            parquet_file_dir_path (Path | str): The directory path where the 
+                Parquet file is located.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the Parquet file data.
+
+        Raises:
+            FileNotFoundError: If the specified Parquet file does not exist.
+            SettingsError: If pyarrow is not installed.
+        """
+        self.check_parquet_engine()
+
+        file_path = Path(parquet_file_dir_path, parquet_file_name)
+
+        if not file_path.exists():
+            self.logger.error(f'{parquet_file_name} does not exist.')
+            raise FileNotFoundError(f"{parquet_file_name} does not exist.")
+
+        dataframe = pd.read_parquet(file_path, engine='pyarrow')
+
+        self.logger.debug(f"Parquet file '{parquet_file_name}' loaded.")
+        return dataframe
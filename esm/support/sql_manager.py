@@ -12,11 +12,13 @@ tasks by providing a set of easy-to-use methods for common SQL operations, ensur
 that database interactions are both efficient and safe.
 """
 
-from typing import List, Dict, Any, Literal, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Literal, Optional, Tuple
 from pathlib import Path
 import contextlib
+import itertools as it
 import sqlite3
 
+import numpy as np
 import pandas as pd
 
 from esm.log_exc import exceptions as exc
@@ -47,14 +49,22 @@ class SQLManager:
             queries, None if not connected.
         foreign_keys_enabled (Optional[bool]): Status of SQLite foreign key
             enforcement in the session.
+        schema_cache (Dict[str, Any]): Cache of the database schema (tables
+            names and tables info).
 
     Methods:
         - open_connection: Establishes a connection to the SQLite database.
         - close_connection: Closes the current database connection.
         - execute_query: Executes a SQL query with optional parameters.
+        - execute_many_in_chunks: Executes a SQL query for an iterable of 
+            parameters sets, in chunks.
         - check_table_exists: Checks existence of a table in the database.
         - get_existing_tables_names: Retrieves a list of all tables in the database.
+        - get_table_info: Retrieves the (cached) schema of a table.
+        - clear_schema_cache: Invalidates the cached database schema.
         - table_to_excel: Exports a database table to an Excel file.
+        - tables_to_excel: Exports multiple database tables to an Excel file
+            in a single writing session.
         - get_primary_column_name: Finds the primary key column of a table.
         - drop_table: Removes a table from the database.
         - get_table_fields: Fetches field names and types of a table.
@@ -68,6 +78,8 @@ class SQLManager:
         - add_primary_keys_from_table: Appends primary key values from a table
             to a DataFrame.
         - table_to_dataframe: Converts table contents into a DataFrame.
+        - table_to_arrays: Converts table contents into typed arrays (one for
+            each column).
         - dataframe_to_table: Inserts or updates data from a DataFrame into a table.
         - filtered_table_to_dataframe: Filters a table and returns the results
             as a DataFrame.
@@ -92,6 +104,8 @@ class SQLManager:
         database_path: Path,
         database_name: str,
         xls_engine: Literal['openpyxl', 'xlswriter'] = 'openpyxl',
+        pragma_profile: str = 'default',
+        persistent_connection: bool = False,
     ) -> None:
         """
         Initializes the SQLManager instance with necessary database details
@@ -104,6 +118,15 @@ class SQLManager:
                 purposes.
             xls_engine (Literal['openpyxl', 'xlsxwriter']): Preferred engine
                 for exporting data to Excel, defaults to 'openpyxl'.
+            pragma_profile (str): Name of the SQLite pragmas profile applied 
+                when opening connections (see '_SQLITE_PRAGMA_PROFILES' 
+                constant), defaults to 'default'.
+            persistent_connection (bool): If True, the database connection 
+                is kept open after exiting 'db_handler' blocks and reused by 
+                following ones, defaults to False.
+
+        Raises:
+            SettingsError: If the pragma profile is not available.
 
         Sets up the initial state of the SQLManager, preparing it for database
             operations. It logs the creation of the SQLManager instance.
@@ -115,9 +138,25 @@ class SQLManager:
         self.database_name: str = database_name
         self.xls_engine = xls_engine
 
+        pragma_profiles = Constants.get('_SQLITE_PRAGMA_PROFILES')
+        if pragma_profile not in pragma_profiles:
+            msg = f"SQLite pragma profile '{pragma_profile}' not available. " \
+                f"Available profiles: {list(pragma_profiles.keys())}."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg)
+
+        self.pragmas: Dict[str, Any] = pragma_profiles[pragma_profile]
+
         self.connection: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
         self.foreign_keys_enabled = None
+        self.batch_transaction = False
+        self.persistent_connection = persistent_connection
+        self.connection_users = 0
+
+        # cache of database schema (tables names and tables info), refreshed
+        # by methods altering the schema
+        self.schema_cache: Dict[str, Any] = {}
 
     def __repr__(self):
         class_name = type(self).__name__
@@ -127,7 +166,10 @@ class SQLManager:
         """
         Opens a connection to the SQLite database.
         Establishes a connection to the specified database file and initializes
-        a cursor for executing SQL queries. Logs and re-raises any sqlite3.Error
+        a cursor for executing SQL queries. Pragmas of the selected profile are
+        applied to the connection, and prepared statements are cached by the
+        connection (see '_SQLITE_CACHED_STATEMENTS' constant). Logs and 
+        re-raises any sqlite3.Error
         encountered during the connection process.
 
         Raises:
@@ -136,8 +178,18 @@ class SQLManager:
         """
         if self.connection is None:
             try:
-                self.connection = sqlite3.connect(f'{self.database_sql_path}')
+                self.connection = sqlite3.connect(
+                    f'{self.database_sql_path}',
+                    cached_statements=Constants.get(
+                        '_SQLITE_CACHED_STATEMENTS'),
+                )
                 self.cursor = self.connection.cursor()
+
+                for pragma, value in self.pragmas.items():
+                    self.cursor.execute(f"PRAGMA {pragma} = {value}")
+
+                self.clear_schema_cache()
+
                 self.logger.debug(
                     f"Connection to '{self.database_name}' opened.")
             except sqlite3.Error as error:
@@ -164,6 +216,8 @@ class SQLManager:
             try:
                 self.connection.close()
                 self.connection = None
+                self.cursor = None
+                self.clear_schema_cache()
                 self.logger.debug(
                     f"Connection to '{self.database_name}' closed.")
             except sqlite3.Error as error:
@@ -176,6 +230,41 @@ class SQLManager:
                 f"Connection to '{self.database_name}' "
                 "already closed or does not exist.")
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        A context manager batching all queries executed within the context in
+        one transaction: per-statement commits of 'execute_query' are 
+        suspended, and the transaction is committed once when the context is 
+        exited (or rolled back in case of errors). Nested calls are included 
+        in the outermost transaction.
+
+        Yields:
+            None
+
+        Raises:
+            OperationalError: If the database connection is not initialized.
+        """
+        if self.connection is None:
+            msg = "Database connection not initialized."
+            self.logger.error(msg)
+            raise exc.OperationalError(msg)
+
+        if self.batch_transaction:
+            yield
+            return
+
+        self.batch_transaction = True
+        try:
+            yield
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            self.clear_schema_cache()
+            raise
+        finally:
+            self.batch_transaction = False
+
     def execute_query(
             self,
             query: str,
@@ -198,7 +287,8 @@ class SQLManager:
                 parameter sets.
             fetch (bool, optional): Whether to fetch and return the query results.
             commit (bool, optional): Whether to commit the transaction after
-                query execution.
+                query execution. Ignored within a batched transaction (see
+                'transaction' method), committed at the end of the batch.
 
         Returns:
             Optional[List[Tuple]]: Results of the query if fetched; otherwise,
@@ -221,7 +311,7 @@ class SQLManager:
             else:
                 self.cursor.execute(query, params)
 
-            if commit:
+            if commit and not self.batch_transaction:
                 self.connection.commit()
 
             if fetch:
@@ -237,24 +327,118 @@ class SQLManager:
             self.logger.error(msg)
             raise exc.IntegrityError(msg) from int_error
 
+    def clear_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        Invalidates the cached database schema. To be called whenever the 
+        database schema is altered outside SQLManager methods.
+
+        Args:
+            table_name (Optional[str]): The name of the table whose cached 
+                info are invalidated (together with the list of tables names). 
+                Defaults to None, in which case the whole cache is cleared.
+        """
+        if table_name is None:
+            self.schema_cache.clear()
+        else:
+            self.schema_cache.pop('tables_names', None)
+            self.schema_cache.get('tables_info', {}).pop(table_name, None)
+
+    def get_table_info(self, table_name: str) -> List[Tuple]:
+        """
+        Retrieves the schema of a table (SQLite 'PRAGMA table_info'), cached 
+        until the table is altered through SQLManager methods.
+
+        Args:
+            table_name (str): The name of the table to inspect.
+
+        Returns:
+            List[Tuple]: A list of rows (cid, name, type, notnull, dflt_value, 
+                pk) for each column of the table. Empty if the table does not 
+                exist.
+        """
+        tables_info = self.schema_cache.setdefault('tables_info', {})
+
+        if table_name not in tables_info:
+            query = f"PRAGMA table_info('{table_name}')"
+            table_info = self.execute_query(query, fetch=True, commit=False)
+
+            if not table_info:
+                return []
+
+            tables_info[table_name] = table_info
+
+        return list(tables_info[table_name])
+
+    def execute_many_in_chunks(
+            self,
+            query: str,
+            params: Iterable[tuple],
+            chunk_size: Optional[int] = None,
+            commit: bool = True,
+    ) -> int:
+        """
+        Executes a SQL query for each parameters set of an iterable (i.e. a 
+        generator of rows), consuming it in chunks of limited size. In this 
+        way, peak memory is bounded by the chunk size regardless of the number 
+        of parameters sets.
+
+        Args:
+            query (str): SQL query to be executed.
+            params (Iterable[tuple]): Parameters sets for the SQL query.
+            chunk_size (Optional[int]): Number of parameters sets executed 
+                with each executemany call. Defaults to None, in which case 
+                the '_SQLITE_INSERT_CHUNK_SIZE' constant is used.
+            commit (bool, optional): Whether to commit the transaction after
+                each chunk (ignored within a batched transaction).
+
+        Returns:
+            int: The total number of parameters sets executed.
+
+        Raises:
+            SettingsError: If the chunk size is not a positive integer.
+        """
+        if chunk_size is None:
+            chunk_size = Constants.get('_SQLITE_INSERT_CHUNK_SIZE')
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            msg = "Chunk size must be a positive integer."
+            self.logger.error(msg)
+            raise exc.SettingsError(msg)
+
+        params = iter(params)
+        executed = 0
+
+        while True:
+            chunk = list(it.islice(params, chunk_size))
+            if not chunk:
+                break
+
+            self.execute_query(
+                query=query, params=chunk, many=True, commit=commit)
+            executed += len(chunk)
+
+        return executed
+
     @property
     def get_existing_tables_names(self) -> List[str]:
         """
         Retrieve a list of existing table names in the SQLite database.
         This method queries the database to extract the names of all tables and
-        logs any related errors.
+        logs any related errors. Tables names are cached until the database 
+        schema is altered through SQLManager methods.
 
         Returns:
             List[str]: A list containing the names of existing tables in the
             database.
         """
-        query = "SELECT name FROM sqlite_master WHERE type='table'"
-        self.execute_query(query)
+        if 'tables_names' not in self.schema_cache:
+            query = "SELECT name FROM sqlite_master " \
+                "WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            tables = self.execute_query(query, fetch=True, commit=False)
 
-        if self.cursor:
-            tables = self.cursor.fetchall()
+            self.schema_cache['tables_names'] = [table[0] for table in tables]
 
-        return [table[0] for table in tables]
+        return list(self.schema_cache['tables_names'])
 
     def check_table_exists(self, table_name: str) -> None:
         """
@@ -291,11 +475,7 @@ class SQLManager:
             ValueError: If the table does not have a unique primary key column
                 or has multiple primary key columns.
         """
-        query = f"PRAGMA table_info({table_name})"
-        self.execute_query(query)
-
-        if self.cursor:
-            table_info = self.cursor.fetchall()
+        table_info = self.get_table_info(table_name)
 
         primary_key_columns = [
             column[1] for column in table_info if column[5] == 1
@@ -322,6 +502,7 @@ class SQLManager:
         """
         query = f"DROP TABLE {table_name}"
         self.execute_query(query)
+        self.clear_schema_cache(table_name)
         self.logger.debug(f"SQLite '{table_name}' - deleted.")
 
     def get_table_fields(self, table_name: str) -> Dict[str, str]:
@@ -341,10 +522,9 @@ class SQLManager:
             exc.MissingDataError: If the table fields are not available or
                 the query fails.
         """
-        query = f"PRAGMA table_info('{table_name}')"
-        result = self.execute_query(query, fetch=True)
+        result = self.get_table_info(table_name)
 
-        if result is not None:
+        if result:
             table_fields = {}
             table_fields['labels'] = [row[1] for row in result]
             table_fields['types'] = [row[2] for row in result]
@@ -406,6 +586,7 @@ class SQLManager:
 
         query = f"CREATE TABLE {table_name}({fields_str});"
         self.execute_query(query)
+        self.clear_schema_cache(table_name)
 
         if foreign_keys:
             self.logger.debug(
@@ -435,6 +616,61 @@ class SQLManager:
             self.foreign_keys_enabled = False
             self.logger.debug('Foreign keys disabled.')
 
+    def create_index(
+            self,
+            table_name: str,
+            columns: List[str],
+            index_name: Optional[str] = None,
+    ) -> None:
+        """
+        Creates a (composite) index on the specified columns of a table, if 
+        not already existing.
+
+        Args:
+            table_name (str): The name of the table.
+            columns (List[str]): The columns to be indexed (order matters for 
+                composite indexes).
+            index_name (Optional[str]): The name of the index. Defaults to None,
+                in which case the name is generated from table and columns names.
+
+        Raises:
+            TableNotFoundError: If the specified table does not exist.
+            OperationalError: If no columns are passed, or if there is an 
+                error during query execution.
+        """
+        self.check_table_exists(table_name)
+
+        if not columns:
+            msg = f"No columns passed for indexing table '{table_name}'."
+            self.logger.error(msg)
+            raise exc.OperationalError(msg)
+
+        if index_name is None:
+            index_name = f"{table_name}_{'_'.join(columns)}_index"
+
+        columns_str = ', '.join(f'"{column}"' for column in columns)
+        query = f'CREATE INDEX IF NOT EXISTS "{index_name}" ' \
+            f'ON "{table_name}" ({columns_str})'
+        self.execute_query(query)
+
+        self.logger.debug(
+            f"SQLite table '{table_name}' - index created on columns {columns}.")
+
+    def analyze(self, table_name: Optional[str] = None) -> None:
+        """
+        Gathers statistics about tables and indexes (SQLite 'ANALYZE'), used 
+        by the query planner to choose the best indexes.
+
+        Args:
+            table_name (Optional[str]): The name of the table to be analyzed. 
+                Defaults to None, in which case the whole database is analyzed.
+        """
+        if table_name is None:
+            self.execute_query("ANALYZE")
+        else:
+            self.check_table_exists(table_name)
+            self.execute_query(f'ANALYZE "{table_name}"')
+
     def add_table_column(
             self,
             table_name: str,
@@ -470,6 +706,7 @@ class SQLManager:
                 query += f" DEFAULT {default_value}"
 
             self.execute_query(query, commit=commit)
+            self.clear_schema_cache(table_name)
             self.logger.debug(
                 f"SQLite table '{table_name}' - column '{column_name}' added.")
 
@@ -640,6 +877,119 @@ class SQLManager:
 
         return pd.DataFrame(data=table, columns=table_columns_labels)
 
+    def table_to_arrays(
+            self,
+            table_name: str,
+            columns: Optional[List[str]] = None,
+    ) -> Dict[str, np.ndarray | pd.Categorical]:
+        """
+        Retrieve data from an SQLite table column by column, as typed arrays.
+        Each column is streamed from the database directly into an array 
+        (rows ordered by rowid), without building intermediate lists of rows:
+        - columns with integer affinity are returned as int64 arrays (float64 
+            if they include NULL or non-integer values, in which case 
+            integers above 2**53 lose precision).
+        - columns with real or numeric affinity are returned as float64 arrays.
+        - other columns (coordinates text) are returned as pd.Categorical 
+            (integer codes referring to unique categories).
+        In numeric columns, NULL and non-numeric values are returned as NaN.
+
+        Args:
+            table_name (str): The name of the SQLite table.
+            columns (Optional[List[str]]): The columns to be retrieved. 
+                Defaults to None, in which case all columns are retrieved.
+
+        Returns:
+            Dict[str, np.ndarray | pd.Categorical]: A dictionary with columns 
+                names as keys and related arrays as values. Can be directly 
+                passed to the pd.DataFrame constructor.
+
+        Raises:
+            OperationalError: If the database connection is not initialized.
+            TableNotFoundError: If the specified table does not exist.
+            MissingDataError: If any of the passed columns is not a table field.
+        """
+        if self.connection is None:
+            msg = "Database connection not initialized."
+            self.logger.error(msg)
+            raise exc.OperationalError(msg)
+
+        self.check_table_exists(table_name)
+
+        columns_types = {
+            row[1]: str(row[2]).upper()
+            for row in self.get_table_info(table_name)
+        }
+
+        if columns is None:
+            columns = list(columns_types)
+
+        missing_columns = [col for col in columns if col not in columns_types]
+        if missing_columns:
+            msg = f"Columns {missing_columns} not found in table '{table_name}'."
+            self.logger.error(msg)
+            raise exc.MissingDataError(msg)
+
+        n_rows = self.count_table_data_entries(table_name)
+
+        cursor = self.connection.cursor()
+        cursor.row_factory = lambda _, row: row[0]
+
+        arrays = {}
+
+        try:
+            for column in columns:
+                column_type = columns_types[column]
+
+                integer_column = False
+                if 'INT' in column_type:
+                    cursor.execute(
+                        f'SELECT COUNT(*) FROM "{table_name}" '
+                        f'WHERE typeof("{column}") != \'integer\'')
+                    integer_column = cursor.fetchone() == 0
+
+                if integer_column:
+                    # integers read directly as int64, with no precision 
+                    # loss for values above 2**53
+                    cursor.execute(
+                        f'SELECT "{column}" FROM "{table_name}" '
+                        'ORDER BY rowid')
+                    array = np.fromiter(cursor, dtype=np.int64, count=n_rows)
+
+                elif any(
+                    affinity in column_type
+                    for affinity in ('INT', 'REAL', 'FLOA', 'DOUB', 'NUM')
+                ):
+                    cursor.execute(
+                        f'SELECT CASE WHEN typeof("{column}") IN '
+                        f'(\'integer\', \'real\') THEN "{column}" END '
+                        f'FROM "{table_name}" ORDER BY rowid')
+                    array = np.fromiter(
+                        (np.nan if value is None else value
+                         for value in cursor),
+                        dtype=np.float64,
+                        count=n_rows,
+                    )
+
+                else:
+                    cursor.execute(
+                        f'SELECT "{column}" FROM "{table_name}" '
+                        'ORDER BY rowid')
+                    array = pd.Categorical(
+                        np.fromiter(cursor, dtype=object, count=n_rows))
+
+                arrays[column] = array
+
+        except sqlite3.Error as error:
+            msg = f"Error reading table '{table_name}': {error}."
+            self.logger.error(msg)
+            raise exc.OperationalError(msg) from error
+
+        finally:
+            cursor.close()
+
+        return arrays
+
     def dataframe_to_table(
         self,
         table_name: str,
@@ -647,22 +997,45 @@ class SQLManager:
         operation: str = 'overwrite',
         force_operation: bool = False,
         suppress_warnings: bool = False,
-    ) -> None:
+        chunk_size: Optional[int] = None,
+    ) -> Optional[int]:
         """
-        Converts the contents of a specified SQLite table into a pandas DataFrame.
-        This method fetches all data from the table and structures it as a DataFrame,
-        ensuring that the table exists before proceeding. It logs any issues
-        encountered during the fetch operation.
+        Writes the contents of a pandas DataFrame into a specified SQLite table.
+        With 'overwrite' operation, table entries are erased and replaced by 
+        the dataframe rows. With 'update' operation, the dataframe values are 
+        staged in a temporary table and the 'values' column of the SQLite 
+        table is updated with one join on coordinates columns.
 
         Args:
-            table_name (str): The name of the table to convert to a DataFrame.
+            table_name (str): The name of the SQLite table.
+            dataframe (pd.DataFrame): The DataFrame to be written.
+            operation (str, optional): 'overwrite' or 'update'. Defaults to 
+                'overwrite'.
+            force_operation (bool, optional): If True, table entries are erased 
+                without asking for confirmation. Defaults to False.
+            suppress_warnings (bool, optional): If True, warnings for tables
+                already up to date are suppressed. Defaults to False.
+            chunk_size (Optional[int], optional): Number of rows inserted with
+                each executemany call. Defaults to None, in which case the 
+                '_SQLITE_INSERT_CHUNK_SIZE' constant is used.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the data from the specified table.
+            Optional[int]: The number of table entries written (rows inserted 
+                with 'overwrite' operation, rows whose value changed with 
+                'update' operation, 0 if the table is already up to date), or 
+                None if the operation was not performed because erasing 
+                existing table entries was not confirmed.
+
+        Notes:
+            Dataframe rows are streamed to the database in chunks, without 
+                materializing all rows at once. With 'overwrite' operation, 
+                each chunk is committed separately, unless the method is 
+                called within a batched transaction.
 
         Raises:
             exc.TableNotFoundError: If the specified table does not exist.
-            exc.OperationalError: If there is an error during query execution.
+            exc.OperationalError: If there is an error during query execution, 
+                or if dataframe and table coordinates columns mismatch.
         """
         valid_operations = ['overwrite', 'update', ]
         util.validate_selection(valid_operations, operation)
@@ -692,57 +1065,124 @@ class SQLManager:
                 if not data_erased:
                     self.logger.debug(
                         f"SQLite table '{table_name}' - original data NOT erased.")
-                    return
+                    return None
 
-            data = [tuple(row) for row in dataframe.values.tolist()]
             placeholders = ', '.join(['?'] * len(table_fields))
             query = f"INSERT INTO {table_name} VALUES ({placeholders})"
-            self.execute_query(query=query, params=data, many=True)
+            entries_added = self.execute_many_in_chunks(
+                query=query,
+                params=dataframe.itertuples(index=False, name=None),
+                chunk_size=chunk_size,
+            )
 
             self.logger.debug(
                 f"SQLite table '{table_name}' - table overwritten and "
-                f"{len(data)} entries added.")
+                f"{entries_added} entries added.")
+
+            return entries_added
 
         elif operation == 'update' and num_entries > 0:
 
             values_field = Constants.get('_STD_VALUES_FIELD')['values'][0]
             id_field = Constants.get('_STD_ID_FIELD')['id'][0]
 
-            dataframe_to_update = self.table_to_dataframe(table_name)
-
-            if util.check_dataframes_equality([dataframe_to_update, dataframe]):
-                if not suppress_warnings:
-                    self.logger.warning(
-                        f"SQLite table {table_name} already up to date.")
-                return
+            coordinates_fields = [
+                col for col in dataframe.columns
+                if col not in [id_field, values_field]
+            ]
 
-            if not util.check_dataframe_columns_equality(
-                df_list=[dataframe_to_update, dataframe],
-                skip_columns=[id_field, values_field]
-            ):
+            if set(coordinates_fields) != \
+                    set(table_fields) - {id_field, values_field}:
                 msg = "Sets of the passed dataframe and the SQLite " \
                     f"table '{table_name}' mismatch. SQLite table NOT updated."
                 self.logger.error(msg)
                 raise exc.OperationalError(msg)
 
-            data = [
-                tuple([row[-1], *row[:-1]])
-                for row in dataframe.drop(columns=id_field).values.tolist()
-            ]
+            # new values are staged in a temporary table, then the target
+            # table is updated with one join on coordinates
+            staging_table = f"{table_name}_staging"
+            staging_fields = [*coordinates_fields, values_field]
+            staging_columns = ', '.join(f'"{col}"' for col in staging_fields)
 
-            query = f"""
-                UPDATE {table_name} SET "{values_field}" = ?
-                WHERE {' AND '.join([
-                    f'"{col}" = ?'
-                    for col in
-                    dataframe.drop(columns=[id_field, values_field]).columns
-                ])}
-            """
+            join_conditions = ' AND '.join(
+                f'"{table_name}"."{col}" = staging."{col}"'
+                for col in coordinates_fields
+            )
 
-            self.execute_query(query, data, many=True)
+            try:
+                self.execute_query(
+                    f'DROP TABLE IF EXISTS temp."{staging_table}"')
+                self.execute_query(
+                    f'CREATE TEMP TABLE "{staging_table}" AS '
+                    f'SELECT {staging_columns} FROM "{table_name}" WHERE 0')
+
+                placeholders = ', '.join(['?'] * len(staging_fields))
+                self.execute_many_in_chunks(
+                    query=f'INSERT INTO temp."{staging_table}" '
+                    f'({staging_columns}) VALUES ({placeholders})',
+                    params=dataframe[staging_fields].itertuples(
+                        index=False, name=None),
+                    chunk_size=chunk_size,
+                    commit=False,
+                )
+
+                if coordinates_fields:
+                    coordinates_columns = ', '.join(
+                        f'"{col}"' for col in coordinates_fields)
+                    self.execute_query(
+                        f'CREATE INDEX temp."{staging_table}_coordinates" '
+                        f'ON "{staging_table}" ({coordinates_columns})')
+
+                changed_entries = self.execute_query(
+                    query=f'SELECT COUNT(*) FROM "{table_name}" '
+                    f'JOIN temp."{staging_table}" AS staging '
+                    f'ON {join_conditions or "1"} '
+                    f'WHERE "{table_name}"."{values_field}" '
+                    f'IS NOT staging."{values_field}"',
+                    fetch=True,
+                )[0][0]
+
+                if changed_entries == 0:
+                    if not suppress_warnings:
+                        self.logger.warning(
+                            f"SQLite table {table_name} already up to date.")
+                    return 0
+
+                # 'UPDATE ... FROM' syntax available from SQLite 3.33.0
+                if sqlite3.sqlite_version_info >= (3, 33, 0):
+                    query = f"""
+                        UPDATE "{table_name}"
+                        SET "{values_field}" = staging."{values_field}"
+                        FROM temp."{staging_table}" AS staging
+                        WHERE {join_conditions or "1"}
+                    """
+                else:
+                    query = f"""
+                        UPDATE "{table_name}"
+                        SET "{values_field}" = (
+                            SELECT staging."{values_field}"
+                            FROM temp."{staging_table}" AS staging
+                            WHERE {join_conditions or "1"}
+                        )
+                        WHERE EXISTS (
+                            SELECT 1 FROM temp."{staging_table}" AS staging
+                            WHERE {join_conditions or "1"}
+                        )
+                    """
+
+                self.execute_query(query)
+
+            finally:
+                self.execute_query(
+                    f'DROP TABLE IF EXISTS temp."{staging_table}"')
 
             self.logger.debug(
-                f"SQLite table '{table_name}' - {len(data)} entries updated.")
+                f"SQLite table '{table_name}' - {changed_entries} entries "
+                "updated.")
+
+            return changed_entries
+
+        return None
 
     def table_to_excel(
             self,
@@ -766,26 +1206,48 @@ class SQLManager:
         Returns:
             None
         """
-        self.check_table_exists(table_name)
+        self.tables_to_excel(
+            excel_filename=excel_filename,
+            excel_dir_path=excel_dir_path,
+            tables_names=[table_name],
+        )
+
+    def tables_to_excel(
+            self,
+            excel_filename: str,
+            excel_dir_path: Path | str,
+            tables_names: List[str],
+    ) -> None:
+        """
+        Exports the data from a list of SQLite tables to an Excel file using
+        the configured Excel engine, with one sheet for each table (named as 
+        the table). 
+        All sheets are written within a single Excel writer session, so that 
+        the workbook is loaded (if it already exists) and saved only once, 
+        regardless of the number of tables exported.
+
+        Args:
+            excel_filename (str): The filename for the Excel export.
+            excel_dir_path (Path | str): The directory path where the Excel file
+                will be saved.
+            tables_names (List[str]): The names of the tables whose data are 
+                being exported.
+
+        Returns:
+            None
+
+        Notes:
+            If the Excel file already exists, sheets of exported tables are 
+                replaced while other sheets are preserved.
+        """
+        for table_name in tables_names:
+            self.check_table_exists(table_name)
 
         excel_file_path = Path(excel_dir_path, excel_filename)
 
         mode = 'a' if excel_file_path.exists() else 'w'
         if_sheet_exists = 'replace' if mode == 'a' else None
 
-        if excel_file_path.exists() and if_sheet_exists != 'replace':
-            confirm = input(
-                f"File {excel_filename} already exists. \
-                    Do you want to overwrite it? (y/[n])"
-            )
-            if confirm.lower() != 'y':
-                self.logger.warning(
-                    f"File '{excel_filename}' not overwritten.")
-                return
-
-        self.logger.debug(
-            f"SQLite table '{table_name}' - exported to {excel_filename}.")
-
         with pd.ExcelWriter(
             path=excel_file_path,
             engine=self.xls_engine,
@@ -793,9 +1255,13 @@ class SQLManager:
             if_sheet_exists=if_sheet_exists,
         ) as writer:
 
-            query = f'SELECT * FROM {table_name}'
-            df = pd.read_sql_query(query, self.connection)
-            df.to_excel(writer, sheet_name=table_name, index=False)
+            for table_name in tables_names:
+                query = f'SELECT * FROM {table_name}'
+                df = pd.read_sql_query(query, self.connection)
+                df.to_excel(writer, sheet_name=table_name, index=False)
+
+                self.logger.debug(
+                    f"SQLite table '{table_name}' - exported to {excel_filename}.")
 
     def filtered_table_to_dataframe(
             self,
@@ -978,7 +1444,8 @@ class SQLManager:
             # 1. Check existance of tables in source
             current_tables = self.get_existing_tables_names
             other_db_cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'")
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name NOT LIKE 'sqlite_%'")
             other_tables = [table[0] for table in other_db_cursor.fetchall()]
 
             tables_not_expected = set(current_tables) - set(other_tables)
@@ -1000,8 +1467,7 @@ class SQLManager:
             tables_wrong_structures = []
 
             for table in current_tables:
-                self.cursor.execute(f"PRAGMA table_info({table})")
-                current_table_info = self.cursor.fetchall()
+                current_table_info = self.get_table_info(table)
 
                 other_db_cursor.execute(f"PRAGMA table_info({table})")
                 other_table_info = other_db_cursor.fetchall()
@@ -1019,10 +1485,9 @@ class SQLManager:
             values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
 
             for table in current_tables:
-                self.cursor.execute(f"PRAGMA table_info({table})")
                 coords_columns = [
                     info[1]
-                    for info in self.cursor.fetchall()
+                    for info in self.get_table_info(table)
                     if info[1] != values_header
                 ]
                 columns = ', '.join(coords_columns) if coords_columns else '*'
@@ -1055,42 +1520,36 @@ class SQLManager:
                 raise exc.SettingsError(msg)
 
             tables_wrong_values = {}
+            rounding_digits = Constants.get(
+                '_ROUNDING_DIGITS_RELATIVE_DIFFERENCE_DB')
 
             for table in current_tables:
-                self.cursor.execute(f"PRAGMA table_info({table})")
-                columns = [info[1] for info in self.cursor.fetchall()]
+                columns = [info[1] for info in self.get_table_info(table)]
 
                 if values_header not in columns:
                     continue
 
-                query = f"SELECT \"{values_header}\" FROM \"{table}\""
+                relative_differences = self.get_table_values_difference(
+                    table_name=table,
+                    other_db_connection=other_db_connection,
+                )
 
-                self.cursor.execute(query)
-                current_values = [row[0] for row in self.cursor.fetchall()]
+                wrong_values = relative_differences[
+                    relative_differences > tolerance_percentage]
 
-                other_db_cursor.execute(query)
-                other_values = [row[0] for row in other_db_cursor.fetchall()]
-
-                relative_differences = [
-                    util.calculate_values_difference(
-                        value_1=cv,
-                        value_2=ov,
-                        modules_difference=True,
-                        ignore_nan=True,
-                    )
-                    for cv, ov in zip(current_values, other_values)
-                ]
+                if not wrong_values.empty:
+                    tables_wrong_values[table] = round(
+                        float(np.nanmax(relative_differences)),
+                        rounding_digits)
 
-                rounding_digits = Constants.get(
-                    '_ROUNDING_DIGITS_RELATIVE_DIFFERENCE_DB')
+                    max_logged_ids = Constants.get('_MAX_LOGGED_ROWS_IDS')
+                    logged_ids = wrong_values.index[:max_logged_ids].tolist()
+                    if len(wrong_values) > max_logged_ids:
+                        logged_ids.append('...')
 
-                if any([
-                    rd > tolerance_percentage
-                    for rd in relative_differences
-                    if rd is not None
-                ]):
-                    tables_wrong_values[table] = round(
-                        max(relative_differences), rounding_digits)
+                    self.logger.debug(
+                        f"Table '{table}': {len(wrong_values)} rows exceeding "
+                        f"tolerance (row ids): {logged_ids}")
 
             if tables_wrong_values:
                 msg = "Maximum numerical differences in 'values' column " \
@@ -1149,7 +1608,6 @@ class SQLManager:
             raise exc.ModelFolderError(msg)
 
         other_db_connection = sqlite3.connect(other_db_path)
-        other_db_cursor = other_db_connection.cursor()
 
         self.check_databases_equality(
             other_db_dir_path=other_db_dir_path,
@@ -1157,11 +1615,13 @@ class SQLManager:
             check_values=False,
         )
 
+        existing_tables_names = self.get_existing_tables_names
+
         if tables_names is None:
-            tables_names = self.get_existing_tables_names
+            tables_names = existing_tables_names
         else:
             if not all([
-                table in self.get_existing_tables_names
+                table in existing_tables_names
                 for table in tables_names
             ]):
                 msg = "One or more tables not found in the database."
@@ -1172,35 +1632,83 @@ class SQLManager:
 
         try:
             for table in tables_names:
-                self.cursor.execute(f"SELECT \"values\" FROM \"{table}\"")
-                current_values = [row[0] for row in self.cursor.fetchall()]
-
-                other_db_cursor.execute(f"SELECT \"values\" FROM \"{table}\"")
-                other_values = [row[0] for row in other_db_cursor.fetchall()]
-
-                relative_differences = [
-                    util.calculate_values_difference(
-                        value_1=cv,
-                        value_2=ov,
-                        modules_difference=True,
-                        ignore_nan=True,
-                    )
-                    for cv, ov in zip(current_values, other_values)
-                ]
+                relative_differences = self.get_table_values_difference(
+                    table_name=table,
+                    other_db_connection=other_db_connection,
+                )
 
-                max_relative_difference[table] = max(relative_differences)
+                if relative_differences.isna().all():
+                    max_relative_difference[table] = None
+                else:
+                    max_relative_difference[table] = float(
+                        np.nanmax(relative_differences))
 
             return max_relative_difference
 
         finally:
             other_db_connection.close()
 
+    def get_table_values_difference(
+            self,
+            table_name: str,
+            other_db_connection: sqlite3.Connection,
+    ) -> pd.Series:
+        """
+        Calculates the element-wise relative difference (module) between the 
+        'values' column of a table in the current database and the same table 
+        in another SQLite database. Values are loaded as float arrays (None 
+        values as NaN) and compared in bulk by 'util.calculate_arrays_difference'.
+        Rows are compared by position, so tables are expected to have the same
+        coordinates in the same order.
+
+        Args:
+            table_name (str): The name of the table to compare.
+            other_db_connection (sqlite3.Connection): Connection to the other 
+                SQLite database (reference values).
+
+        Returns:
+            pd.Series: Relative differences indexed by the rows ids of the
+                current table. NaN where at least one of the values is 
+                non-numeric (values stored as text are non-numeric, as in 
+                'util.calculate_values_difference').
+
+        Raises:
+            ValueError: If tables have a different number of rows.
+        """
+        values_header = Constants.get('_STD_VALUES_FIELD')['values'][0]
+        query = f"SELECT rowid, \"{values_header}\" FROM \"{table_name}\""
+
+        current_table = pd.read_sql_query(query, self.connection)
+        other_table = pd.read_sql_query(query, other_db_connection)
+
+        if len(current_table) != len(other_table):
+            msg = f"Table '{table_name}' has a different number of rows in " \
+                "compared databases."
+            self.logger.error(msg)
+            raise ValueError(msg)
+
+        relative_differences = util.calculate_arrays_difference(
+            array_1=current_table[values_header],
+            array_2=other_table[values_header],
+            modules_difference=True,
+            ignore_nan=True,
+        )
+
+        return pd.Series(
+            data=relative_differences,
+            index=current_table.iloc[:, 0].to_numpy(),
+        )
+
 
 @ contextlib.contextmanager
 def db_handler(sql_manager: SQLManager):
     """
     A context manager for handling database connections and providing a cursor
     for database operations using a SQLManager object.
+    Connections are reference counted: nested (or, in case of persistent 
+    connection, repeated) db_handler blocks reuse the already opened 
+    connection, which is closed only when exiting the outermost block (and 
+    only if the SQLManager connection is not persistent).
 
     Args:
         sql_manager (SQLManager): The SQLManager object used for managing
@@ -1213,11 +1721,16 @@ def db_handler(sql_manager: SQLManager):
         sqlite3.Error: Any exceptions raised during connection management or
         during SQL operations are logged and re-raised to be handled externally.
     """
+    sql_manager.connection_users += 1
     try:
-        sql_manager.open_connection()
+        if sql_manager.connection is None:
+            sql_manager.open_connection()
         yield sql_manager.cursor
     except sqlite3.Error as e:
         sql_manager.logger.error(f"Database error: {e}")
         raise
     finally:
-        sql_manager.close_connection()
+        sql_manager.connection_users -= 1
+        if sql_manager.connection_users == 0 and \
+                not sql_manager.persistent_connection:
+            sql_manager.close_connection()
@@ -17,16 +17,18 @@ manipulation and validation.
 """
 
 from collections.abc import Iterable
+import hashlib
 import pprint as pp
 from pathlib import Path
 from typing import Dict, List, Any, Literal, Optional, Tuple
 
-import itertools as it
+import numpy as np
 import pandas as pd
 
 from copy import deepcopy
 from esm.constants import Constants
 from esm.log_exc.logger import Logger
+from esm.support.coordinates_grid import CoordinatesGrid
 from esm.support.file_manager import FileManager
 
 
@@ -311,6 +313,11 @@ def unpivot_dict_to_dataframe(
     Returns:
         pd.DataFrame: A DataFrame resulting from the cartesian product of 
             dictionary values.
+
+    Notes:
+        The cartesian product is generated through a CoordinatesGrid, 
+            building each column directly from per-dimension codes instead of 
+            materializing the product as a list of tuples.
     """
     if key_order and all([isinstance(item, List) for item in key_order]):
         key_order = [item[0] for item in key_order]
@@ -328,14 +335,9 @@ def unpivot_dict_to_dataframe(
         data_dict_to_unpivot = data_dict
         key_order = list(data_dict_to_unpivot.keys())
 
-    cartesian_product = list(it.product(*data_dict_to_unpivot.values()))
-
-    unpivoted_data_dict = pd.DataFrame(
-        data=cartesian_product,
-        columns=key_order,
-    )
+    coordinates_grid = CoordinatesGrid(data_dict_to_unpivot)
 
-    return unpivoted_data_dict
+    return coordinates_grid.to_dataframe()
 
 
 def add_item_to_dict(
@@ -680,14 +682,11 @@ def filter_dataframe(
 
     # optionally reorder rows based on filter_dict values
     if reorder_rows_based_on_filter:
-        df_order = unpivot_dict_to_dataframe(filter_dict)
-        sort_key = pd.Series(
-            range(len(df_order)),
-            index=pd.MultiIndex.from_frame(df_order)
-        )
-        filtered_df['sort_key'] = filtered_df.set_index(
-            list(filter_dict.keys())
-        ).index.map(sort_key.get)
+        # rows positions in the cartesian product of filter_dict values
+        coordinates_grid = CoordinatesGrid(filter_dict)
+        filtered_df['sort_key'] = coordinates_grid.locate({
+            key: filtered_df[key] for key in filter_dict.keys()
+        })
         filtered_df.sort_values('sort_key', inplace=True)
         filtered_df.drop(columns='sort_key', inplace=True)
 
@@ -794,6 +793,31 @@ def find_non_allowed_types(
     return dataframe.loc[non_allowed_rows, target_col_header].tolist()
 
 
+def dataframe_hash(dataframe: pd.DataFrame) -> str:
+    """
+    Computes a hash digest of the content of a DataFrame (columns labels and 
+    values, row order included, index excluded), to detect changes of data.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame to hash.
+
+    Returns:
+        str: The SHA-256 hex digest of the DataFrame content.
+
+    Raises:
+        ValueError: If dataframe is not a DataFrame.
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise ValueError("Passed 'dataframe' argument must be a DataFrame.")
+
+    digest = hashlib.sha256()
+    digest.update(repr(list(dataframe.columns)).encode())
+    digest.update(
+        pd.util.hash_pandas_object(dataframe, index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
 def find_dict_keys_corresponding_to_value(
         dictionary: Dict[Any, Any],
         target_value: Any,
@@ -871,3 +895,80 @@ def calculate_values_difference(
 
     else:
         return difference
+
+
+def calculate_arrays_difference(
+        array_1: Iterable[Any],
+        array_2: Iterable[Any],
+        relative_difference: bool = True,
+        modules_difference: bool = False,
+        ignore_nan: bool = False,
+) -> np.ndarray:
+    """
+    Calculate the element-wise difference between two arrays of values. 
+    Vectorized version of 'calculate_values_difference', with the same rules
+    for zero differences and zero reference values, and for non-numeric 
+    values (values not of numeric type, including numeric strings).
+
+    Parameters:
+        array_1 (Iterable[Any]): The first array of values.
+        array_2 (Iterable[Any]): The second array of values (reference).
+        relative_difference (bool): If True, calculate the relative difference. 
+            Default is True.
+        modules_difference (bool): If True, calculate the module of difference 
+            (either absolute or relative). Default is False.
+        ignore_nan (bool): If True, ignore non-numeric values. 
+            Default is False.
+
+    Returns:
+        np.ndarray: The calculated differences (float array). Where at least 
+            one of the values is non-numeric and ignore_nan is True, the 
+            difference is NaN.
+
+    Raises:
+        ValueError: If arrays have different lengths, or if non-numeric values
+            are passed and ignore_nan is False.
+    """
+    def to_float_array(array: Iterable[Any]) -> np.ndarray:
+        series = pd.Series(
+            array if isinstance(array, pd.Series | np.ndarray)
+            else list(array)
+        )
+        if pd.api.types.is_numeric_dtype(series):
+            return series.to_numpy(dtype=float)
+
+        # only values of numeric type are numeric (no strings conversion)
+        numeric = series.map(
+            lambda value: isinstance(value, float | int | np.number))
+        return series.where(numeric).to_numpy(dtype=float)
+
+    values_1, values_2 = [
+        to_float_array(array) for array in (array_1, array_2)
+    ]
+
+    if values_1.shape != values_2.shape:
+        raise ValueError("Passed arrays must have the same length.")
+
+    non_numeric = np.isnan(values_1) | np.isnan(values_2)
+
+    if non_numeric.any() and not ignore_nan:
+        raise ValueError("Passed values must be of numeric type.")
+
+    if modules_difference:
+        difference = np.abs(values_1 - values_2)
+        reference = np.abs(values_2)
+    else:
+        difference = values_1 - values_2
+        reference = values_2
+
+    if not relative_difference:
+        return difference
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = difference / reference
+
+    result[difference == 0] = 0
+    result[(reference == 0) & (difference != 0)] = float('inf')
+    result[non_numeric] = np.nan
+
+    return result
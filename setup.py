@@ -10,6 +10,9 @@ setup(
         'openpyxl',
         'pytest',
     ],
+    extras_require={
+        'parquet': ['pyarrow'],
+    },
     author='Matteo V. Rocco',
     author_email='matteovincenzo.rocco@polimi.it',
     description='...',
@@ -0,0 +1,761 @@
+"""
+test_models_settings.py
+
+@author: Matteo V. Rocco
+@institution: Politecnico di Milano
+
+This module contains tests for optional Model settings that must not change
+model results or that rely on files generated alongside the model. Each test
+works on a copy of a test model in a temporary directory, so that test models
+are never modified.
+"""
+import shutil
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from esm import Model
+from esm.constants import Constants
+from esm.log_exc import exceptions as exc
+from esm.backend.core import Core
+from esm.backend.problem import Problem
+from esm.support import util
+from esm.support.sql_manager import db_handler
+
+
+models_dir_path = Path(__file__).parent
+
+# test models as (models group directory, model directory)
+linear_model = ('linear', '4_infra_year_timeslices')
+integrated_model = ('integrated', '1_coupled_model')
+multiple_problems_model = ('features', 'multiple_problems')
+refreshable_models = [
+    ('linear', '1_operation'),
+    ('features', 'variables_filtering'),
+    multiple_problems_model,
+]
+not_refreshable_model = ('linear', '2b_planning_discounting')
+
+
+def copy_test_model(tmp_path: Path, test_model: Tuple[str, str]) -> Path:
+    """
+    Copies a test model to a temporary directory, returning the model 
+    directory path (the model directory name is the one of the test model).
+    """
+    model_dir_path = tmp_path / test_model[1]
+    shutil.copytree(models_dir_path.joinpath(*test_model), model_dir_path)
+    return model_dir_path
+
+
+def build_model(model_dir_path: Path, **settings) -> Model:
+    """
+    Generates the Model of the test model copy with the passed settings, 
+    relying on existing data.
+    """
+    return Model(
+        model_dir_name=model_dir_path.name,
+        main_dir_path=model_dir_path.parent,
+        log_level='error',
+        use_existing_data=True,
+        **settings,
+    )
+
+
+def solve_model(
+        model_dir_path: Path,
+        run_kwargs: Optional[Dict[str, Any]] = None,
+        **settings,
+) -> Model:
+    """
+    Solves the test model with the passed settings (and run_model arguments), 
+    exporting results to the SQLite database, and returns the solved Model.
+    """
+    model = build_model(model_dir_path, **settings)
+    model.update_database_and_problem(force_overwrite=True)
+    model.initialize_problems(force_overwrite=True)
+    model.run_model(force_overwrite=True, **(run_kwargs or {}))
+    model.load_results_to_database()
+
+    return model
+
+
+def fetch_data_tables(
+        model: Model,
+        exogenous: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Returns the endogenous (or exogenous) data tables of the model, as 
+    stored in the SQLite database.
+    """
+    sqltools = model.core.sqltools
+    sqltools.open_connection()
+    tables = {
+        table_key: sqltools.table_to_dataframe(table_key)
+        for table_key, table in model.core.index.data.items()
+        if table.type != 'constant' and
+        (table.type == 'exogenous') == exogenous
+    }
+    sqltools.close_connection()
+
+    return tables
+
+
+def run_model_and_fetch_results(model: Model) -> Dict[str, pd.DataFrame]:
+    """
+    Runs the (already initialized) model and exports its results to the 
+    SQLite database, returning the endogenous data tables.
+    """
+    model.run_model(force_overwrite=True)
+    model.load_results_to_database()
+    return fetch_data_tables(model)
+
+
+def scale_input_data(model_dir_path: Path, factor: float) -> None:
+    """
+    Scales all values of the input data Excel files of the test model copy.
+    """
+    for file_path in (model_dir_path / 'input_data').glob('*.xlsx'):
+        sheets = pd.read_excel(file_path, sheet_name=None)
+
+        with pd.ExcelWriter(file_path) as writer:
+            for sheet_name, dataframe in sheets.items():
+                dataframe['values'] = dataframe['values'] * factor
+                dataframe.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def count_constraints_atoms(model: Model) -> Tuple[int, int]:
+    """
+    Returns the number of constraints and of cvxpy atoms (expression tree 
+    nodes) in the numerical problems of the model.
+    """
+    def count_atoms(expression) -> int:
+        return 1 + sum(count_atoms(arg) for arg in expression.args)
+
+    constraints_header = Constants.get('_CONSTRAINTS_HEADER')
+    problems = model.core.problem.numerical_problems
+    if not isinstance(problems, dict):
+        problems = {None: problems}
+
+    constraints = [
+        constraint
+        for problems_df in problems.values()
+        for problem_constraints in problems_df[constraints_header]
+        for constraint in problem_constraints
+    ]
+
+    return len(constraints), sum(count_atoms(c) for c in constraints)
+
+
+def assert_results_equal(
+        results: Dict[str, pd.DataFrame],
+        results_other: Dict[str, pd.DataFrame],
+) -> None:
+    """
+    Asserts that two sets of model results have the same tables, with the 
+    same coordinates and numerically equal values.
+    """
+    assert results
+    assert results.keys() == results_other.keys()
+
+    for table_key, table in results.items():
+        table_other = results_other[table_key]
+
+        assert table.drop(columns='values').equals(
+            table_other.drop(columns='values'))
+        assert np.allclose(
+            table['values'].astype(float),
+            table_other['values'].astype(float),
+            atol=1e-6,
+            equal_nan=True,
+        )
+
+
+def test_stacked_expressions(tmp_path: Path):
+    """
+    Test that stacking element-wise expressions over intra-problem set values
+    reduces the number of constraints and cvxpy atoms, giving the same results
+    of the model with one constraint for each intra-problem set value.
+    """
+    model_dir_path = copy_test_model(tmp_path, linear_model)
+
+    constraints, atoms = count_constraints_atoms(build_model(model_dir_path))
+    constraints_stacked, atoms_stacked = count_constraints_atoms(
+        build_model(model_dir_path, stacked_expressions=True))
+
+    assert constraints_stacked < constraints
+    assert atoms_stacked < atoms
+
+    results = fetch_data_tables(solve_model(model_dir_path))
+    results_stacked = fetch_data_tables(
+        solve_model(model_dir_path, stacked_expressions=True))
+
+    assert_results_equal(results, results_stacked)
+
+
+def test_persist_each_iteration(tmp_path: Path, monkeypatch):
+    """
+    Test that, solving integrated problems with 'persist_each_iteration', 
+    endogenous data are exported to the database at each iteration, with the 
+    same final results of the model exporting data once after convergence.
+    """
+    exports = []
+    export_data = Core.cvxpy_endogenous_data_to_database
+
+    def count_exports(self, *args, **kwargs):
+        exports.append(kwargs.get('operation'))
+        return export_data(self, *args, **kwargs)
+
+    monkeypatch.setattr(Core, 'cvxpy_endogenous_data_to_database', count_exports)
+
+    model_dir_path = copy_test_model(tmp_path, integrated_model)
+
+    results = fetch_data_tables(solve_model(
+        model_dir_path,
+        run_kwargs={'integrated_problems': True},
+    ))
+    exports_single = len(exports)
+    exports.clear()
+
+    results_persisted = fetch_data_tables(solve_model(
+        model_dir_path,
+        run_kwargs={
+            'integrated_problems': True,
+            'persist_each_iteration': True,
+        },
+    ))
+
+    assert exports_single == 2
+    assert len(exports) > exports_single
+    assert_results_equal(results, results_persisted)
+
+
+def test_parquet_input_data(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that exogenous data exported to Parquet input data files and loaded
+    back to the database are the same data loaded from Excel input data files,
+    and that existing Parquet files are overwritten without prompt if forced.
+    """
+    pytest.importorskip('pyarrow')
+
+    model_dir_path = copy_test_model(tmp_path, linear_model)
+    model_settings = {
+        'model_dir_name': model_dir_path.name,
+        'main_dir_path': model_dir_path.parent,
+        'log_level': 'error',
+        'use_existing_data': True,
+    }
+
+    model = Model(**model_settings)
+    model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite', force_overwrite=True)
+    data_excel = fetch_data_tables(model, exogenous=True)
+
+    model = Model(**model_settings, input_data_format='parquet')
+    model.core.database.generate_blank_data_input_files()
+
+    # existing files overwritten without prompt
+    monkeypatch.setattr(
+        'builtins.input',
+        lambda *args: pytest.fail("Unexpected overwrite prompt."))
+    model.core.database.generate_blank_data_input_files(force_overwrite=True)
+
+    for table_key in data_excel:
+        assert (model_dir_path / 'input_data' / f'{table_key}.parquet').exists()
+
+    # data erased from database, to be loaded from Parquet files only
+    sqltools = model.core.sqltools
+    with db_handler(sqltools):
+        for table_key in data_excel:
+            sqltools.execute_query(f'UPDATE {table_key} SET "values" = NULL')
+
+    model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite', force_overwrite=True)
+
+    assert_results_equal(data_excel, fetch_data_tables(model, exogenous=True))
+
+
+def test_input_data_manifest_not_confirmed(tmp_path: Path, monkeypatch):
+    """
+    Test that, with 'input_data_manifest', tables whose data are not written 
+    to the database (erasing existing entries not confirmed) are not recorded 
+    in the manifest, and are loaded again at the next call.
+    """
+    model_dir_path = copy_test_model(tmp_path, linear_model)
+    model = Model(
+        model_dir_name=model_dir_path.name,
+        main_dir_path=model_dir_path.parent,
+        log_level='error',
+        use_existing_data=True,
+        input_data_manifest=True,
+    )
+    exogenous_tables = list(fetch_data_tables(model, exogenous=True))
+
+    monkeypatch.setattr('builtins.input', lambda *args: 'n')
+    assert model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite') == []
+
+    monkeypatch.setattr('builtins.input', lambda *args: 'y')
+    assert model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite') == exogenous_tables
+
+    # input data unchanged: no tables loaded
+    assert model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite') == []
+
+
+def test_input_data_manifest_after_results_export(tmp_path: Path):
+    """
+    Test that, with 'input_data_manifest', tables loaded from input files 
+    and overwritten by the export of model results (coupling tables) are 
+    loaded again at the next call, restoring their input data.
+    """
+    model_dir_path = copy_test_model(tmp_path, integrated_model)
+    model = build_model(model_dir_path, input_data_manifest=True)
+    model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite', force_overwrite=True)
+
+    coupling_tables = [
+        table_key for table_key, table in model.core.index.data.items()
+        if isinstance(table.type, dict)
+    ]
+    assert coupling_tables
+
+    def fetch_coupling_tables(model: Model) -> Dict[str, pd.DataFrame]:
+        sqltools = model.core.sqltools
+        with db_handler(sqltools):
+            return {
+                table_key: sqltools.table_to_dataframe(table_key)
+                for table_key in coupling_tables
+            }
+
+    input_data = fetch_coupling_tables(model)
+
+    model = solve_model(
+        model_dir_path, {'integrated_problems': True},
+        input_data_manifest=True)
+    results = fetch_coupling_tables(model)
+    assert any(
+        not input_data[table_key].equals(results[table_key])
+        for table_key in coupling_tables
+    )
+
+    updated_tables = model.load_exogenous_data_to_sqlite_database(
+        operation='overwrite', force_overwrite=True)
+
+    assert set(coupling_tables) <= set(updated_tables)
+    assert_results_equal(input_data, fetch_coupling_tables(model))
+
+
+def test_index_snapshot(tmp_path: Path):
+    """
+    Test that the Index state is restored from the Index snapshot as long as
+    source files are unchanged, and that it is rebuilt (and a new snapshot is
+    saved) after a setup file is edited.
+    """
+    model_dir_path = copy_test_model(tmp_path, linear_model)
+
+    def index_from_model() -> Any:
+        model = Model(
+            model_dir_name=model_dir_path.name,
+            main_dir_path=model_dir_path.parent,
+            log_level='error',
+            use_existing_data=True,
+            index_snapshot=True,
+        )
+        return model.core.index
+
+    index = index_from_model()
+    assert not index.restored_from_snapshot
+
+    index_restored = index_from_model()
+    assert index_restored.restored_from_snapshot
+    assert index_restored.sets.keys() == index.sets.keys()
+    assert index_restored.data.keys() == index.data.keys()
+
+    with open(model_dir_path / 'structure_variables.yml', 'a') as file:
+        file.write('\n# setup file edited\n')
+
+    index_rebuilt = index_from_model()
+    assert not index_rebuilt.restored_from_snapshot
+    assert index_rebuilt.data.keys() == index.data.keys()
+
+    for set_key, set_table in index_rebuilt.sets.items():
+        assert set_table.data.equals(index.sets[set_key].data)
+
+    assert index_from_model().restored_from_snapshot
+
+
+@pytest.mark.parametrize('test_model, run_kwargs', [
+    (multiple_problems_model, {}),
+    (integrated_model, {'integrated_problems': True}),
+])
+def test_max_workers(
+        tmp_path: Path,
+        test_model: Tuple[str, str],
+        run_kwargs: Dict[str, Any],
+):
+    """
+    Test that solving problems concurrently gives the same problems status 
+    and results of the serial solution.
+    """
+    model_dir_path = copy_test_model(tmp_path, test_model)
+
+    model = solve_model(model_dir_path, {**run_kwargs, 'max_workers': 1})
+    status = model.core.problem.problem_status
+    results = fetch_data_tables(model)
+
+    model_concurrent = solve_model(
+        model_dir_path, {**run_kwargs, 'max_workers': 3})
+
+    assert model_concurrent.core.problem.problem_status == status
+    assert_results_equal(results, fetch_data_tables(model_concurrent))
+
+
+@pytest.mark.parametrize('max_workers', [0, -1, 1.5])
+def test_max_workers_not_valid(tmp_path: Path, max_workers: Any):
+    """
+    Test that running the model with a maximum number of workers that is 
+    not a positive integer raises a SettingsError.
+    """
+    model = build_model(copy_test_model(tmp_path, multiple_problems_model))
+
+    with pytest.raises(exc.SettingsError):
+        model.run_model(max_workers=max_workers)
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 3])
+def test_read_data_input_files_order(tmp_path: Path, max_workers: Any):
+    """
+    Test that input data files read serially or concurrently are yielded in
+    the same order of tables keys, even if readings end in a different order.
+    """
+    model = build_model(
+        copy_test_model(tmp_path, linear_model),
+        input_files_max_workers=max_workers,
+    )
+    tables_keys = [f'table_{num}' for num in range(10)]
+
+    def read_file(table_key: str) -> pd.DataFrame:
+        # first tables take longer to be read
+        time.sleep(0.002 * (len(tables_keys) - tables_keys.index(table_key)))
+        return pd.DataFrame({'table': [table_key]})
+
+    data = list(model.core.database.read_data_input_files(
+        tables_keys, read_file))
+
+    assert [table_key for table_key, _ in data] == tables_keys
+    assert all(
+        dataframe['table'].tolist() == [table_key]
+        for table_key, dataframe in data
+    )
+
+
+@pytest.mark.parametrize('max_workers', [None, 2])
+def test_read_data_input_files_exception(tmp_path: Path, max_workers: Any):
+    """
+    Test that an exception raised while reading an input data file reaches 
+    the caller when data of the related table are consumed, after data of 
+    previous tables have been yielded.
+    """
+    model = build_model(
+        copy_test_model(tmp_path, linear_model),
+        input_files_max_workers=max_workers,
+    )
+    tables_keys = [f'table_{num}' for num in range(6)]
+
+    def read_file(table_key: str) -> pd.DataFrame:
+        if table_key == 'table_3':
+            raise exc.MissingDataError(f"Error reading '{table_key}'.")
+        return pd.DataFrame({'table': [table_key]})
+
+    consumed = []
+    with pytest.raises(exc.MissingDataError, match='table_3'):
+        for table_key, _ in model.core.database.read_data_input_files(
+                tables_keys, read_file):
+            consumed.append(table_key)
+
+    assert consumed == tables_keys[:3]
+
+
+def test_read_data_input_files_early_stop(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Test that, if data consumption stops early, no more input data files are
+    submitted for reading and pending readings are cancelled.
+    """
+    max_workers = 2
+    model = build_model(
+        copy_test_model(tmp_path, linear_model),
+        input_files_max_workers=max_workers,
+    )
+    tables_keys = [f'table_{num}' for num in range(20)]
+
+    submitted: Dict[str, Future] = {}
+    tables_read = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            future = super().submit(fn, *args, **kwargs)
+            submitted[args[0]] = future
+            return future
+
+    monkeypatch.setattr(
+        'esm.backend.database.ThreadPoolExecutor', RecordingExecutor)
+
+    def read_file(table_key: str) -> pd.DataFrame:
+        tables_read.append(table_key)
+        if table_key != tables_keys[0]:
+            time.sleep(0.05)
+        return pd.DataFrame({'table': [table_key]})
+
+    data = model.core.database.read_data_input_files(tables_keys, read_file)
+    assert next(data)[0] == tables_keys[0]
+    data.close()
+
+    # files read ahead of consumption limited to twice the workers
+    assert list(submitted) == tables_keys[:2 * max_workers]
+    assert set(tables_read) <= set(submitted)
+    assert any(future.cancelled() for future in submitted.values())
+    assert all(
+        future.cancelled() or table_key in tables_read
+        for table_key, future in submitted.items()
+    )
+
+
+@pytest.mark.parametrize('max_workers', [0, -1, 1.5])
+def test_input_files_max_workers_not_valid(tmp_path: Path, max_workers: Any):
+    """
+    Test that generating the model with a maximum number of workers reading
+    input data files that is not a positive integer raises a SettingsError.
+    """
+    with pytest.raises(exc.SettingsError):
+        build_model(
+            copy_test_model(tmp_path, linear_model),
+            input_files_max_workers=max_workers,
+        )
+
+
+@pytest.mark.parametrize('test_model', refreshable_models)
+def test_update_problems_refreshed(tmp_path: Path, test_model: Tuple[str, str]):
+    """
+    Test that, after changing input data, reloading exogenous data into the
+    existing numerical problems gives the same problems status and results 
+    of numerical problems generated again from scratch.
+    """
+    model_dir_path = copy_test_model(tmp_path, test_model)
+    model = build_model(model_dir_path)
+    numerical_problems = model.core.problem.numerical_problems
+
+    assert model.core.problem.numerical_problems_refreshable
+    results = run_model_and_fetch_results(model)
+
+    scale_input_data(model_dir_path, factor=1.1)
+    model.update_database_and_problem(force_overwrite=True)
+
+    assert model.core.problem.numerical_problems is numerical_problems
+    results_refreshed = run_model_and_fetch_results(model)
+    status_refreshed = dict(model.core.problem.problem_status)
+
+    with pytest.raises(AssertionError):
+        assert_results_equal(results, results_refreshed)
+
+    model.update_database_and_problem(
+        force_overwrite=True, rebuild_problems=True)
+
+    assert model.core.problem.numerical_problems is not numerical_problems
+    results_rebuilt = run_model_and_fetch_results(model)
+
+    assert model.core.problem.problem_status == status_refreshed
+    assert_results_equal(results_refreshed, results_rebuilt)
+
+
+def test_update_problems_not_refreshable(tmp_path: Path):
+    """
+    Test that numerical problems including operators generating new 
+    parameters are generated again after changing input data, giving the 
+    same results of a new model generated with the changed input data.
+    """
+    model_dir_path = copy_test_model(tmp_path, not_refreshable_model)
+    model = build_model(model_dir_path)
+    numerical_problems = model.core.problem.numerical_problems
+
+    assert not model.core.problem.numerical_problems_refreshable
+
+    scale_input_data(model_dir_path, factor=1.1)
+    model.update_database_and_problem(force_overwrite=True)
+
+    assert model.core.problem.numerical_problems is not numerical_problems
+    results = run_model_and_fetch_results(model)
+
+    assert_results_equal(
+        results, fetch_data_tables(solve_model(model_dir_path)))
+
+
+@pytest.mark.parametrize('warm_start', [True, False])
+def test_integrated_problems_iterations(
+        tmp_path: Path,
+        monkeypatch,
+        warm_start: bool,
+):
+    """
+    Test that, solving integrated problems, problems are warm started from 
+    the second iteration (unless warm start is disabled), with the same 
+    results, and that between iterations only exogenous variables of 
+    coupling tables are refreshed.
+    """
+    warm_starts = []
+    refreshed_tables = []
+    solve_problems = Problem.solve_problems
+    data_to_exogenous_vars = Core.data_to_cvxpy_exogenous_vars
+
+    def record_solve(self, *args, **kwargs):
+        warm_starts.append(kwargs.get('warm_start'))
+        return solve_problems(self, *args, **kwargs)
+
+    def record_refresh(self, tables_names=None, tables_data=None):
+        if tables_data is not None:
+            refreshed_tables.append(tables_names)
+        return data_to_exogenous_vars(self, tables_names, tables_data)
+
+    monkeypatch.setattr(Problem, 'solve_problems', record_solve)
+    monkeypatch.setattr(Core, 'data_to_cvxpy_exogenous_vars', record_refresh)
+
+    model_dir_path = copy_test_model(tmp_path, integrated_model)
+    run_kwargs = {'integrated_problems': True}
+
+    results = fetch_data_tables(solve_model(model_dir_path, run_kwargs))
+    assert warm_starts[0] is False
+    assert all(warm_starts[1:])
+    warm_starts.clear()
+
+    model = solve_model(model_dir_path, {**run_kwargs, 'warm_start': warm_start})
+    assert len(warm_starts) > 1
+    assert warm_starts[0] is False
+    assert all(item == warm_start for item in warm_starts[1:])
+
+    coupling_tables = [
+        table_key for table_key, table in model.core.index.data.items()
+        if isinstance(table.type, dict)
+    ]
+    assert coupling_tables
+    assert refreshed_tables
+    assert all(
+        tables_names and set(tables_names) <= set(coupling_tables)
+        for tables_names in refreshed_tables
+    )
+
+    assert_results_equal(results, fetch_data_tables(model))
+
+
+@pytest.mark.parametrize('coordinates_index', [True, ['techs', 'Years'], False])
+def test_sqlite_coordinates_index(tmp_path: Path, coordinates_index: Any):
+    """
+    Test that data tables of a new SQLite database are generated with a 
+    composite index on the coordinates columns selected by the 
+    'sqlite_coordinates_index' setting (no index if False), and that database
+    statistics are updated once tables are filled.
+    """
+    model_dir_path = copy_test_model(tmp_path, ('linear', '1_operation'))
+    model = build_model(
+        model_dir_path, sqlite_coordinates_index=coordinates_index)
+
+    (model_dir_path / 'database.db').unlink()
+    model.core.database.create_blank_sqlite_database()
+    model.core.database.load_sets_to_sqlite_database()
+    model.core.database.generate_blank_sqlite_data_tables()
+    model.core.database.sets_data_to_sql_data_tables()
+
+    connection = sqlite3.connect(model_dir_path / 'database.db')
+
+    try:
+        for table_key, table in model.core.index.data.items():
+            if table.type == 'constant':
+                continue
+
+            index_name = f"{table_key}_coordinates_index"
+            indexes = [
+                row[1] for row in
+                connection.execute(f'PRAGMA index_list("{table_key}")')
+            ]
+            expected_columns = [
+                table.coordinates_headers[coordinate]
+                for coordinate in table.coordinates
+                if coordinates_index is True
+                or (coordinates_index and coordinate in coordinates_index)
+            ]
+
+            if not expected_columns:
+                assert index_name not in indexes
+                continue
+
+            assert index_name in indexes
+            assert [
+                row[2] for row in
+                connection.execute(f'PRAGMA index_info("{index_name}")')
+            ] == expected_columns
+
+        analyzed_tables = connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchall()
+        assert analyzed_tables == [('sqlite_stat1',)]
+
+    finally:
+        connection.close()
+
+
+def test_sets_data_to_sql_data_tables_streamed(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Test that coordinates of data tables streamed in chunks into a new SQLite
+    database match the cartesian product of the tables coordinates values, 
+    with rows ids assigned in the same order.
+    """
+    model_dir_path = copy_test_model(tmp_path, ('linear', '1_operation'))
+    model = build_model(model_dir_path)
+
+    # small chunks to split each table in several insert batches
+    monkeypatch.setattr(Constants, '_SQLITE_INSERT_CHUNK_SIZE', 7)
+
+    (model_dir_path / 'database.db').unlink()
+    model.core.database.create_blank_sqlite_database()
+    model.core.database.load_sets_to_sqlite_database()
+    model.core.database.generate_blank_sqlite_data_tables()
+    model.core.database.sets_data_to_sql_data_tables()
+
+    id_field = Constants.get('_STD_ID_FIELD')['id'][0]
+    connection = sqlite3.connect(model_dir_path / 'database.db')
+
+    try:
+        for table_key, table in model.core.index.data.items():
+            if table.type == 'constant':
+                continue
+
+            table_headers_list = list(table.coordinates_headers.values())
+            expected = util.unpivot_dict_to_dataframe(
+                data_dict=table.coordinates_values,
+                key_order=table_headers_list,
+            )
+            expected.insert(0, id_field, range(1, len(expected) + 1))
+
+            columns = ', '.join(
+                f'"{col}"' for col in [id_field, *table_headers_list])
+            fetched = pd.read_sql_query(
+                f'SELECT {columns} FROM "{table_key}" ORDER BY "{id_field}"',
+                connection,
+            )
+
+            pd.testing.assert_frame_equal(
+                fetched, expected, check_dtype=False)
+
+    finally:
+        connection.close()
@@ -0,0 +1,108 @@
+import itertools as it
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from esm.support.coordinates_grid import CoordinatesGrid
+
+
+@pytest.fixture
+def coordinates():
+    return {
+        'A': ['a1', 'a2', 'a3'],
+        'B': [1, 2],
+        'C': ['c1', 'c2'],
+    }
+
+
+def test_shape_and_size(coordinates):
+    grid = CoordinatesGrid(coordinates)
+
+    assert grid.shape == (3, 2, 2)
+    assert grid.size == 12
+    assert len(grid) == 12
+
+    assert CoordinatesGrid({}).size == 1
+    assert CoordinatesGrid({'A': ['a1'], 'B': []}).size == 0
+
+
+def test_to_dataframe(coordinates):
+    """
+    Test that the materialized grid matches the cartesian product of
+    coordinates (itertools.product order and dtypes), for the whole grid and
+    for selected positions.
+    """
+    grid = CoordinatesGrid(coordinates)
+    expected = pd.DataFrame(
+        data=list(it.product(*coordinates.values())),
+        columns=list(coordinates.keys()),
+    )
+
+    assert grid.to_dataframe().equals(expected)
+    assert list(grid) == list(expected.itertuples(index=False, name=None))
+
+    positions = np.array([11, 0, 5])
+    assert grid.to_dataframe(positions).equals(
+        expected.iloc[positions].reset_index(drop=True))
+
+    categorical_df = grid.to_dataframe(categorical=True)
+    assert isinstance(categorical_df['A'].dtype, pd.CategoricalDtype)
+    assert list(categorical_df['A'].cat.categories) == coordinates['A']
+    assert categorical_df.astype(object).equals(expected.astype(object))
+
+    empty_grid_df = CoordinatesGrid({}).to_dataframe()
+    assert empty_grid_df.shape == (1, 0)
+
+
+def test_codes_and_positions(coordinates):
+    grid = CoordinatesGrid(coordinates)
+
+    codes = grid.codes(np.array([0, 7, 11]))
+    assert codes['A'].tolist() == [0, 1, 2]
+    assert codes['B'].tolist() == [0, 1, 1]
+    assert codes['C'].tolist() == [0, 1, 1]
+
+    assert grid.positions(codes).tolist() == [0, 7, 11]
+    assert grid.positions(
+        {'A': [0, -1], 'B': [1, 0], 'C': [1, 0]}).tolist() == [3, -1]
+
+    with pytest.raises(ValueError):
+        grid.positions({'A': [0]})
+
+
+def test_locate(coordinates):
+    grid = CoordinatesGrid(coordinates)
+    grid_df = grid.to_dataframe()
+
+    positions = grid.locate({
+        header: grid_df[header] for header in grid.headers
+    })
+    assert positions.tolist() == list(range(grid.size))
+
+    positions = grid.locate({
+        'A': ['a3', 'a4'],
+        'B': [2, 2],
+        'C': ['c1', 'c1'],
+    })
+    assert positions.tolist() == [10, -1]
+
+
+def test_to_dataframe_shared_dtypes(coordinates):
+    """
+    Test that columns are materialized with passed categorical dtypes, also
+    when dimension items are a subset of (or not ordered as) the categories.
+    """
+    dtype_a = pd.CategoricalDtype(['a0', 'a3', 'a2', 'a1'])
+    grid = CoordinatesGrid(coordinates)
+
+    grid_df = grid.to_dataframe(dtypes={'A': dtype_a})
+
+    assert grid_df['A'].dtype == dtype_a
+    assert grid_df['B'].dtype == np.int64
+    assert grid_df['A'].astype(object).equals(
+        grid.to_dataframe()['A'].astype(object))
+
+    outer_grid_df = CoordinatesGrid({'A': ['a1', 'a9']}).to_dataframe(
+        dtypes={'A': dtype_a})
+    assert outer_grid_df['A'].isna().tolist() == [False, True]
@@ -0,0 +1,368 @@
+"""
+test_sql_manager.py
+
+@author: Matteo V. Rocco
+@institution: Politecnico di Milano
+
+This module contains tests for the SQLManager class in the
+'esm.support.sql_manager' module, run on in-memory SQLite databases.
+"""
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from esm.constants import Constants
+from esm.log_exc import exceptions as exc
+from esm.log_exc.logger import Logger
+from esm.support.sql_manager import SQLManager, db_handler
+
+
+TABLE_FIELDS = {
+    **Constants.get('_STD_ID_FIELD'),
+    'techs': ['techs_Names', 'TEXT'],
+    'years': ['years_Names', 'TEXT'],
+}
+VALUES_FIELD = Constants.get('_STD_VALUES_FIELD')['values']
+
+
+@pytest.fixture
+def sql_manager():
+    """
+    SQLManager connected to an in-memory database, with a 'data' table
+    filled with four entries.
+    """
+    manager = SQLManager(
+        logger=Logger('test_sql_manager', 'ERROR'),
+        database_path=':memory:',
+        database_name='test_database',
+    )
+    manager.open_connection()
+    manager.create_table('data', TABLE_FIELDS)
+    manager.add_table_column('data', *VALUES_FIELD)
+    manager.dataframe_to_table(
+        table_name='data',
+        dataframe=pd.DataFrame({
+            'techs_Names': ['t1', 't1', 't2', 't2'],
+            'years_Names': ['y1', 'y2', 'y1', 'y2'],
+            'values': [1.0, 2.0, 3.0, 4.0],
+        }),
+    )
+
+    yield manager
+
+    if manager.connection is not None:
+        manager.close_connection()
+
+
+def table_values(manager: SQLManager) -> dict:
+    """Returns the table values by (techs, years) coordinates."""
+    rows = manager.execute_query(
+        'SELECT techs_Names, years_Names, "values" FROM data',
+        fetch=True,
+    )
+    return {(tech, year): value for tech, year, value in rows}
+
+
+@pytest.mark.parametrize('sqlite_version', [None, (3, 32, 0)])
+def test_dataframe_to_table_update(sql_manager, monkeypatch, sqlite_version):
+    """
+    Test that the 'update' operation updates values of the rows matched on
+    coordinates (also with rows passed in a different order and without id),
+    returning the number of changed rows, both with 'UPDATE ... FROM' syntax
+    and with the fallback for SQLite versions older than 3.33.0.
+    """
+    if sqlite_version is not None:
+        monkeypatch.setattr(sqlite3, 'sqlite_version_info', sqlite_version)
+
+    changed_entries = sql_manager.dataframe_to_table(
+        table_name='data',
+        dataframe=pd.DataFrame({
+            'techs_Names': ['t2', 't1', 't1'],
+            'years_Names': ['y2', 'y2', 'y1'],
+            'values': [40.0, 20.0, 1.0],
+        }),
+        operation='update',
+    )
+
+    assert changed_entries == 2
+    assert table_values(sql_manager) == {
+        ('t1', 'y1'): 1.0,
+        ('t1', 'y2'): 20.0,
+        ('t2', 'y1'): 3.0,
+        ('t2', 'y2'): 40.0,
+    }
+
+    # no changes: table already up to date
+    assert sql_manager.dataframe_to_table(
+        table_name='data',
+        dataframe=pd.DataFrame({
+            'techs_Names': ['t1'],
+            'years_Names': ['y2'],
+            'values': [20.0],
+        }),
+        operation='update',
+        suppress_warnings=True,
+    ) == 0
+
+    # staging table removed
+    assert 'data_staging' not in [
+        row[0] for row in sql_manager.execute_query(
+            "SELECT name FROM sqlite_temp_master WHERE type = 'table'",
+            fetch=True,
+        )
+    ]
+
+
+def test_transaction(sql_manager):
+    """
+    Test that queries executed within a transaction are not committed one by
+    one, that the transaction is committed when exiting the (outermost)
+    context, and that it is rolled back in case of errors.
+    """
+    insert_query = 'INSERT INTO data (techs_Names, years_Names, "values") ' \
+        'VALUES (?, ?, ?)'
+
+    with sql_manager.transaction():
+        sql_manager.execute_query(insert_query, ('t3', 'y1', 5.0))
+        assert sql_manager.batch_transaction
+        assert sql_manager.connection.in_transaction
+
+        with sql_manager.transaction():
+            sql_manager.execute_query(insert_query, ('t3', 'y2', 6.0))
+
+        # nested transaction not committed
+        assert sql_manager.connection.in_transaction
+
+    assert not sql_manager.batch_transaction
+    assert not sql_manager.connection.in_transaction
+    assert sql_manager.count_table_data_entries('data') == 6
+
+    with pytest.raises(ValueError):
+        with sql_manager.transaction():
+            sql_manager.execute_query(insert_query, ('t4', 'y1', 7.0))
+            sql_manager.execute_query('UPDATE data SET "values" = 0')
+            raise ValueError('error within transaction')
+
+    assert not sql_manager.batch_transaction
+    assert sql_manager.count_table_data_entries('data') == 6
+    assert table_values(sql_manager)[('t1', 'y1')] == 1.0
+
+    # outside transactions, each query is committed
+    sql_manager.execute_query(insert_query, ('t4', 'y1', 7.0))
+    assert not sql_manager.connection.in_transaction
+
+
+@pytest.mark.parametrize('persistent_connection', [False, True])
+def test_db_handler_reference_counting(tmp_path, persistent_connection):
+    """
+    Test that nested db_handler blocks share the connection opened by the
+    outermost one, which is closed only when exiting the outermost block
+    (also in case of errors), unless the connection is persistent.
+    """
+    manager = SQLManager(
+        logger=Logger('test_sql_manager', 'ERROR'),
+        database_path=tmp_path / 'database.db',
+        database_name='database.db',
+        persistent_connection=persistent_connection,
+    )
+
+    with db_handler(manager):
+        connection = manager.connection
+        assert connection is not None
+
+        with db_handler(manager):
+            assert manager.connection is connection
+            assert manager.connection_users == 2
+
+        assert manager.connection is connection
+        assert manager.connection_users == 1
+
+        with pytest.raises(ValueError):
+            with db_handler(manager):
+                raise ValueError('error within nested handler')
+
+        assert manager.connection is connection
+
+    assert manager.connection_users == 0
+
+    if persistent_connection:
+        assert manager.connection is connection
+
+        with db_handler(manager):
+            assert manager.connection is connection
+
+        manager.close_connection()
+    else:
+        assert manager.connection is None
+
+
+def test_schema_cache_invalidation(sql_manager):
+    """
+    Test that the cached database schema (tables names and tables info) is
+    refreshed after tables are created, altered or dropped, and after a
+    rolled back transaction altering the schema.
+    """
+    assert sql_manager.get_existing_tables_names == ['data']
+    assert 'data' in sql_manager.schema_cache['tables_info']
+
+    sql_manager.create_table('other', TABLE_FIELDS)
+    assert sorted(sql_manager.get_existing_tables_names) == ['data', 'other']
+    assert sql_manager.get_table_fields('other')['labels'] == \
+        ['id', 'techs_Names', 'years_Names']
+
+    sql_manager.add_table_column('other', 'extra', 'TEXT')
+    assert sql_manager.get_table_fields('other')['labels'][-1] == 'extra'
+
+    sql_manager.drop_table('other')
+    assert sql_manager.get_existing_tables_names == ['data']
+    assert sql_manager.get_table_info('other') == []
+
+    # schema altered within a transaction, then rolled back
+    with pytest.raises(ValueError):
+        with sql_manager.transaction():
+            sql_manager.execute_query(
+                'INSERT INTO data (techs_Names, years_Names, "values") '
+                'VALUES (?, ?, ?)', ('t3', 'y1', 5.0))
+            sql_manager.add_table_column('data', 'extra', 'TEXT')
+            assert 'extra' in sql_manager.get_table_fields('data')['labels']
+            raise ValueError('error within transaction')
+
+    assert 'extra' not in sql_manager.get_table_fields('data')['labels']
+
+    # cache cleared explicitly after schema changes outside SQLManager
+    assert sql_manager.get_existing_tables_names == ['data']
+    sql_manager.connection.execute('CREATE TABLE external (id INTEGER)')
+    assert 'external' not in sql_manager.get_existing_tables_names
+    sql_manager.clear_schema_cache()
+    assert 'external' in sql_manager.get_existing_tables_names
+
+
+def test_table_to_arrays(sql_manager):
+    """
+    Test that table columns are returned as typed arrays, with integer
+    columns read as int64 without precision loss (also above 2**53), and
+    read as float64 only if they include NULL values.
+    """
+    big_integer = 2**53 + 1
+    sql_manager.add_table_column('data', 'counts', 'INTEGER')
+    sql_manager.execute_query('UPDATE data SET counts = ?', (big_integer,))
+
+    arrays = sql_manager.table_to_arrays('data')
+
+    assert arrays['id'].dtype == np.int64
+    assert arrays['counts'].dtype == np.int64
+    assert (arrays['counts'] == big_integer).all()
+    assert arrays['values'].dtype == np.float64
+    assert list(arrays['values']) == [1.0, 2.0, 3.0, 4.0]
+    assert isinstance(arrays['techs_Names'], pd.Categorical)
+    assert list(arrays['techs_Names']) == ['t1', 't1', 't2', 't2']
+
+    sql_manager.execute_query(
+        "UPDATE data SET counts = NULL WHERE techs_Names = 't2'")
+    counts = sql_manager.table_to_arrays('data', columns=['counts'])['counts']
+
+    assert counts.dtype == np.float64
+    assert np.isnan(counts[2:]).all()
+
+
+def test_tables_to_excel(sql_manager, tmp_path):
+    """
+    Test that tables exported to one workbook in a single writing session 
+    give the same sheets of tables exported one by one, and that exporting
+    again a table to an existing workbook replaces its sheet only.
+    """
+    sql_manager.create_table('other', TABLE_FIELDS)
+    sql_manager.add_table_column('other', *VALUES_FIELD)
+    sql_manager.dataframe_to_table(
+        table_name='other',
+        dataframe=pd.DataFrame({
+            'techs_Names': ['t3'],
+            'years_Names': ['y3'],
+            'values': [5.0],
+        }),
+    )
+    tables_names = ['data', 'other']
+
+    sql_manager.tables_to_excel(
+        excel_filename='tables.xlsx',
+        excel_dir_path=tmp_path,
+        tables_names=tables_names,
+    )
+    for table_name in tables_names:
+        sql_manager.table_to_excel(
+            excel_filename=f'{table_name}.xlsx',
+            excel_dir_path=tmp_path,
+            table_name=table_name,
+        )
+
+    sheets = pd.read_excel(tmp_path / 'tables.xlsx', sheet_name=None)
+
+    assert list(sheets) == tables_names
+    for table_name in tables_names:
+        expected = pd.read_excel(
+            tmp_path / f'{table_name}.xlsx', sheet_name=None)
+        assert list(expected) == [table_name]
+        pd.testing.assert_frame_equal(sheets[table_name], expected[table_name])
+
+    sql_manager.execute_query('UPDATE data SET "values" = "values" * 10')
+    sql_manager.tables_to_excel(
+        excel_filename='tables.xlsx',
+        excel_dir_path=tmp_path,
+        tables_names=['data'],
+    )
+
+    updated_sheets = pd.read_excel(tmp_path / 'tables.xlsx', sheet_name=None)
+
+    assert sorted(updated_sheets) == sorted(tables_names)
+    assert updated_sheets['data']['values'].tolist() == [10.0, 20.0, 30.0, 40.0]
+    pd.testing.assert_frame_equal(updated_sheets['other'], sheets['other'])
+
+
+def test_check_databases_equality_values(tmp_path, monkeypatch):
+    """
+    Test that values exceeding tolerance are reported by table, logging the 
+    number of rows exceeding tolerance and only the first rows ids.
+    """
+    n_rows = 25
+
+    for database_name, factor in [('current.db', 2.0), ('expected.db', 1.0)]:
+        manager = SQLManager(
+            logger=Logger('test_sql_manager', 'ERROR'),
+            database_path=tmp_path / database_name,
+            database_name=database_name,
+        )
+        with db_handler(manager):
+            manager.create_table('data', TABLE_FIELDS)
+            manager.add_table_column('data', *VALUES_FIELD)
+            manager.dataframe_to_table(
+                table_name='data',
+                dataframe=pd.DataFrame({
+                    'techs_Names': [f't{i}' for i in range(n_rows)],
+                    'years_Names': ['y1'] * n_rows,
+                    'values': [factor * (i + 1) for i in range(n_rows)],
+                }),
+            )
+
+    manager = SQLManager(
+        logger=Logger('test_sql_manager', 'ERROR'),
+        database_path=tmp_path / 'current.db',
+        database_name='current.db',
+    )
+    debug_messages = []
+    monkeypatch.setattr(manager.logger, 'debug', debug_messages.append)
+
+    with db_handler(manager):
+        with pytest.raises(exc.ResultsError, match="'data': 1.0"):
+            manager.check_databases_equality(
+                other_db_dir_path=tmp_path,
+                other_db_name='expected.db',
+                tolerance_percentage=0.02,
+            )
+
+    max_logged_ids = Constants.get('_MAX_LOGGED_ROWS_IDS')
+    logged_ids = list(range(1, max_logged_ids + 1)) + ['...']
+
+    assert f"Table 'data': {n_rows} rows exceeding tolerance (row ids): " \
+        f"{logged_ids}" in debug_messages
@@ -11,6 +11,8 @@ This module contains tests for the functions in the 'esm.support.util' module.
 import pytest
 import pprint
 
+import numpy as np
+
 from esm.support.util import *
 
 
@@ -706,6 +708,30 @@ def test_find_non_allowed_types():
         )
 
 
+def test_dataframe_hash():
+    """
+    Test the dataframe_hash function.
+    This function tests that the hash of a DataFrame depends on its columns
+    and values (and on rows order), and not on its index.
+    """
+    df = pd.DataFrame({'A': ['a', 'b', 'c'], 'values': [1.0, 2.0, None]})
+
+    assert dataframe_hash(df) == dataframe_hash(df.copy())
+    assert dataframe_hash(df) == dataframe_hash(df.set_index(df.index + 5))
+
+    df_changed = df.copy()
+    df_changed.loc[1, 'values'] = 3.0
+    assert dataframe_hash(df) != dataframe_hash(df_changed)
+
+    assert dataframe_hash(df) != dataframe_hash(
+        df.rename(columns={'A': 'B'}))
+    assert dataframe_hash(df) != dataframe_hash(
+        df.iloc[::-1].reset_index(drop=True))
+
+    with pytest.raises(ValueError):
+        dataframe_hash('not a dataframe')
+
+
 def test_find_dict_key_corresponding_to_value():
     """
     Test the function find_dict_key_corresponding_to_value.
@@ -769,3 +795,45 @@ def test_calulate_values_difference():
         calculate_values_difference(10, 'a', True, False, False)
     with pytest.raises(ValueError):
         calculate_values_difference('a', 'b', True, False, False)
+
+
+def test_calculate_arrays_difference():
+    # Test relative difference (same results as calculate_values_difference)
+    np.testing.assert_array_equal(
+        calculate_arrays_difference([10, 5, 0, 10, 3], [5, 10, 10, 0, 3]),
+        [1.0, -0.5, -1.0, float('inf'), 0])
+
+    # Test absolute difference
+    np.testing.assert_array_equal(
+        calculate_arrays_difference([10, 5, 0, 10], [5, 10, 10, 0], False),
+        [5, -5, -10, 10])
+
+    # Test module of difference
+    np.testing.assert_array_equal(
+        calculate_arrays_difference(
+            [10, 5, 0, 10], [5, 10, 10, 0], False, True),
+        [5, 5, 10, 10])
+    np.testing.assert_array_equal(
+        calculate_arrays_difference([5, -10], [10, -5], True, True),
+        [0.5, 1.0])
+
+    # Test with non-numeric and None values
+    np.testing.assert_array_equal(
+        calculate_arrays_difference(
+            ['a', 10, None, 2], [10, None, None, 1], ignore_nan=True),
+        [np.nan, np.nan, np.nan, 1.0])
+
+    # Test numeric strings are non-numeric (as in calculate_values_difference)
+    np.testing.assert_array_equal(
+        calculate_arrays_difference(['10', 10], [5, 5], ignore_nan=True),
+        [np.nan, 1.0])
+    with pytest.raises(ValueError):
+        calculate_arrays_difference(['10'], [5])
+
+    # Test ValueError when ignore_nan is False or lengths are different
+    with pytest.raises(ValueError):
+        calculate_arrays_difference(['a', 1], [10, 1])
+    with pytest.raises(ValueError):
+        calculate_arrays_difference([None], [10])
+    with pytest.raises(ValueError):
+        calculate_arrays_difference([1, 2], [1])